@@ -1,77 +1,108 @@
 """
 Dependencies for FastAPI application.
 This module contains all the dependencies used in the application routes.
+
+Repositories and services are created once by the app lifespan and held by the
+ServiceContainer on `app.state.container`; the dependencies only look them up.
 """
 
-from fastapi import Header, HTTPException, status
+from fastapi import Header, HTTPException, Request, status
 from typing import Optional
 
+from app.core.container import ServiceContainer
 from app.services.smart_contract_service import SmartContractService
 from app.services.automaton_contract_service import AutomatonContractService
 from app.services.package_service import PackageService
+from app.services.deploy_job_service import DeployJobService
 
 from app.repositories.smart_contract_repository import SmartContractRepository
 from app.repositories.automaton_contract_repository import AutomatonContractRepository
 from app.repositories.package_repository import PackageRepository
+from app.utils.history_tracker import HistoryTracker
+
+def get_container(request: Request) -> ServiceContainer:
+    """
+    Dependency for obtaining the application's ServiceContainer.
+    
+    Returns:
+        ServiceContainer: Container created by the app lifespan
+    """
+    return request.app.state.container
 
 # Repository dependencies
-def get_smart_contract_repository() -> SmartContractRepository:
+def get_smart_contract_repository(request: Request) -> SmartContractRepository:
     """
-    Dependency for obtaining a SmartContractRepository instance.
+    Dependency for obtaining the SmartContractRepository instance.
     
     Returns:
         SmartContractRepository: Repository for deployed smart contracts
     """
-    return SmartContractRepository()
+    return get_container(request).smart_contract_repository
 
-def get_automaton_contract_repository() -> AutomatonContractRepository:
+def get_automaton_contract_repository(request: Request) -> AutomatonContractRepository:
     """
-    Dependency for obtaining a AutomatonContractRepository instance.
+    Dependency for obtaining the AutomatonContractRepository instance.
+    The SQLite implementation is used when REPOSITORY_BACKEND is "sqlite".
     
     Returns:
         AutomatonContractRepository: Repository for automaton contracts
     """
-    return AutomatonContractRepository()
+    return get_container(request).automaton_contract_repository
 
-def get_package_repository() -> PackageRepository:
+def get_package_repository(request: Request) -> PackageRepository:
     """
-    Dependency for obtaining a PackageRepository instance.
+    Dependency for obtaining the PackageRepository instance.
     
     Returns:
         PackageRepository: Repository for packages
     """
-    return PackageRepository()
+    return get_container(request).package_repository
 
 # Service dependencies
-def get_smart_contract_service() -> SmartContractService:
+def get_smart_contract_service(request: Request) -> SmartContractService:
     """
-    Dependency for obtaining a SmartContractService instance.
+    Dependency for obtaining the SmartContractService instance.
     
     Returns:
         SmartContractService: Service for managing deployed smart contracts
     """
-    repository = get_smart_contract_repository()
-    return SmartContractService(repository=repository)
+    return get_container(request).smart_contract_service
+
+def get_deploy_job_service(request: Request) -> DeployJobService:
+    """
+    Dependency for obtaining the DeployJobService instance.
+    
+    Returns:
+        DeployJobService: Service running deployments in the background
+    """
+    return get_container(request).deploy_job_service
 
-def get_automaton_contract_service() -> AutomatonContractService:
+def get_automaton_contract_service(request: Request) -> AutomatonContractService:
     """
-    Dependency for obtaining a AutomatonContractService instance.
+    Dependency for obtaining the AutomatonContractService instance.
     
     Returns:
         AutomatonContractService: Service for managing automaton contracts
     """
-    repository = get_automaton_contract_repository()
-    return AutomatonContractService(repository=repository)
+    return get_container(request).automaton_contract_service
 
-def get_package_service() -> PackageService:
+def get_package_service(request: Request) -> PackageService:
     """
-    Dependency for obtaining a PackageService instance.
+    Dependency for obtaining the PackageService instance.
     
     Returns:
         PackageService: Service for managing packages
     """
-    repository = get_package_repository()
-    return PackageService(repository=repository)
+    return get_container(request).package_service
+
+def get_history_tracker(request: Request) -> HistoryTracker:
+    """
+    Dependency for obtaining the HistoryTracker instance.
+    
+    Returns:
+        HistoryTracker: Tracker of the contract histories shared by the services
+    """
+    return get_container(request).history_tracker
 
 # User dependencies
 async def get_current_user(x_user_id: Optional[str] = Header(None)) -> Optional[str]:
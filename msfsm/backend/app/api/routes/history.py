@@ -0,0 +1,62 @@
+# app/api/routes/history.py
+from fastapi import APIRouter, Depends, Query
+from typing import Dict, Any, Optional
+
+from app.api.dependencies import get_history_tracker
+from app.auth.api.dependencies import get_current_user
+from app.auth.schemas.user import User
+from app.core.exceptions import EntityNotFoundException
+from app.utils.history_tracker import HistoryTracker
+
+router = APIRouter(prefix="/history", tags=["History"])
+
+# Maximum number of events returned by one request
+MAX_HISTORY_PAGE_SIZE = 1000
+
+
+def _check_contract_id(contract_id: str) -> None:
+    """Reject contract ids that are not a single history directory name."""
+    if contract_id in (".", "..") or "/" in contract_id or "\\" in contract_id:
+        raise EntityNotFoundException(contract_id)
+
+@router.get(
+    "/{contract_id}",
+    summary="Get a page of the history of a contract",
+    response_description="Events of the contract, oldest first, and the cursor of the next page"
+)
+def get_contract_history(
+    contract_id: str,
+    cursor: int = Query(0, ge=0, description="Sequence number of the first event to return"),
+    limit: int = Query(100, ge=1, le=MAX_HISTORY_PAGE_SIZE, description="Maximum number of events to return"),
+    user: User = Depends(get_current_user),
+    history_tracker: HistoryTracker = Depends(get_history_tracker)
+) -> Dict[str, Any]:
+    """
+    Get the events of an automaton contract or a deployed smart contract, oldest first.
+    
+    Pass the returned `next_cursor` as `cursor` to get the next page; it is null
+    once a page has fewer than `limit` events. This endpoint requires authentication.
+    """
+    _check_contract_id(contract_id)
+    events = history_tracker.get_contract_history(contract_id, cursor=cursor, limit=limit)
+    next_cursor = events[-1]["seq"] + 1 if len(events) == limit else None
+    return {"events": events, "next_cursor": next_cursor}
+
+@router.get(
+    "/{contract_id}/tail",
+    summary="Get the most recent events of a contract",
+    response_description="Most recent events of the contract, oldest first"
+)
+def get_contract_history_tail(
+    contract_id: str,
+    count: int = Query(20, ge=1, le=MAX_HISTORY_PAGE_SIZE, description="Number of events to return"),
+    user: User = Depends(get_current_user),
+    history_tracker: HistoryTracker = Depends(get_history_tracker)
+) -> Dict[str, Any]:
+    """
+    Get the last `count` events of an automaton contract or a deployed smart contract.
+    
+    This endpoint requires authentication.
+    """
+    _check_contract_id(contract_id)
+    return {"events": history_tracker.get_contract_history_tail(contract_id, count)}
@@ -0,0 +1,27 @@
+# app/api/routes/metrics.py
+from fastapi import APIRouter, Depends
+from typing import Dict, Any
+
+from app.auth.api.dependencies import get_admin_user
+from app.auth.schemas.user import User
+from app.utils.history_tracker import get_history_writer
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+@router.get(
+    "/history",
+    summary="Get the metrics of the background history writer",
+    response_description="Queue depth and flush latency of the history writer"
+)
+def get_history_metrics(
+    user: User = Depends(get_admin_user)
+) -> Dict[str, Any]:
+    """
+    Get the queue depth and flush statistics of the background history writer.
+    
+    This endpoint requires admin access.
+    """
+    writer = get_history_writer()
+    if writer is None:
+        return {"running": False}
+    return writer.metrics()
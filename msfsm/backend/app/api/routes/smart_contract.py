@@ -1,12 +1,19 @@
 # app/api/routes/smart_contract.py
+import asyncio
+import json
+
 from fastapi import APIRouter, Depends, status, Query
+from fastapi.responses import StreamingResponse
 from typing import Dict, List, Any, Optional
 
 from msfsm.common.specification import SpecificationModel
 
 from app.services.smart_contract_service import SmartContractService
-from app.schemas.smart_contract import ExecutionRequest, ExecutionResult
-from app.api.dependencies import get_smart_contract_service
+from app.core.config import settings
+from app.core.exceptions import DeployJobNotFoundException
+from app.services.deploy_job_service import DeployJobService
+from app.schemas.smart_contract import DeployJob, ExecutionRequest, ExecutionResult
+from app.api.dependencies import get_smart_contract_service, get_deploy_job_service
 from app.auth.api.dependencies import get_current_user
 from app.auth.schemas.user import User
 
@@ -15,21 +22,82 @@ router = APIRouter(prefix="/smart-contracts", tags=["Smart Contracts"])
 @router.post(
     "/deploy",
     summary="Deploy smart contract(s) from a finite state machine specification",
-    response_description="The deployed smart contract(s)",
-    status_code=status.HTTP_201_CREATED
+    response_description="The deploy job to follow",
+    status_code=status.HTTP_202_ACCEPTED
 )
 def deploy_smart_contract(
     specification: SpecificationModel,
     user: User = Depends(get_current_user),
-    service: SmartContractService = Depends(get_smart_contract_service)
-) -> Dict[str, Any]:
+    service: SmartContractService = Depends(get_smart_contract_service),
+    jobs: DeployJobService = Depends(get_deploy_job_service)
+) -> DeployJob:
     """
     Create, compile and deploy smart contract(s) following multi-scale
     finite state machine specification of a contract.
     
+    The deployment runs in the background: the returned job can be followed with
+    `GET /smart-contracts/jobs/{job_id}` or `GET /smart-contracts/jobs/{job_id}/events`.
+    
     This endpoint requires authentication.
     """
-    return service.deploy_contract(specification, user.email)
+    return jobs.submit(specification, service, user.email)
+
+@router.get(
+    "/jobs/{job_id}",
+    summary="Get the progress of a deploy job",
+    response_description="The deploy job with the stage reached by each automaton"
+)
+def get_deploy_job(
+    job_id: str,
+    user: User = Depends(get_current_user),
+    jobs: DeployJobService = Depends(get_deploy_job_service)
+) -> DeployJob:
+    """
+    Get the status of a deploy job, the stage reached by each automaton
+    (generated, compiled, sent, mined) and the deployed contract once completed.
+    
+    This endpoint requires authentication.
+    """
+    return jobs.get_job(job_id)
+
+@router.get(
+    "/jobs/{job_id}/events",
+    summary="Stream the progress of a deploy job",
+    response_description="Server-Sent Events stream of the deploy job progress"
+)
+async def stream_deploy_job_events(
+    job_id: str,
+    user: User = Depends(get_current_user),
+    jobs: DeployJobService = Depends(get_deploy_job_service)
+) -> StreamingResponse:
+    """
+    Stream the progress of a deploy job as Server-Sent Events.
+    The stream ends once the job is completed or failed, or with an `error`
+    event if the job is forgotten while the stream is open.
+    
+    This endpoint requires authentication.
+    """
+    # Fail with 404 before the stream starts
+    jobs.get_job(job_id)
+
+    async def event_stream():
+        index = 0
+        while True:
+            try:
+                events, finished = jobs.get_events(job_id, index)
+            except DeployJobNotFoundException as e:
+                # The job was pruned, the response has already started
+                yield f"event: error\ndata: {json.dumps({'type': 'error', **e.detail})}\n\n"
+                break
+            for event in events:
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+            index += len(events)
+
+            if finished:
+                break
+            await asyncio.sleep(settings.DEPLOY_JOB_EVENTS_INTERVAL)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 @router.get(
     "/{contract_name}",
@@ -64,6 +132,24 @@ def get_all_smart_contracts(
     """
     return service.get_all_deployed_contracts()
 
+@router.get(
+    "/{contract_name}/status",
+    summary="Get the status of every automaton of a deployed smart contract",
+    response_description="Current state and completion of each automaton"
+)
+def get_smart_contract_status(
+    contract_name: str,
+    user: User = Depends(get_current_user),
+    service: SmartContractService = Depends(get_smart_contract_service)
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Read `get_current_state` and `is_completed` of every automaton of the deployed
+    smart contract with a single aggregated call to the blockchain.
+    
+    This endpoint requires authentication.
+    """
+    return service.get_contract_status(contract_name)
+
 @router.delete(
     "/{contract_name}",
     summary="Delete a deployed smart contract file",
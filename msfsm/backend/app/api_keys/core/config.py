@@ -14,6 +14,14 @@ class APIKeySettings(BaseModel):
     MASTER_KEY_NAME: str = os.getenv("MASTER_KEY_NAME", "pk_master_admin")
     DEFAULT_LABEL: str = os.getenv("DEFAULT_LABEL", "Unnamed API Key")
     DEFAULT_ADMIN_APP: str = os.getenv("DEFAULT_ADMIN_APP", "Initial Admin Key")
+    # Seconds between two checks of the keys file for changes
+    API_KEYS_RELOAD_INTERVAL: float = float(os.getenv("API_KEYS_RELOAD_INTERVAL", "1"))
+    # Seconds between two writes of the usage counts to the keys file
+    API_KEYS_USAGE_FLUSH_INTERVAL: float = float(os.getenv("API_KEYS_USAGE_FLUSH_INTERVAL", "5"))
+    # Requests per second allowed for keys without their own rate limit (0 disables the limit)
+    API_KEYS_DEFAULT_RATE_LIMIT: float = float(os.getenv("API_KEYS_DEFAULT_RATE_LIMIT", "0"))
+    # Burst size for keys without their own burst (defaults to one second of requests)
+    API_KEYS_DEFAULT_RATE_BURST: int = int(os.getenv("API_KEYS_DEFAULT_RATE_BURST", "0"))
 
 app_env = os.getenv("APP_ENV", "dev")
 env_file = f".env.{app_env}"
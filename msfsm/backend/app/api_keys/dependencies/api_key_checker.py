@@ -1,27 +1,9 @@
-import json
+import math
+
 from fastapi import Request, HTTPException
 from app.api_keys.enums.error_codes import ApiKeyErrorCode
 from app.api_keys.core.config import api_key_settings
-
-
-def load_api_keys():
-    """
-    Load all API keys from the JSON file.
-    Returns an empty list if the file does not exist.
-    """
-    try:
-        with open(api_key_settings.API_KEYS_FILE, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
-
-
-def save_api_keys(keys: list):
-    """
-    Save the updated list of API keys to the file.
-    """
-    with open(api_key_settings.API_KEYS_FILE, 'w') as f:
-        json.dump(keys, f, indent=4)
+from app.api_keys.repositories.api_key_store import api_key_store
 
 
 def verify_api_key(request: Request):
@@ -31,6 +13,7 @@ def verify_api_key(request: Request):
     Raises:
         401 if header is missing
         403 if key is invalid or inactive
+        429 if the key exceeded its usage limit or its rate limit
 
     Returns:
         The matching API key dictionary
@@ -41,16 +24,24 @@ def verify_api_key(request: Request):
     if not client_key:
         raise HTTPException(status_code=401, detail=ApiKeyErrorCode.MISSING_HEADER)
 
-    keys = load_api_keys()
+    key = api_key_store.get(client_key)
+
+    if key is None:
+        raise HTTPException(status_code=403, detail=ApiKeyErrorCode.INVALID)
+
+    if not key.get("active", True):
+        raise HTTPException(status_code=403, detail=ApiKeyErrorCode.DISABLED)
+
+    # Counted in memory, written to the file periodically
+    error, retry_after = api_key_store.acquire(client_key)
 
-    for key in keys:
-        if key["key"] == client_key:
-            if not key.get("active", True):
-                raise HTTPException(status_code=403, detail=ApiKeyErrorCode.DISABLED)
-            
-            # Optionally increment usage
-            key["usage_count"] = key.get("usage_count", 0) + 1
-            save_api_keys(keys)
-            return key
+    if error == ApiKeyErrorCode.RATE_LIMITED:
+        raise HTTPException(
+            status_code=429,
+            detail=ApiKeyErrorCode.RATE_LIMITED,
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+    if error is not None:
+        raise HTTPException(status_code=429 if error == ApiKeyErrorCode.QUOTA_EXCEEDED else 403, detail=error)
 
-    raise HTTPException(status_code=403, detail=ApiKeyErrorCode.INVALID)
+    return key
@@ -8,3 +8,5 @@ class ApiKeyErrorCode(str, Enum):
     UNAUTHORIZED = "UNAUTHORIZED_ACCESS"
     MISSING_HEADER = "API_KEY_HEADER_MISSING"
     DISABLED = "API_KEY_DISABLED"
+    RATE_LIMITED = "API_KEY_RATE_LIMITED"
+    QUOTA_EXCEEDED = "API_KEY_QUOTA_EXCEEDED"
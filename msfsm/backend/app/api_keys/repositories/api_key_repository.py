@@ -1,4 +1,6 @@
 import json
+import os
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -8,6 +10,9 @@ from app.api_keys.core.config import api_key_settings
 
 DATA_FILE: Path = api_key_settings.API_KEYS_FILE
 
+# Serializes the read-modify-write cycles of the keys file
+lock = threading.RLock()
+
 
 def load_keys() -> List[Dict[str, Any]]:
     """
@@ -23,9 +28,12 @@ def load_keys() -> List[Dict[str, Any]]:
 def save_keys(keys: List[Dict[str, Any]]) -> None:
     """
     Save the list of API keys to the JSON file.
+    The file is replaced atomically so readers never see a partial write.
     """
-    with DATA_FILE.open("w", encoding="utf-8") as f:
+    tmp_file = DATA_FILE.with_suffix(".tmp")
+    with tmp_file.open("w", encoding="utf-8") as f:
         json.dump(keys, f, indent=4)
+    os.replace(tmp_file, DATA_FILE)
 
 
 def generate_new_key() -> str:
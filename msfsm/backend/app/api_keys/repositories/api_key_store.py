@@ -0,0 +1,250 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.api_keys.core.config import api_key_settings
+from app.api_keys.enums.error_codes import ApiKeyErrorCode
+from app.api_keys.repositories import api_key_repository as repo
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second up to `capacity` tokens.
+    Each request takes one token.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def take(self) -> float:
+        """
+        Take one token.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds to wait for the next one
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def get_rate_limit(key: Dict[str, Any]) -> Optional[Tuple[float, int]]:
+    """
+    Return the rate and burst applying to an API key, or None if it is not rate limited.
+    """
+    rate = key.get("rate_limit") or api_key_settings.API_KEYS_DEFAULT_RATE_LIMIT
+    if not rate:
+        return None
+    burst = key.get("rate_burst") or api_key_settings.API_KEYS_DEFAULT_RATE_BURST or max(1, int(rate))
+    return rate, burst
+
+
+class APIKeyStore:
+    """
+    In-memory index of the API keys, keyed by key value.
+
+    The index is reloaded when the modification time of the keys file changes,
+    which is checked at most every `reload_interval` seconds. Usage counts are
+    accumulated in memory and written back by `flush`, so verifying a key does
+    not touch the file. Rate limits are enforced with one token bucket per key.
+    """
+
+    def __init__(self, reload_interval: float = api_key_settings.API_KEYS_RELOAD_INTERVAL):
+        self.reload_interval = reload_interval
+        self.keys: Dict[str, Dict[str, Any]] = {}
+        self.pending_usage: Dict[str, int] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.mtime: Optional[int] = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def _get_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(repo.DATA_FILE).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _reload_if_changed(self) -> None:
+        """Reload the index if the keys file changed. Must be called with the lock held."""
+        now = time.monotonic()
+        if self.mtime is not None and now - self.checked_at < self.reload_interval:
+            return
+        self.checked_at = now
+
+        mtime = self._get_mtime()
+        if mtime == self.mtime and self.keys:
+            return
+
+        keys = {k["key"]: k for k in repo.load_keys()}
+
+        # Keep the usage not yet written to the file
+        for key_value, count in self.pending_usage.items():
+            if key_value in keys:
+                keys[key_value]["usage_count"] = keys[key_value].get("usage_count", 0) + count
+
+        self.keys = keys
+        self.mtime = mtime
+
+        # Drop the buckets of deleted keys and of keys whose limits changed
+        for key_value, bucket in list(self.buckets.items()):
+            key = keys.get(key_value)
+            if key is None or get_rate_limit(key) != (bucket.rate, bucket.capacity):
+                del self.buckets[key_value]
+
+    def get(self, key_value: str) -> Optional[Dict[str, Any]]:
+        """Return the API key matching a key value, or None."""
+        with self.lock:
+            self._reload_if_changed()
+            return self.keys.get(key_value)
+
+    def record_usage(self, key_value: str) -> None:
+        """Count one use of a key, written to the file by the next flush."""
+        with self.lock:
+            self._record_usage(key_value)
+
+    def _record_usage(self, key_value: str) -> None:
+        key = self.keys.get(key_value)
+        if key is None:
+            return
+        key["usage_count"] = key.get("usage_count", 0) + 1
+        self.pending_usage[key_value] = self.pending_usage.get(key_value, 0) + 1
+
+    def acquire(self, key_value: str) -> Tuple[Optional[ApiKeyErrorCode], float]:
+        """
+        Check the quota and rate limit of a key and count one use if both allow it.
+
+        Args:
+            key_value (str): Value of the API key
+
+        Returns:
+            Tuple[Optional[ApiKeyErrorCode], float]: None and 0 if the use is allowed,
+            otherwise the error code and the seconds to wait before retrying
+            (0 when waiting does not help)
+        """
+        with self.lock:
+            key = self.keys.get(key_value)
+            if key is None:
+                return ApiKeyErrorCode.INVALID, 0.0
+
+            usage_limit = key.get("usage_limit")
+            if usage_limit is not None and key.get("usage_count", 0) >= usage_limit:
+                return ApiKeyErrorCode.QUOTA_EXCEEDED, 0.0
+
+            rate_limit = get_rate_limit(key)
+            if rate_limit is not None:
+                bucket = self.buckets.get(key_value)
+                if bucket is None:
+                    bucket = self.buckets[key_value] = TokenBucket(*rate_limit)
+                retry_after = bucket.take()
+                if retry_after:
+                    return ApiKeyErrorCode.RATE_LIMITED, retry_after
+
+            self._record_usage(key_value)
+            return None, 0.0
+
+    def flush(self) -> int:
+        """
+        Add the pending usage counts to the keys file.
+
+        The counts are kept pending if the file cannot be written, so that the
+        next flush writes them.
+
+        Returns:
+            int: Number of uses written
+        """
+        with self.lock:
+            if not self.pending_usage:
+                return 0
+            pending, self.pending_usage = self.pending_usage, {}
+
+        try:
+            with repo.lock:
+                keys = repo.load_keys()
+                for key in keys:
+                    if key["key"] in pending:
+                        key["usage_count"] = key.get("usage_count", 0) + pending[key["key"]]
+                repo.save_keys(keys)
+        except Exception:
+            # Keep the counts, with the uses recorded since the swap
+            with self.lock:
+                for key_value, count in pending.items():
+                    self.pending_usage[key_value] = self.pending_usage.get(key_value, 0) + count
+            raise
+
+        # The file now holds every count: reload it on next access
+        with self.lock:
+            self.mtime = None
+
+        return sum(pending.values())
+
+    def invalidate(self) -> None:
+        """Force a reload of the index on next access."""
+        with self.lock:
+            self.mtime = None
+            self.checked_at = 0.0
+
+
+api_key_store = APIKeyStore()
+
+
+class UsageFlusher:
+    """Background thread flushing the API key usage counts periodically."""
+
+    def __init__(self, store: APIKeyStore, interval: float):
+        self.store = store
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self._run, name="api-key-usage-flush", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and write the remaining usage counts."""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.store.flush()
+
+    def _run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            try:
+                self.store.flush()
+            except Exception:
+                logger.exception("Failed to write the API key usage counts, retrying later")
+
+
+_usage_flusher: Optional[UsageFlusher] = None
+
+
+def start_usage_flusher() -> None:
+    """Start flushing the API key usage counts in the background."""
+    global _usage_flusher
+
+    if _usage_flusher is None:
+        _usage_flusher = UsageFlusher(api_key_store, api_key_settings.API_KEYS_USAGE_FLUSH_INTERVAL)
+        _usage_flusher.start()
+
+
+def stop_usage_flusher() -> None:
+    """Stop the background flush and write the remaining usage counts."""
+    global _usage_flusher
+
+    if _usage_flusher is not None:
+        _usage_flusher.stop()
+        _usage_flusher = None
+    else:
+        api_key_store.flush()
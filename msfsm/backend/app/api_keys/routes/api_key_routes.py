@@ -47,7 +47,7 @@ def create_key(data: APIKeyCreate, user: User = Depends(require_admin)):
     "/{key}",
     response_model=APIKeyOut,
     summary="Update an API key",
-    description="Updates the label, permissions, or status of an existing API key. Admin access required."
+    description="Updates the label, status, quota or rate limit of an existing API key. Admin access required."
 )
 def update_key(key: str, data: APIKeyUpdate, user: User = Depends(require_admin)):
     """
@@ -8,14 +8,20 @@ class APIKeyBase(BaseModel):
 
 class APIKeyCreate(APIKeyBase):
     usage_limit: Optional[int] = Field(default=None, description="Maximum number of allowed uses")
+    rate_limit: Optional[float] = Field(default=None, gt=0, description="Maximum number of requests per second")
+    rate_burst: Optional[int] = Field(default=None, gt=0, description="Maximum number of requests in a burst")
 
 class APIKeyUpdate(BaseModel):
     app_name: Optional[str] = None
     active: Optional[bool] = None
-    usage_limit: Optional[int] = None
+    usage_limit: Optional[int] = Field(default=None, description="Maximum number of allowed uses, null to remove the limit")
+    rate_limit: Optional[float] = Field(default=None, gt=0, description="Maximum number of requests per second, null to remove the limit")
+    rate_burst: Optional[int] = Field(default=None, gt=0, description="Maximum number of requests in a burst, null to remove the limit")
 
 class APIKeyOut(APIKeyBase):
     key: str = Field(..., example="sk_123456789abcdef")
     created_at: datetime = Field(..., description="Datetime when the API key was created")
     usage_count: int = Field(..., description="Number of times the API key has been used")
     usage_limit: Optional[int] = Field(default=None, description="Maximum number of allowed uses")
+    rate_limit: Optional[float] = Field(default=None, description="Maximum number of requests per second")
+    rate_burst: Optional[int] = Field(default=None, description="Maximum number of requests in a burst")
@@ -11,14 +11,14 @@ from app.auth.schemas.user import User
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 @router.post("/register", summary="Register a new user")
-def register(user_data: UserCreate) -> Dict[str, str]:
+async def register(user_data: UserCreate) -> Dict[str, str]:
     """
     Register a new user with the provided information.
     """
-    return register_user(user_data)
+    return await register_user(user_data)
 
 @router.post("/login", summary="Log in a user")
-def login(
+async def login(
     credentials: UserLogin, 
     response: Response
 ) -> Dict[str, Any]:
@@ -26,7 +26,7 @@ def login(
     Authenticate a user and set authentication cookies.
     Also returns tokens in response body for API clients.
     """
-    return login_user(credentials, response)
+    return await login_user(credentials, response)
 
 @router.post("/refresh", summary="Refresh authentication tokens")
 def refresh(
@@ -25,7 +25,7 @@ def update_me(
     return update_user_profile(user, updates)
 
 @router.post("/change-password", summary="Change user password")
-def change_password(
+async def change_password(
     payload: UserPasswordUpdate,
     user: User = Depends(get_current_user)
 ) -> Dict[str, str]:
@@ -39,7 +39,7 @@ def change_password(
     Returns:
         A success message
     """
-    return change_user_password(user, payload)
+    return await change_user_password(user, payload)
 
 @router.post("/picture", summary="Upload profile picture")
 def upload_picture(
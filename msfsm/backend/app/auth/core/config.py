@@ -25,6 +25,11 @@ class AuthSettings(BaseSettings):
     COOKIE_HTTPONLY: bool = os.getenv("COOKIE_HTTPONLY", "True").lower() in ("true", "1", "t")
     COOKIE_SAMESITE: str = os.getenv("COOKIE_SAMESITE", "lax")
     
+    # Password hashing settings
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    # Processes hashing and verifying passwords outside of the request workers
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+    
     # User profile settings
     PROFILE_PICTURES_DIR: Path = Path(os.getenv("PROFILE_PICTURES_DIR", "data/users/profile"))
     MAX_PROFILE_PIC_SIZE: int = int(os.getenv("MAX_PROFILE_PIC_SIZE", str(2 * 1024 * 1024)))  # 2 MB
@@ -32,6 +37,13 @@ class AuthSettings(BaseSettings):
     
     # User repository
     USERS_FILE: Path = Path(os.getenv("USERS_FILE", "data/users/users.json"))
+    # User storage: "filesystem" (users file) or "sqlite" (users and refresh tokens
+    # in the DATABASE_PATH database, imported from the users file on first use).
+    # Independent of REPOSITORY_BACKEND, which only selects the contract storage
+    USER_STORE_BACKEND: str = os.getenv("USER_STORE_BACKEND", "filesystem")
+    # Users kept in memory by email, and seconds before a cached user is read again
+    USERS_CACHE_SIZE: int = int(os.getenv("USERS_CACHE_SIZE", "1024"))
+    USERS_CACHE_TTL: float = float(os.getenv("USERS_CACHE_TTL", "60"))
     
     # Default Admin credentials
     DEFAULT_ADMIN_EMAIL: str = os.getenv("DEFAULT_ADMIN_EMAIL", "admin@localhost.com")
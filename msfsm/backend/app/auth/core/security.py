@@ -1,8 +1,20 @@
+import asyncio
+import multiprocessing
 import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
 from passlib.context import CryptContext
 
+from app.auth.core.config import auth_settings
+
 # Setup password context with bcrypt for secure password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=auth_settings.BCRYPT_ROUNDS)
+
+_password_pool: Optional[ProcessPoolExecutor] = None
+_password_pool_lock = threading.Lock()
 
 def hash_password(password: str) -> str:
     """
@@ -29,6 +41,90 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     return pwd_context.verify(plain_password, hashed_password)
 
+def get_password_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool running bcrypt, creating it on first use.
+    
+    The pool has PASSWORD_HASH_WORKERS processes, so a burst of logins uses at
+    most that many cores and queues the rest instead of blocking the threads
+    serving the other endpoints.
+    """
+    global _password_pool
+
+    with _password_pool_lock:
+        if _password_pool is None:
+            # Spawn rather than fork: the server process runs background threads
+            _password_pool = ProcessPoolExecutor(
+                max_workers=auth_settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _password_pool
+
+def shutdown_password_pool() -> None:
+    """Stop the password hashing processes if they were started."""
+    global _password_pool
+
+    with _password_pool_lock:
+        if _password_pool is not None:
+            _password_pool.shutdown(wait=True, cancel_futures=True)
+            _password_pool = None
+
+def _discard_password_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so that the next call creates a new one."""
+    global _password_pool
+
+    with _password_pool_lock:
+        if _password_pool is pool:
+            _password_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+async def _run_in_password_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a function in the password process pool.
+    
+    A pool whose worker died (killed by the OOM killer for instance) fails every
+    later call, so it is replaced by a new one and the call is retried once.
+    
+    Args:
+        func: Function to run
+        *args: Arguments of the function
+        
+    Returns:
+        The result of the function
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_password_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _discard_password_pool(pool)
+        return await loop.run_in_executor(get_password_pool(), func, *args)
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the password process pool.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password
+    """
+    return await _run_in_password_pool(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash in the password process pool.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to compare against
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
 def generate_secure_token(length: int = 64) -> str:
     """
     Generate a cryptographically secure random token.
@@ -39,4 +135,4 @@ def generate_secure_token(length: int = 64) -> str:
     Returns:
         URL-safe base64-encoded token string
     """
-    return secrets.token_urlsafe(length)
\ No newline at end of file
+    return secrets.token_urlsafe(length)
@@ -0,0 +1,218 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.auth.core.config import auth_settings
+from app.auth.schemas.user import User
+from app.repositories.sqlite_repository import get_connection
+
+# Fields stored in the refresh_tokens table rather than in the user document
+REFRESH_TOKEN_FIELDS = ("refreshToken", "refreshTokenExpiresAt")
+
+
+class SQLiteUserStore:
+    """
+    User store in the embedded SQLite database, keyed by email.
+
+    Users are stored as JSON documents in the `users` table, and their refresh
+    tokens in the `refresh_tokens` table, so that a login or a token refresh is
+    a single keyed write that does not touch the other users.
+    """
+
+    def __init__(self, database_path: str):
+        """
+        Initialize the store and create its tables.
+
+        The users of the JSON users file are imported when the users table is empty.
+
+        Args:
+            database_path: Path of the SQLite database file
+        """
+        self.connection, self.lock = get_connection(database_path)
+        # Number of writes made through this store, see `get_version`
+        self.write_generation = 0
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS users (email TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS refresh_tokens ("
+                "email TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at TEXT)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_refresh_tokens_token ON refresh_tokens (token)"
+            )
+
+        self._import_users_file()
+
+    def _import_users_file(self) -> None:
+        """Import the users of the JSON users file if the users table is empty."""
+        if not auth_settings.USERS_FILE.exists():
+            return
+
+        with self.lock:
+            if self.connection.execute("SELECT 1 FROM users LIMIT 1").fetchone() is not None:
+                return
+
+        with auth_settings.USERS_FILE.open("r") as f:
+            users = [User(**user) for user in json.load(f)]
+        self.replace_all(users)
+
+    @staticmethod
+    def _to_document(user: User) -> str:
+        return user.model_dump_json(exclude=set(REFRESH_TOKEN_FIELDS))
+
+    @staticmethod
+    def _to_user(data: str, token: Optional[str], expires_at: Optional[str]) -> User:
+        return User(
+            **json.loads(data),
+            refreshToken=token,
+            refreshTokenExpiresAt=datetime.fromisoformat(expires_at) if expires_at else None
+        )
+
+    def _write_refresh_token(self, email: str, token: Optional[str], expires_at: Optional[datetime]) -> None:
+        """Set or remove the refresh token of a user. Must be called in a transaction."""
+        if token is None:
+            self.connection.execute("DELETE FROM refresh_tokens WHERE email = ?", (email,))
+        else:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO refresh_tokens (email, token, expires_at) VALUES (?, ?, ?)",
+                (email, token, expires_at.isoformat() if expires_at else None)
+            )
+
+    def get_all(self) -> List[User]:
+        """
+        Get all users.
+
+        Returns:
+            List of User objects
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT u.data, t.token, t.expires_at FROM users u "
+                "LEFT JOIN refresh_tokens t ON t.email = u.email"
+            ).fetchall()
+        return [self._to_user(*row) for row in rows]
+
+    def get(self, email: str) -> Optional[User]:
+        """
+        Get a user by email.
+
+        Args:
+            email: Email of the user
+
+        Returns:
+            User object if found, None otherwise
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT u.data, t.token, t.expires_at FROM users u "
+                "LEFT JOIN refresh_tokens t ON t.email = u.email WHERE u.email = ?",
+                (email,)
+            ).fetchone()
+        return self._to_user(*row) if row else None
+
+    def add(self, user: User) -> None:
+        """
+        Add a user, replacing any user with the same email.
+
+        Args:
+            user: User object to add
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO users (email, data) VALUES (?, ?)",
+                (user.email, self._to_document(user))
+            )
+            self._write_refresh_token(user.email, user.refreshToken, user.refreshTokenExpiresAt)
+            self.write_generation += 1
+
+    def replace_all(self, users: List[User]) -> None:
+        """
+        Replace every user in one transaction.
+
+        Args:
+            users: List of User objects to store
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM refresh_tokens")
+            self.connection.execute("DELETE FROM users")
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO users (email, data) VALUES (?, ?)",
+                [(user.email, self._to_document(user)) for user in users]
+            )
+            for user in users:
+                self._write_refresh_token(user.email, user.refreshToken, user.refreshTokenExpiresAt)
+            self.write_generation += 1
+
+    def set_refresh_token(self, email: str, token: Optional[str], expires_at: Optional[datetime]) -> bool:
+        """
+        Set the refresh token of a user.
+
+        Args:
+            email: User's email
+            token: New refresh token, or None to remove it
+            expires_at: Expiration timestamp
+
+        Returns:
+            True if the user exists, False otherwise
+        """
+        with self.lock, self.connection:
+            if self.connection.execute("SELECT 1 FROM users WHERE email = ?", (email,)).fetchone() is None:
+                return False
+            self._write_refresh_token(email, token, expires_at)
+            self.write_generation += 1
+        return True
+
+    def update(self, email: str, fields: Dict[str, Any]) -> bool:
+        """
+        Update fields of the user document.
+
+        Args:
+            email: User's email
+            fields: Field values to set
+
+        Returns:
+            True if the user was updated, False if not found
+        """
+        with self.lock, self.connection:
+            row = self.connection.execute("SELECT data FROM users WHERE email = ?", (email,)).fetchone()
+            if row is None:
+                return False
+            data = json.loads(row[0])
+            data.update(fields)
+            self.connection.execute(
+                "UPDATE users SET data = ? WHERE email = ?",
+                (json.dumps(data, default=str), email)
+            )
+            self.write_generation += 1
+        return True
+
+    def delete(self, email: str) -> bool:
+        """
+        Delete a user and its refresh token.
+
+        Args:
+            email: Email of the user to delete
+
+        Returns:
+            True if the user was deleted, False if not found
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM refresh_tokens WHERE email = ?", (email,))
+            cursor = self.connection.execute("DELETE FROM users WHERE email = ?", (email,))
+            self.write_generation += 1
+        return cursor.rowcount > 0
+
+    def get_version(self) -> Tuple[int, int]:
+        """
+        Return a version that changes whenever the users change.
+
+        `PRAGMA data_version` only changes when another connection commits to the
+        database, so the count of writes made through this store is part of it.
+        A user read before a write of this process and cached after it is thus
+        dropped by the next cache lookup.
+        """
+        with self.lock:
+            return self.connection.execute("PRAGMA data_version").fetchone()[0], self.write_generation
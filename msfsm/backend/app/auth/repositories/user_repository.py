@@ -1,17 +1,113 @@
 import json
-from typing import Optional, List
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, List, Tuple
 from datetime import datetime
 
 from app.auth.schemas.user import User
 from app.auth.core.config import auth_settings
+from app.auth.repositories.sqlite_user_store import SQLiteUserStore
+from app.core.config import settings
+
+
+class UserCache:
+    """
+    LRU cache of users keyed by email, with a time to live.
+
+    The whole cache is dropped when the version of the user storage changes
+    (the modification time of the users file, or the SQLite data version and
+    write count), so that changes made by other workers, and users cached by a
+    lookup that raced with a write, are not served after the next lookup.
+    """
+
+    def __init__(self, max_size: int = auth_settings.USERS_CACHE_SIZE, ttl: float = auth_settings.USERS_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.users: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+        self.version: Optional[Hashable] = None
+        self.lock = threading.Lock()
+
+    def get(self, email: str, version: Optional[Hashable]) -> Optional[User]:
+        """Return a copy of the cached user, or None if absent, expired or stale."""
+        with self.lock:
+            if version != self.version:
+                self.users.clear()
+                self.version = version
+                return None
+
+            entry = self.users.get(email)
+            if entry is None:
+                return None
+            user, cached_at = entry
+            if time.monotonic() - cached_at > self.ttl:
+                del self.users[email]
+                return None
+
+            self.users.move_to_end(email)
+            return user.model_copy()
+
+    def put(self, user: User, version: Optional[Hashable]) -> None:
+        """Cache a user read from the storage at version `version`."""
+        with self.lock:
+            if version != self.version:
+                return
+            self.users[user.email] = (user.model_copy(), time.monotonic())
+            self.users.move_to_end(user.email)
+            while len(self.users) > self.max_size:
+                self.users.popitem(last=False)
+
+    def invalidate(self, email: Optional[str] = None) -> None:
+        """Forget one user, or every user if no email is given."""
+        with self.lock:
+            if email is None:
+                self.users.clear()
+            else:
+                self.users.pop(email, None)
+
+
+user_cache = UserCache()
+
+_user_store: Optional[SQLiteUserStore] = None
+_user_store_lock = threading.Lock()
+
+
+def get_user_store() -> Optional[SQLiteUserStore]:
+    """
+    Return the SQLite user store when USER_STORE_BACKEND is "sqlite", None otherwise.
+    """
+    global _user_store
+
+    if auth_settings.USER_STORE_BACKEND != "sqlite":
+        return None
+
+    with _user_store_lock:
+        if _user_store is None:
+            _user_store = SQLiteUserStore(settings.DATABASE_PATH)
+        return _user_store
+
+
+def _get_version(store: Optional[SQLiteUserStore]) -> Optional[Hashable]:
+    """Return the version of the user storage used to validate the cache."""
+    if store is not None:
+        return store.get_version()
+    try:
+        return os.stat(auth_settings.USERS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 def load_users() -> List[User]:
     """
-    Load all users from the JSON file.
+    Load all users from the JSON file, or from the SQLite user store.
     
     Returns:
         List of User objects
     """
+    store = get_user_store()
+    if store is not None:
+        return store.get_all()
+
     if not auth_settings.USERS_FILE.exists():
         auth_settings.USERS_FILE.parent.mkdir(parents=True, exist_ok=True)
         auth_settings.USERS_FILE.write_text("[]")
@@ -21,11 +117,17 @@ def load_users() -> List[User]:
 
 def save_users(users: List[User]) -> None:
     """
-    Save users to the JSON file.
+    Save users to the JSON file, or replace the users of the SQLite user store.
     
     Args:
         users: List of User objects to save
     """
+    store = get_user_store()
+    if store is not None:
+        store.replace_all(users)
+        user_cache.invalidate()
+        return
+
     auth_settings.USERS_FILE.parent.mkdir(parents=True, exist_ok=True)
     
     with auth_settings.USERS_FILE.open("w") as f:
@@ -41,8 +143,21 @@ def get_user_by_email(email: str) -> Optional[User]:
     Returns:
         User object if found, None otherwise
     """
-    users = load_users()
-    return next((user for user in users if user.email == email), None)
+    store = get_user_store()
+
+    # Read the version first so that a concurrent write is not cached
+    version = _get_version(store)
+    user = user_cache.get(email, version)
+    if user is not None:
+        return user
+
+    if store is not None:
+        user = store.get(email)
+    else:
+        user = next((user for user in load_users() if user.email == email), None)
+    if user is not None:
+        user_cache.put(user, version)
+    return user
 
 def add_user(user: User) -> None:
     """
@@ -51,6 +166,12 @@ def add_user(user: User) -> None:
     Args:
         user: User object to add
     """
+    store = get_user_store()
+    if store is not None:
+        store.add(user)
+        user_cache.invalidate(user.email)
+        return
+
     users = load_users()
     users.append(user)
     save_users(users)
@@ -64,6 +185,12 @@ def update_user_refresh_token(email: str, refreshToken: str, refreshTokenExpires
         refreshToken: New refresh token
         refreshTokenExpiresAt: Expiration timestamp
     """
+    store = get_user_store()
+    if store is not None:
+        store.set_refresh_token(email, refreshToken, refreshTokenExpiresAt)
+        user_cache.invalidate(email)
+        return
+
     users = load_users()
     for user in users:
         if user.email == email:
@@ -71,6 +198,7 @@ def update_user_refresh_token(email: str, refreshToken: str, refreshTokenExpires
             user.refreshTokenExpiresAt = refreshTokenExpiresAt
             break
     save_users(users)
+    user_cache.invalidate(email)
 
 def delete_user_by_email(email: str) -> bool:
     """
@@ -82,11 +210,18 @@ def delete_user_by_email(email: str) -> bool:
     Returns:
         True if user was deleted, False if not found
     """
+    store = get_user_store()
+    if store is not None:
+        deleted = store.delete(email)
+        user_cache.invalidate(email)
+        return deleted
+
     users = load_users()
     new_users = [user for user in users if user.email != email]
     if len(new_users) == len(users):
         return False
     save_users(new_users)
+    user_cache.invalidate(email)
     return True
 
 def update_user_info(
@@ -109,6 +244,20 @@ def update_user_info(
     Returns:
         True if user was updated, False if not found
     """
+    store = get_user_store()
+    if store is not None:
+        fields = {
+            name: value for name, value in (
+                ("firstName", firstName),
+                ("lastName", lastName),
+                ("role", role),
+                ("profilePicture", profilePicture)
+            ) if value is not None
+        }
+        updated = store.update(email, fields)
+        user_cache.invalidate(email)
+        return updated
+
     users = load_users()
     updated = False
     for user in users:
@@ -125,6 +274,7 @@ def update_user_info(
             break
     if updated:
         save_users(users)
+        user_cache.invalidate(email)
     return updated
 
 def update_user_password(email: str, hashedPassword: str) -> bool:
@@ -138,10 +288,17 @@ def update_user_password(email: str, hashedPassword: str) -> bool:
     Returns:
         True if password was updated, False if user not found
     """
+    store = get_user_store()
+    if store is not None:
+        updated = store.update(email, {"hashedPassword": hashedPassword})
+        user_cache.invalidate(email)
+        return updated
+
     users = load_users()
     for user in users:
         if user.email == email:
             user.hashedPassword = hashedPassword
             save_users(users)
+            user_cache.invalidate(email)
             return True
     return False
\ No newline at end of file
@@ -2,13 +2,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, Tuple
 
 from fastapi import HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
 from app.auth.enums.roles import UserRole
 from app.auth.schemas.user import User, UserCreate, UserLogin, UserOut
 from app.auth.schemas.token import JWTPayload,TokenPairResponse
 from app.auth.repositories.user_repository import get_user_by_email, add_user, update_user_refresh_token
-from app.auth.core.security import hash_password, verify_password, generate_secure_token
+from app.auth.core.security import hash_password_async, verify_password_async, generate_secure_token
 from app.auth.core.jwt import create_access_token, decode_access_token
 from app.auth.core.config import auth_settings
 from app.auth.enums.error_codes import AuthErrorCode
@@ -48,7 +49,7 @@ def clear_auth_cookies(response: Response) -> None:
     response.delete_cookie(auth_settings.ACCESS_COOKIE_NAME)
     response.delete_cookie(auth_settings.REFRESH_COOKIE_NAME)
 
-def register_user(user_data: UserCreate) -> Dict[str, str]:
+async def register_user(user_data: UserCreate) -> Dict[str, str]:
     """
     Register a new user after checking email uniqueness.
     
@@ -61,7 +62,7 @@ def register_user(user_data: UserCreate) -> Dict[str, str]:
     Raises:
         HTTPException: If email is already in use
     """
-    if get_user_by_email(user_data.email):
+    if await run_in_threadpool(get_user_by_email, user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
             detail={"code": AuthErrorCode.EMAIL_ALREADY_USED}
@@ -71,19 +72,19 @@ def register_user(user_data: UserCreate) -> Dict[str, str]:
         firstName=user_data.firstName,
         lastName=user_data.lastName,
         email=user_data.email,
-        hashedPassword=hash_password(user_data.password),
+        hashedPassword=await hash_password_async(user_data.password),
         role=UserRole.USER,
         profilePicture=None,
         createdAt=datetime.now(timezone.utc),
         refreshToken=None,
         refreshTokenExpiresAt=None
     )
-    add_user(user)
+    await run_in_threadpool(add_user, user)
 
     return {"message": "Register successful"}
 
 
-def login_user(credentials: UserLogin, response: Response) -> Dict[str, Any]:
+async def login_user(credentials: UserLogin, response: Response) -> Dict[str, Any]:
     """
     Authenticate a user and issue access/refresh tokens.
     
@@ -94,8 +95,8 @@ def login_user(credentials: UserLogin, response: Response) -> Dict[str, Any]:
     Returns:
         User data and tokens
     """
-    user = get_user_by_email(credentials.email)
-    if not user or not verify_password(credentials.password, user.hashedPassword):
+    user = await run_in_threadpool(get_user_by_email, credentials.email)
+    if not user or not await verify_password_async(credentials.password, user.hashedPassword):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, 
             detail={"code": AuthErrorCode.INVALID_CREDENTIALS}
@@ -113,7 +114,7 @@ def login_user(credentials: UserLogin, response: Response) -> Dict[str, Any]:
 
     refresh_token = generate_secure_token()
     refresh_token_expiry = datetime.now(timezone.utc) + timedelta(days=auth_settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    update_user_refresh_token(user.email, refresh_token, refresh_token_expiry)
+    await run_in_threadpool(update_user_refresh_token, user.email, refresh_token, refresh_token_expiry)
     
     # Set cookies for web clients
     set_auth_cookies(response, access_token, refresh_token)
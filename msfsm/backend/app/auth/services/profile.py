@@ -4,9 +4,10 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.auth.schemas.user import User, UserOut, UserSelfUpdate, UserPasswordUpdate
-from app.auth.core.security import verify_password, hash_password
+from app.auth.core.security import verify_password_async, hash_password_async
 from app.auth.repositories.user_repository import get_user_by_email, update_user_info, update_user_password
 from app.auth.core.config import auth_settings
 from app.auth.enums.error_codes import AuthErrorCode
@@ -41,7 +42,7 @@ def update_user_profile(user: User, updates: UserSelfUpdate) -> UserOut:
         
     return UserOut(**updated_user.model_dump())
 
-def change_user_password(user: User, payload: UserPasswordUpdate) -> Dict[str, str]:
+async def change_user_password(user: User, payload: UserPasswordUpdate) -> Dict[str, str]:
     """
     Change the authenticated user's password.
     
@@ -55,13 +56,14 @@ def change_user_password(user: User, payload: UserPasswordUpdate) -> Dict[str, s
     Raises:
         HTTPException: If old password is incorrect or update fails
     """
-    if not verify_password(payload.oldPassword, user.hashedPassword):
+    if not await verify_password_async(payload.oldPassword, user.hashedPassword):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, 
             detail={"code": AuthErrorCode.INCORRECT_CURRENT_PASSWORD}
         )
 
-    if not update_user_password(user.email, hash_password(payload.newPassword)):
+    hashed_password = await hash_password_async(payload.newPassword)
+    if not await run_in_threadpool(update_user_password, user.email, hashed_password):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
             detail={"code": AuthErrorCode.PASSWORD_UPDATE_FAILED}
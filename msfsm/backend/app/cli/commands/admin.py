@@ -3,7 +3,6 @@ Admin management commands for the MSFSM CLI.
 """
 import typer
 from typing import Optional
-from app.core.bootstrap import ensure_admin_user, ensure_api_key_bootstrap
 from app.auth.core.config import auth_settings
 from app.api_keys.core.config import api_key_settings
 from app.cli.formatters.output import info_message, success_message, section_title
@@ -26,6 +25,9 @@ def reset_admin(
     This command resets the admin user and the master API key to their default values.
     Use this command during setup or when you need to regain access to the system.
     """
+    # Imported here so that the CLI starts without loading the user and key stores
+    from app.core.bootstrap import ensure_admin_user, ensure_api_key_bootstrap
+
     # Show current default values
     section_title("Current defaults")
     info_message(f"Admin Email: {auth_settings.DEFAULT_ADMIN_EMAIL}")
@@ -6,7 +6,7 @@ import os
 import json
 from pathlib import Path
 from app.core.config import settings
-from app.cli.formatters.output import info_message, success_message, section_title
+from app.cli.formatters.output import info_message, success_message, warning_message, section_title
 
 # Create utils command group
 utils_app = typer.Typer(help="Utility commands for system maintenance")
@@ -66,4 +66,51 @@ def show_environment(
         info_message(f"API Prefix: {settings.API_PREFIX}")
         info_message(f"Ethereum Provider URL: {settings.ETHEREUM_PROVIDER_URL}")
         info_message(f"Ethereum Chain ID: {settings.ETHEREUM_CHAIN_ID}")
-        info_message(f"CORS Allow Origins: {settings.CORS_ALLOW_ORIGINS}")
\ No newline at end of file
+        info_message(f"CORS Allow Origins: {settings.CORS_ALLOW_ORIGINS}")
+
+@utils_app.command("migrate-sqlite")
+def migrate_to_sqlite(
+    batch_size: int = typer.Option(
+        500,
+        "--batch-size",
+        "-b",
+        help="Number of contracts inserted per transaction"
+    )
+):
+    """
+    Import the automaton contract JSON files into the SQLite database.
+    
+    Files are read one at a time and inserted in batches, so large directories
+    are imported without loading them in memory. Existing rows with the same ID
+    are replaced, so the command can be run again safely.
+    Set REPOSITORY_BACKEND=sqlite afterwards to use the database. This only moves
+    the contracts: users are moved by USER_STORE_BACKEND=sqlite, which imports the
+    users file on first use.
+    """
+    from app.enums.contract_status import ContractStatus
+    from app.repositories.automaton_contract_repository import SQLiteAutomatonContractRepository
+    from app.schemas.automaton_contract import AutomatonContract
+
+    section_title("SQLite Migration")
+
+    directory = settings.get_contract_dir(ContractStatus.DRAFT)
+    skipped = []
+
+    def read_contracts():
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(settings.AUTOMATON_CONTRACT_EXTENSION):
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        yield AutomatonContract(**json.load(f))
+                except Exception:
+                    skipped.append(entry.name)
+
+    repository = SQLiteAutomatonContractRepository()
+    count = repository.create_many(read_contracts(), batch_size=batch_size)
+
+    for filename in skipped:
+        warning_message(f"Skipped invalid file: {filename}")
+
+    success_message(f"{count} automaton contracts imported into {settings.DATABASE_PATH}")
@@ -1,4 +1,5 @@
 import glob
+import logging
 import os
 from typing import List
 from pydantic_settings import BaseSettings
@@ -7,6 +8,7 @@ from app.enums.contract_status import ContractStatus
 from pathlib import Path
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -34,6 +36,11 @@ class Settings(BaseSettings):
 
     # History directory
     HISTORY_DIR: str = os.path.join(DATA_DIR, "history")
+    HISTORY_SEGMENT_MAX_BYTES: int = int(os.getenv("HISTORY_SEGMENT_MAX_BYTES", str(1024 * 1024)))
+    # Write-behind: events are queued and written in batches by a background thread
+    HISTORY_WRITE_BEHIND: bool = os.getenv("HISTORY_WRITE_BEHIND", "True").lower() in ("true", "1", "t")
+    HISTORY_BATCH_SIZE: int = int(os.getenv("HISTORY_BATCH_SIZE", "100"))
+    HISTORY_FLUSH_INTERVAL_MS: int = int(os.getenv("HISTORY_FLUSH_INTERVAL_MS", "200"))
 
     # User file path
     USERS_FILE: Path = Path(DATA_DIR) / "users" / "users.json"
@@ -41,8 +48,10 @@ class Settings(BaseSettings):
     # Profile pictures directory
     PROFILE_PICTURES_DIR: Path = Path(DATA_DIR) / "users" / "profile"
 
-    # Default packages path for contract generator
-    DEFAULT_PACKAGES_PATHS: List[str] = glob.glob(os.path.join(DATA_DIR, "packages", "*.json"))
+    # Automaton contract repository backend: "filesystem" (JSON files) or "sqlite".
+    # Users are stored according to USER_STORE_BACKEND of the auth settings
+    REPOSITORY_BACKEND: str = os.getenv("REPOSITORY_BACKEND", "filesystem")
+    DATABASE_PATH: str = os.getenv("DATABASE_PATH", os.path.join(DATA_DIR, "msfsm.db"))
 
 
     # API settings
@@ -64,6 +73,14 @@ class Settings(BaseSettings):
     ETHEREUM_PUBLIC_KEY: str = os.getenv("ETHEREUM_PUBLIC_KEY", "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266")
     ETHEREUM_PRIVATE_KEY: str = os.getenv("ETHEREUM_PRIVATE_KEY", "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80")
     ETHEREUM_SOL_VERSION: str = os.getenv("ETHEREUM_SOL_VERSION", "0.8.0")
+    ETHEREUM_MULTICALL_ADDRESS: str = os.getenv("ETHEREUM_MULTICALL_ADDRESS", "")
+    ETHEREUM_POOL_SIZE: int = int(os.getenv("ETHEREUM_POOL_SIZE", "10"))
+    ETHEREUM_METADATA_TTL: float = float(os.getenv("ETHEREUM_METADATA_TTL", "15"))
+
+    # Deploy job settings
+    DEPLOY_MAX_WORKERS: int = int(os.getenv("DEPLOY_MAX_WORKERS", "2"))
+    DEPLOY_JOB_RETENTION_SECONDS: int = int(os.getenv("DEPLOY_JOB_RETENTION_SECONDS", "3600"))
+    DEPLOY_JOB_EVENTS_INTERVAL: float = float(os.getenv("DEPLOY_JOB_EVENTS_INTERVAL", "0.5"))
 
     # Create necessary directories
     def setup_directories(self):
@@ -80,6 +97,12 @@ class Settings(BaseSettings):
         """Return the path to the directory for the given contract status."""
         return self.CONTRACT_STATUS_DIRS[status]
 
+    # Default packages path for contract generator
+    @property
+    def DEFAULT_PACKAGES_PATHS(self) -> List[str]:
+        """Return the package files of the packages directory, listed when needed rather than at import."""
+        return glob.glob(os.path.join(self.PACKAGES_DIR, "*.json"))
+
     # Ethereum configuration
     @property
     def ethereum_config(self) -> ConfigEthereum:
@@ -92,6 +115,9 @@ class Settings(BaseSettings):
                 chain_id=self.ETHEREUM_CHAIN_ID,
                 pub_key=self.ETHEREUM_PUBLIC_KEY,
                 priv_key=self.ETHEREUM_PRIVATE_KEY,
+                multicall_address=self.ETHEREUM_MULTICALL_ADDRESS or None,
+                pool_size=self.ETHEREUM_POOL_SIZE,
+                metadata_ttl=self.ETHEREUM_METADATA_TTL,
             ),
         )
 
@@ -100,9 +126,9 @@ env_file = f".env.{app_env}"
 
 if os.path.exists(env_file):
     load_dotenv(env_file)
-    print(f"Configuration chargée depuis {env_file}")
+    logger.info(f"Configuration chargée depuis {env_file}")
 else:
     load_dotenv()
-    print("Configuration chargée depuis .env (par défaut)")
+    logger.info("Configuration chargée depuis .env (par défaut)")
 
 settings = Settings()
\ No newline at end of file
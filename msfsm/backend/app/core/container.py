@@ -0,0 +1,84 @@
+import sys
+
+from app.core.config import settings
+from app.auth.core.security import shutdown_password_pool
+from app.api_keys.repositories.api_key_store import start_usage_flusher, stop_usage_flusher
+from app.repositories.smart_contract_repository import SmartContractRepository
+from app.repositories.automaton_contract_repository import (
+    AutomatonContractRepository,
+    SQLiteAutomatonContractRepository
+)
+from app.repositories.package_repository import PackageRepository
+from app.services.smart_contract_service import SmartContractService
+from app.services.automaton_contract_service import AutomatonContractService
+from app.services.package_service import PackageService
+from app.services.deploy_job_service import DeployJobService
+from app.repositories.sqlite_repository import close_connections
+from app.utils.history_tracker import HistoryTracker, start_history_writer, stop_history_writer
+
+
+class ServiceContainer:
+    """
+    Application-lifetime holder of the repositories and services.
+
+    Created once by the app lifespan and stored on `app.state.container`, so
+    that the route dependencies return shared instances instead of building
+    them, and their directories and configuration, for every request. It also
+    starts the background workers with `start` and releases every process-wide
+    resource of the API with `shutdown`.
+    """
+
+    def __init__(self):
+        """Build the repositories and services."""
+        self.ethereum_config = settings.ethereum_config
+        self.history_tracker = HistoryTracker()
+
+        # Repositories
+        self.smart_contract_repository = SmartContractRepository()
+        # The SQLite implementation is used when REPOSITORY_BACKEND is "sqlite"
+        if settings.REPOSITORY_BACKEND == "sqlite":
+            self.automaton_contract_repository = SQLiteAutomatonContractRepository()
+        else:
+            self.automaton_contract_repository = AutomatonContractRepository()
+        # Packages always stay JSON files since the generator loads them from their paths
+        self.package_repository = PackageRepository()
+
+        # Services
+        self.smart_contract_service = SmartContractService(
+            repository=self.smart_contract_repository,
+            history_tracker=self.history_tracker,
+            ethereum_config=self.ethereum_config
+        )
+        self.automaton_contract_service = AutomatonContractService(
+            repository=self.automaton_contract_repository,
+            history_tracker=self.history_tracker
+        )
+        self.package_service = PackageService(repository=self.package_repository)
+        self.deploy_job_service = DeployJobService()
+
+    def start(self):
+        """Start the API key usage flusher and, with write-behind, the history writer."""
+        start_usage_flusher()
+        if settings.HISTORY_WRITE_BEHIND:
+            start_history_writer()
+
+    def shutdown(self):
+        """
+        Release the resources of the API, in dependency order.
+
+        Waits for the running deployments, writes the queued history events and
+        API key usage counts, stops the password hashing processes and closes the
+        Ethereum node and SQLite connections.
+        """
+        # Running deployments still record history events
+        self.deploy_job_service.shutdown()
+        stop_history_writer()
+        stop_usage_flusher()
+        shutdown_password_pool()
+
+        # Close pooled Ethereum node connections, if web3 was loaded at all
+        provider_module = sys.modules.get("msfsm.solidity.provider")
+        if provider_module is not None:
+            provider_module.close_providers()
+
+        close_connections()
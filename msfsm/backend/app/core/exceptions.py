@@ -93,6 +93,20 @@ class AutomatonNotFoundException(EntityNotFoundException):
         }
 
 
+class DeployJobNotFoundException(EntityNotFoundException):
+    """Exception raised when a deploy job is not found."""
+
+    def __init__(self, job_id: str):
+        super().__init__(
+            entity_name=job_id,
+            error_code=ErrorCode.DEPLOY_JOB_NOT_FOUND
+        )
+        self.detail = {
+            "code": ErrorCode.DEPLOY_JOB_NOT_FOUND,
+            "message": f"Deploy job '{job_id}' not found."
+        }
+
+
 # Package-specific exceptions
 class PackageNotFoundException(EntityNotFoundException):
     """Exception raised when a package is not found."""
@@ -0,0 +1,8 @@
+from enum import Enum
+
+class DeployJobStatus(str, Enum):
+    """Deploy job status enumeration."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
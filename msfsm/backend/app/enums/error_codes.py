@@ -28,6 +28,9 @@ class ErrorCode(str, Enum):
     CONTRACT_INVALID_STATE = "contract.invalid_state"
     CONTRACT_COMPILATION_FAILED = "contract.compilation_failed"
     
+    # Deploy job errors
+    DEPLOY_JOB_NOT_FOUND = "deploy_job.not_found"
+    
     # Automaton errors
     AUTOMATON_NOT_FOUND = "automaton.not_found"
     AUTOMATON_ALREADY_EXISTS = "automaton.already_exists"
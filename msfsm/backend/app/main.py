@@ -5,6 +5,8 @@ from fastapi.staticfiles import StaticFiles
 from app.api.routes.smart_contract import router as smart_contract_router
 from app.api.routes.automaton_contract import router as automaton_contract_router
 from app.api.routes.package import router as package_router
+from app.api.routes.metrics import router as metrics_router
+from app.api.routes.history import router as history_router
 from app.auth.api.routes import router as auth_router
 from app.api_keys.routes.api_key_routes import router as api_key_router
 
@@ -54,6 +56,8 @@ api_prefix = settings.API_PREFIX
 app.include_router(smart_contract_router, prefix=api_prefix)
 app.include_router(automaton_contract_router, prefix=api_prefix)
 app.include_router(package_router, prefix=api_prefix)
+app.include_router(metrics_router, prefix=api_prefix)
+app.include_router(history_router, prefix=api_prefix)
 app.include_router(auth_router, prefix=api_prefix)
 app.include_router(api_key_router, prefix=api_prefix)
 
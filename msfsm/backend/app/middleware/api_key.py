@@ -1,7 +1,9 @@
+import re
+
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.exceptions import HTTPException
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.api_keys.dependencies.api_key_checker import verify_api_key
 from app.api_keys.enums.error_codes import ApiKeyErrorCode
@@ -14,41 +16,69 @@ EXCLUDED_PATHS = [
     "/assets", # Static assets 
 ]
 
-class APIKeyMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        path = request.url.path
+# Matches any path starting with one of the excluded prefixes
+EXCLUDED_PATHS_PATTERN = re.compile("|".join(re.escape(p) for p in EXCLUDED_PATHS))
+
+
+def api_key_error_response(e: HTTPException) -> JSONResponse:
+    """Convert an API key verification error to the standardized JSON error body."""
+    if isinstance(e.detail, str):
+        code = ApiKeyErrorCode.INVALID
+        if e.status_code == 401:
+            code = ApiKeyErrorCode.MISSING_HEADER
+        elif e.status_code == 403 and e.detail == ApiKeyErrorCode.DISABLED:
+            code = ApiKeyErrorCode.DISABLED
+        elif e.status_code == 429:
+            code = ApiKeyErrorCode(e.detail)
+
+        return JSONResponse(
+            status_code=e.status_code,
+            content={
+                "code": code,
+                "message": str(e.detail)
+            },
+            headers=e.headers
+        )
+    return JSONResponse(status_code=e.status_code, content=e.detail, headers=e.headers)
+
+
+class APIKeyMiddleware:
+    """
+    Pure ASGI middleware validating the API key header of every HTTP request.
+
+    Unlike BaseHTTPMiddleware, it does not wrap the downstream application in a
+    task and a stream, so responses, including streamed ones, go straight through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip API key verification for excluded paths
-        if any(path.startswith(p) for p in EXCLUDED_PATHS):
-            return await call_next(request)
+        if EXCLUDED_PATHS_PATTERN.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         # Try to validate the API key
         try:
-            verify_api_key(request)
+            verify_api_key(Request(scope))
         except HTTPException as e:
-            # Convert to standardized error format if not already
-            if isinstance(e.detail, str):
-                code = ApiKeyErrorCode.INVALID
-                if e.status_code == 401:
-                    code = ApiKeyErrorCode.MISSING_HEADER
-                elif e.status_code == 403 and e.detail == ApiKeyErrorCode.DISABLED:
-                    code = ApiKeyErrorCode.DISABLED
-                
-                return JSONResponse(
-                    status_code=e.status_code, 
-                    content={
-                        "code": code,
-                        "message": str(e.detail)
-                    }
-                )
-            return JSONResponse(status_code=e.status_code, content=e.detail)
+            response = api_key_error_response(e)
+            await response(scope, receive, send)
+            return
         except Exception as e:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=403, 
                 content={
                     "code": ApiKeyErrorCode.INVALID,
                     "message": str(e)
                 }
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
\ No newline at end of file
+        await self.app(scope, receive, send)
@@ -4,13 +4,19 @@ These repositories abstract the data storage details.
 """
 
 from app.repositories.base_repository import FileSystemRepository
+from app.repositories.sqlite_repository import SQLiteRepository
 from app.repositories.smart_contract_repository import SmartContractRepository
-from app.repositories.automaton_contract_repository import AutomatonContractRepository
+from app.repositories.automaton_contract_repository import (
+    AutomatonContractRepository,
+    SQLiteAutomatonContractRepository
+)
 from app.repositories.package_repository import PackageRepository
 
 __all__ = [
     'FileSystemRepository',
+    'SQLiteRepository',
     'SmartContractRepository',
     'AutomatonContractRepository',
+    'SQLiteAutomatonContractRepository',
     'PackageRepository'
 ]
\ No newline at end of file
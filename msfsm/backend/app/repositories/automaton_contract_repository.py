@@ -1,4 +1,5 @@
 from app.repositories.base_repository import FileSystemRepository
+from app.repositories.sqlite_repository import SQLiteRepository
 from app.schemas.automaton_contract import AutomatonContract
 from app.core.config import settings
 from app.core.exceptions import AutomatonContractNotFoundException, AutomatonContractAlreadyExistsException
@@ -15,4 +16,18 @@ class AutomatonContractRepository(FileSystemRepository[AutomatonContract]):
             model_class=AutomatonContract,
             not_found_exception=AutomatonContractNotFoundException,
             already_exists_exception=AutomatonContractAlreadyExistsException
-        )
\ No newline at end of file
+        )
+
+
+class SQLiteAutomatonContractRepository(SQLiteRepository[AutomatonContract]):
+    """Repository for managing automaton contracts in the SQLite database."""
+
+    def __init__(self):
+        """Initialize with the automaton contracts table."""
+        super().__init__(
+            database_path=settings.DATABASE_PATH,
+            table_name="automaton_contracts",
+            model_class=AutomatonContract,
+            not_found_exception=AutomatonContractNotFoundException,
+            already_exists_exception=AutomatonContractAlreadyExistsException
+        )
@@ -0,0 +1,326 @@
+import os
+import sqlite3
+import threading
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Generic
+from pydantic import BaseModel
+
+from app.core.exceptions import EntityNotFoundException, EntityAlreadyExistsException
+
+T = TypeVar('T', bound=BaseModel)
+
+# Model fields stored in their own indexed column, mapped to the column name
+INDEXED_FIELDS: Dict[str, str] = {
+    "id": "id",
+    "name": "name",
+    "createdBy": "created_by",
+    "status": "status",
+}
+
+_connections: Dict[str, Tuple[sqlite3.Connection, threading.Lock]] = {}
+_connections_lock = threading.Lock()
+
+
+def get_connection(database_path: str) -> Tuple[sqlite3.Connection, threading.Lock]:
+    """
+    Get the process-wide connection to a SQLite database and the lock serializing its use.
+
+    Args:
+        database_path: Path of the database file
+
+    Returns:
+        The connection and its lock
+    """
+    with _connections_lock:
+        if database_path not in _connections:
+            os.makedirs(os.path.dirname(database_path) or ".", exist_ok=True)
+            connection = sqlite3.connect(database_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            _connections[database_path] = (connection, threading.Lock())
+        return _connections[database_path]
+
+
+def close_connections() -> None:
+    """Close every SQLite connection opened by the repositories."""
+    with _connections_lock:
+        for connection, _ in _connections.values():
+            connection.close()
+        _connections.clear()
+
+
+class SQLiteRepository(Generic[T]):
+    """
+    Base repository storing models in an embedded SQLite database.
+
+    Drop-in replacement for FileSystemRepository: each model is stored as a JSON
+    document in a table, next to indexed copies of its id, name, createdBy and
+    status fields so that lookups on them do not scan every document.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        table_name: str,
+        model_class: Type[T],
+        not_found_exception: Type[Exception] = EntityNotFoundException,
+        already_exists_exception: Type[Exception] = EntityAlreadyExistsException
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            database_path: Path of the SQLite database file
+            table_name: Table where the models are stored
+            model_class: Pydantic model class for deserialization
+            not_found_exception: Exception to raise when entity is not found
+            already_exists_exception: Exception to raise when entity already exists
+        """
+        self.database_path = database_path
+        self.table_name = table_name
+        self.model_class = model_class
+        self.not_found_exception = not_found_exception
+        self.already_exists_exception = already_exists_exception
+        self.connection, self.lock = get_connection(database_path)
+
+        self._create_table()
+
+    def _create_table(self) -> None:
+        """Create the table and its indexes if they don't exist."""
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "id TEXT PRIMARY KEY, name TEXT, created_by TEXT, status TEXT, data TEXT NOT NULL)"
+            )
+            for column in ("created_by", "name", "status"):
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_{column} "
+                    f"ON {self.table_name} ({column})"
+                )
+
+    @staticmethod
+    def _to_column_value(value: Any) -> Optional[str]:
+        """Convert a field value to the value stored in its indexed column."""
+        if value is None:
+            return None
+        if isinstance(value, Enum):
+            return str(value.value)
+        return str(value)
+
+    def _to_row(self, model: T) -> Tuple[Optional[str], ...]:
+        """Convert a model to a table row."""
+        return (
+            *(self._to_column_value(getattr(model, field, None)) for field in INDEXED_FIELDS),
+            model.model_dump_json(),
+        )
+
+    def exists(self, entity_id: str) -> bool:
+        """
+        Check if an entity with the given ID exists.
+
+        Args:
+            entity_id: ID of the entity to check
+
+        Returns:
+            True if the entity exists, False otherwise
+        """
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT 1 FROM {self.table_name} WHERE id = ?", (str(entity_id),)
+            ).fetchone()
+        return row is not None
+
+    def get_all(self) -> List[T]:
+        """
+        Get all models from the table.
+
+        Returns:
+            List of all models
+        """
+        with self.lock:
+            rows = self.connection.execute(f"SELECT data FROM {self.table_name}").fetchall()
+
+        result = []
+        for (data,) in rows:
+            try:
+                result.append(self.model_class.model_validate_json(data))
+            except Exception:
+                # Skip invalid documents
+                continue
+        return result
+
+    def get_by_id(self, entity_id: str) -> T:
+        """
+        Get a model by its ID.
+
+        Args:
+            entity_id: ID of the entity to retrieve
+
+        Returns:
+            The model instance
+
+        Raises:
+            Exception: If entity is not found
+        """
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT data FROM {self.table_name} WHERE id = ?", (str(entity_id),)
+            ).fetchone()
+
+        if row is None:
+            raise self.not_found_exception(entity_id)
+
+        return self.model_class.model_validate_json(row[0])
+
+    def get_by_field(self, field_name: str, field_value: Any) -> List[T]:
+        """
+        Get all models where a specific field matches a value.
+        Indexed fields are matched in SQL, other fields fall back to a scan.
+
+        Args:
+            field_name: Name of the field to match
+            field_value: Value to match
+
+        Returns:
+            List of models matching the criteria
+        """
+        if field_name not in INDEXED_FIELDS:
+            return [
+                entity for entity in self.get_all()
+                if hasattr(entity, field_name) and getattr(entity, field_name) == field_value
+            ]
+
+        column = INDEXED_FIELDS[field_name]
+        value = self._to_column_value(field_value)
+
+        with self.lock:
+            if value is None:
+                rows = self.connection.execute(
+                    f"SELECT data FROM {self.table_name} WHERE {column} IS NULL"
+                ).fetchall()
+            else:
+                rows = self.connection.execute(
+                    f"SELECT data FROM {self.table_name} WHERE {column} = ?", (value,)
+                ).fetchall()
+
+        return [self.model_class.model_validate_json(data) for (data,) in rows]
+
+    def create(self, model: T) -> T:
+        """
+        Create a new model row.
+
+        Args:
+            model: Model instance to create
+
+        Returns:
+            The created model
+
+        Raises:
+            ValueError: If model has no id attribute
+            Exception: If entity already exists
+        """
+        if not hasattr(model, 'id'):
+            raise ValueError("Model must have an 'id' attribute")
+
+        try:
+            with self.lock, self.connection:
+                self.connection.execute(
+                    f"INSERT INTO {self.table_name} (id, name, created_by, status, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    self._to_row(model)
+                )
+        except sqlite3.IntegrityError:
+            raise self.already_exists_exception(model.id)
+
+        return model
+
+    def create_many(self, models: Iterable[T], batch_size: int = 500) -> int:
+        """
+        Insert models in batches, replacing existing rows with the same ID.
+        The models are consumed lazily so that large imports can be streamed.
+
+        Args:
+            models: Models to insert
+            batch_size: Number of rows inserted per transaction
+
+        Returns:
+            Number of models inserted
+        """
+        count = 0
+        batch = []
+
+        for model in models:
+            batch.append(self._to_row(model))
+            if len(batch) >= batch_size:
+                count += self._insert_batch(batch)
+                batch = []
+
+        if batch:
+            count += self._insert_batch(batch)
+
+        return count
+
+    def _insert_batch(self, rows: List[Tuple[Optional[str], ...]]) -> int:
+        with self.lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (id, name, created_by, status, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def update(self, entity_id: str, model: T) -> T:
+        """
+        Update an existing model row.
+
+        Args:
+            entity_id: ID of the entity to update
+            model: Updated model instance
+
+        Returns:
+            The updated model
+
+        Raises:
+            ValueError: If model has no id attribute
+            Exception: If entity is not found
+        """
+        if not hasattr(model, 'id'):
+            raise ValueError("Model must have an 'id' attribute")
+
+        # Ensure the ID remains the same
+        model.id = entity_id
+
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                f"UPDATE {self.table_name} SET name = ?, created_by = ?, status = ?, data = ? "
+                "WHERE id = ?",
+                (*self._to_row(model)[1:], str(entity_id))
+            )
+
+        if cursor.rowcount == 0:
+            raise self.not_found_exception(entity_id)
+
+        return model
+
+    def delete(self, entity_id: str) -> bool:
+        """
+        Delete a model row.
+
+        Args:
+            entity_id: ID of the entity to delete
+
+        Returns:
+            True if deleted successfully
+
+        Raises:
+            Exception: If entity is not found
+        """
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                f"DELETE FROM {self.table_name} WHERE id = ?", (str(entity_id),)
+            )
+
+        if cursor.rowcount == 0:
+            raise self.not_found_exception(entity_id)
+
+        return True
@@ -2,6 +2,8 @@ from pydantic import BaseModel, Field
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 
+from app.enums.deploy_job_status import DeployJobStatus
+
 
 class ContractABI(BaseModel):
     """Contract ABI entry model."""
@@ -36,4 +38,16 @@ class ExecutionResult(BaseModel):
     function: str
     args: List[Any]
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    result: Any
\ No newline at end of file
+    result: Any
+
+class DeployJob(BaseModel):
+    """Asynchronous deployment job model."""
+    id: str
+    contract: str
+    status: DeployJobStatus = DeployJobStatus.PENDING
+    created_by: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    automatons: Dict[str, Optional[str]] = {}  # Last stage reached by each automaton
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
@@ -13,9 +13,9 @@ from app.core.config import settings
 class AutomatonContractService:
     """Service for managing automaton contracts."""
 
-    def __init__(self, repository: AutomatonContractRepository):
+    def __init__(self, repository: AutomatonContractRepository, history_tracker: Optional[HistoryTracker] = None):
         self.repository = repository
-        self.history_tracker = HistoryTracker()
+        self.history_tracker = history_tracker or HistoryTracker()
 
     def get_all_contracts(self) -> List[AutomatonContract]:
         """Get all automaton contracts."""
@@ -0,0 +1,146 @@
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from msfsm.common.specification import SpecificationModel
+
+from app.core.config import settings
+from app.core.exceptions import DeployJobNotFoundException
+from app.enums.deploy_job_status import DeployJobStatus
+from app.schemas.smart_contract import DeployJob
+from app.services.smart_contract_service import SmartContractService
+
+logger = logging.getLogger(__name__)
+
+
+class DeployJobService:
+    """
+    Service running smart contract deployments in the background.
+
+    Deployments run on a bounded worker pool so that requests return a job id
+    right away. The progress of each automaton is kept as a list of events that
+    can be polled or streamed.
+    """
+
+    def __init__(self, max_workers: int = settings.DEPLOY_MAX_WORKERS):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deploy")
+        self.jobs: Dict[str, DeployJob] = {}
+        self.events: Dict[str, List[Dict[str, Any]]] = {}
+        self.lock = threading.Lock()
+
+    def submit(
+        self,
+        specification: SpecificationModel,
+        service: SmartContractService,
+        user_id: Optional[str] = None
+    ) -> DeployJob:
+        """Queue the deployment of a specification and return its job."""
+        self._prune()
+
+        job = DeployJob(
+            id=str(uuid.uuid4()),
+            contract=specification.name,
+            created_by=user_id,
+            automatons={name: None for name in specification.automatons}
+        )
+
+        with self.lock:
+            self.jobs[job.id] = job
+            self.events[job.id] = []
+
+        self._add_event(job.id, "status", {"status": job.status.value})
+        submitted = job.model_copy(deep=True)
+        self.executor.submit(self._run, job.id, specification, service, user_id)
+
+        return submitted
+
+    def get_job(self, job_id: str) -> DeployJob:
+        """Return a copy of a job."""
+        with self.lock:
+            if job_id not in self.jobs:
+                raise DeployJobNotFoundException(job_id)
+            return self.jobs[job_id].model_copy(deep=True)
+
+    def get_events(self, job_id: str, start: int = 0) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Return the events of a job from index `start` and whether the job is finished.
+        """
+        with self.lock:
+            if job_id not in self.jobs:
+                raise DeployJobNotFoundException(job_id)
+            finished = self.jobs[job_id].status in (DeployJobStatus.COMPLETED, DeployJobStatus.FAILED)
+            return list(self.events[job_id][start:]), finished
+
+    def shutdown(self):
+        """Wait for the running deployments and stop the worker pool."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(
+        self,
+        job_id: str,
+        specification: SpecificationModel,
+        service: SmartContractService,
+        user_id: Optional[str]
+    ):
+        self._set_status(job_id, DeployJobStatus.RUNNING)
+
+        def on_progress(automaton_name: str, stage: str):
+            with self.lock:
+                job = self.jobs[job_id]
+                job.automatons[automaton_name] = stage
+                job.updated_at = datetime.now(timezone.utc)
+            self._add_event(job_id, "progress", {"automaton": automaton_name, "stage": stage})
+
+        try:
+            result = service.deploy_contract(specification, user_id, progress_callback=on_progress)
+        except Exception as e:
+            logger.exception("Deploy job %s failed", job_id)
+            message = e.detail.get("message") if isinstance(getattr(e, "detail", None), dict) else str(e)
+            self._set_status(job_id, DeployJobStatus.FAILED, error=message)
+            return
+
+        self._set_status(job_id, DeployJobStatus.COMPLETED, result=result)
+
+    def _set_status(
+        self,
+        job_id: str,
+        status: DeployJobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ):
+        with self.lock:
+            job = self.jobs[job_id]
+            job.status = status
+            job.result = result
+            job.error = error
+            job.updated_at = datetime.now(timezone.utc)
+
+        data = {"status": status.value}
+        if error is not None:
+            data["error"] = error
+        self._add_event(job_id, "status", data)
+
+    def _add_event(self, job_id: str, event_type: str, data: Dict[str, Any]):
+        with self.lock:
+            self.events[job_id].append({
+                "type": event_type,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                **data
+            })
+
+    def _prune(self):
+        """Forget finished jobs older than the retention period."""
+        now = datetime.now(timezone.utc)
+
+        with self.lock:
+            expired = [
+                job_id for job_id, job in self.jobs.items()
+                if job.status in (DeployJobStatus.COMPLETED, DeployJobStatus.FAILED)
+                and (now - job.updated_at).total_seconds() > settings.DEPLOY_JOB_RETENTION_SECONDS
+            ]
+            for job_id in expired:
+                del self.jobs[job_id]
+                del self.events[job_id]
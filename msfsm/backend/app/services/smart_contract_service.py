@@ -1,9 +1,8 @@
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime, timezone
 
+from msfsm.solidity.config import ConfigEthereum
 from msfsm.common.specification import SpecificationModel
-from msfsm.solidity.generator import GeneratorSolidity
-from msfsm.solidity.executor import ExecutorSolidity
 
 from app.core.config import settings
 from app.core.exceptions import (
@@ -18,16 +17,37 @@ from app.utils.history_tracker import HistoryTracker
 from app.enums.history_events import HistoryTrackerEventType
 
 
+# View functions read for every automaton to show the status of a contract
+STATUS_FUNCTIONS = ["get_current_state", "is_completed"]
+
+
 class SmartContractService:
     """Service for managing deployed smart contracts."""
 
-    def __init__(self, repository: SmartContractRepository):
+    def __init__(
+        self,
+        repository: SmartContractRepository,
+        history_tracker: Optional[HistoryTracker] = None,
+        ethereum_config: Optional[ConfigEthereum] = None
+    ):
         self.repository = repository
-        self.ethereum_config = settings.ethereum_config
-        self.history_tracker = HistoryTracker()
+        self.ethereum_config = ethereum_config or settings.ethereum_config
+        self.history_tracker = history_tracker or HistoryTracker()
+
+    def deploy_contract(
+        self,
+        specification: SpecificationModel,
+        user_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Deploy a contract based on a specification.
+
+        `progress_callback` is called with the automaton name and the stage it reached
+        (generated, compiled, sent, mined).
+        """
+        from msfsm.solidity.generator import GeneratorSolidity
 
-    def deploy_contract(self, specification: SpecificationModel, user_id: Optional[str] = None) -> Dict[str, Any]:
-        """Deploy a contract based on a specification."""
         try:
             generator = GeneratorSolidity(
                 specification_obj=specification,
@@ -35,7 +55,7 @@ class SmartContractService:
                 config=self.ethereum_config
             )
 
-            generator.deploy()
+            generator.deploy(progress_callback=progress_callback)
             deployment_time = datetime.now(timezone.utc)
 
             contract_data = {
@@ -85,6 +105,25 @@ class SmartContractService:
             "filename": f"{contract_name}{settings.SMART_CONTRACT_EXTENSION}"
         }
 
+    def get_contract_status(self, contract_name: str) -> Dict[str, Dict[str, Any]]:
+        """Read the current state and completion of every automaton in one round trip."""
+        contract_data = self.get_deployed_contract(contract_name)
+        automatons = contract_data.get("automatons", {})
+
+        from msfsm.solidity.executor import ExecutorSolidity
+
+        try:
+            return ExecutorSolidity.read_batch(
+                contracts={
+                    name: (info["address"], info["abi"])
+                    for name, info in automatons.items()
+                },
+                function_names=STATUS_FUNCTIONS,
+                config=self.ethereum_config
+            )
+        except Exception as e:
+            raise ContractExecutionException(str(e))
+
     def execute_contract_function(
         self,
         contract_name: str,
@@ -93,6 +132,8 @@ class SmartContractService:
         args: List[str],
         user_id: Optional[str] = None
     ) -> ExecutionResult:
+        from msfsm.solidity.executor import ExecutorSolidity
+
         try:
             contract_data = self.get_deployed_contract(contract_name)
             automatons = contract_data.get("automatons", {})
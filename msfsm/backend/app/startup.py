@@ -7,6 +7,7 @@ from app.core.bootstrap import run_bootstrap
 from app.core.config import settings
 from app.auth.core.config import auth_settings
 from app.enums.error_codes import ErrorCode
+from app.core.container import ServiceContainer
 
 @asynccontextmanager
 async def app_lifespan(app: FastAPI):
@@ -16,6 +17,8 @@ async def app_lifespan(app: FastAPI):
     - Swagger API key schema injection
     - Directory setup
     - Default user and API key bootstrap
+    - Service container holding the repositories and services, stored on app.state,
+      which starts the background workers and releases every resource on shutdown
     """
     # Swagger X-API-KEY integration
     add_api_key_security_schema(app)
@@ -31,9 +34,14 @@ async def app_lifespan(app: FastAPI):
     # Ensure admin + master API key exist
     run_bootstrap()
 
+    # Shared repositories and services, and the background workers
+    app.state.container = ServiceContainer()
+    app.state.container.start()
+
     yield  # App is running
 
-    # Optional: shutdown logic
+    # Wait for running deploy jobs and release the resources
+    app.state.container.shutdown()
 
 
 def setup_error_handlers(app: FastAPI):
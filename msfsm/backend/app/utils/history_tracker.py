@@ -1,23 +1,249 @@
 import json
+import logging
 import os
+import queue
+import struct
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Each entry of a segment index is the byte offset of an event in the segment
+INDEX_ENTRY = struct.Struct("<Q")
+SEGMENT_EXTENSION = ".jsonl"
+INDEX_EXTENSION = ".idx"
+
+# Serializes the writers of a contract history inside the process
+_contract_locks: Dict[str, threading.Lock] = {}
+_contract_locks_lock = threading.Lock()
+
+# First event sequence number of the last segment of each contract history
+_last_segments: Dict[str, int] = {}
+
+# Background writer used by `HistoryTracker.record_event` when write-behind is enabled
+_history_writer: Optional["HistoryWriter"] = None
+
 
 class HistoryTracker:
-    """Utility for tracking contract history."""
+    """
+    Utility for tracking contract history.
+
+    The history of a contract is an append-only log of JSON lines split into
+    segments of at most HISTORY_SEGMENT_MAX_BYTES bytes. A segment is named after
+    the sequence number of its first event, and an index file next to it holds the
+    byte offset of each of its events, so any range of events is read without
+    parsing the rest of the history.
+    """
 
     def __init__(self):
         """Initialize the history tracker."""
         self.history_dir = settings.HISTORY_DIR
+        self.segment_max_bytes = settings.HISTORY_SEGMENT_MAX_BYTES
         os.makedirs(self.history_dir, exist_ok=True)
 
     def _get_contract_history_path(self, contract_id: str) -> str:
-        """Return the path to the contract's history file."""
+        """Return the path to the contract's legacy history file."""
         return os.path.join(self.history_dir, f"{contract_id}_history.json")
 
+    def _get_contract_history_dir(self, contract_id: str) -> str:
+        """Return the path to the directory holding the contract's history segments."""
+        return os.path.join(self.history_dir, contract_id)
+
+    @staticmethod
+    def _get_segment_path(history_dir: str, first_seq: int, extension: str) -> str:
+        return os.path.join(history_dir, f"{first_seq:012d}{extension}")
+
+    @staticmethod
+    def _list_segments(history_dir: str) -> List[int]:
+        """Return the first sequence number of every segment, in order."""
+        if not os.path.isdir(history_dir):
+            return []
+        return sorted(
+            int(name[:-len(SEGMENT_EXTENSION)])
+            for name in os.listdir(history_dir)
+            if name.endswith(SEGMENT_EXTENSION)
+        )
+
+    def _count_events(self, history_dir: str, first_seq: int) -> int:
+        index_path = self._get_segment_path(history_dir, first_seq, INDEX_EXTENSION)
+        if not os.path.exists(index_path):
+            return 0
+        return os.path.getsize(index_path) // INDEX_ENTRY.size
+
+    @contextmanager
+    def _lock(self, contract_id: str) -> Iterator[str]:
+        """Lock the history of a contract against other threads and processes."""
+        history_dir = self._get_contract_history_dir(contract_id)
+        os.makedirs(history_dir, exist_ok=True)
+
+        with _contract_locks_lock:
+            lock = _contract_locks.setdefault(history_dir, threading.Lock())
+
+        with lock, open(os.path.join(history_dir, ".lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield history_dir
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _get_last_segment(self, history_dir: str) -> Tuple[int, int]:
+        """
+        Return the first sequence number and the event count of the last segment.
+        Must be called with the contract history locked.
+        """
+        first_seq = _last_segments.get(history_dir)
+
+        if first_seq is None:
+            segments = self._list_segments(history_dir)
+            first_seq = segments[-1] if segments else 0
+
+        count = self._count_events(history_dir, first_seq)
+
+        # Another process may have rotated the log since it was cached
+        while count and os.path.exists(
+            self._get_segment_path(history_dir, first_seq + count, SEGMENT_EXTENSION)
+        ):
+            first_seq += count
+            count = self._count_events(history_dir, first_seq)
+
+        _last_segments[history_dir] = first_seq
+        return first_seq, count
+
+    def _repair_segment(self, history_dir: str, first_seq: int) -> int:
+        """
+        Truncate a segment and its index back to their last complete, indexed event.
+
+        A crash between the append to a segment and the append to its index leaves
+        lines that no index entry points to, or a partial index entry. Appending
+        after them would store the new events at offsets the reads do not expect.
+        Must be called with the contract history locked.
+
+        Returns:
+            int: Number of events of the segment
+        """
+        segment_path = self._get_segment_path(history_dir, first_seq, SEGMENT_EXTENSION)
+        index_path = self._get_segment_path(history_dir, first_seq, INDEX_EXTENSION)
+        if not os.path.exists(segment_path):
+            return self._count_events(history_dir, first_seq)
+
+        index_size = os.path.getsize(index_path) if os.path.exists(index_path) else 0
+        count = index_size // INDEX_ENTRY.size
+        segment_end = 0
+
+        while count:
+            with open(index_path, "rb") as f:
+                f.seek((count - 1) * INDEX_ENTRY.size)
+                (last_offset,) = INDEX_ENTRY.unpack(f.read(INDEX_ENTRY.size))
+            with open(segment_path, "rb") as f:
+                f.seek(last_offset)
+                line = f.readline()
+            if line.endswith(b"\n"):
+                segment_end = last_offset + len(line)
+                break
+            # The last index entry points past the end of the written lines
+            count -= 1
+
+        if index_size != count * INDEX_ENTRY.size:
+            logger.warning("Truncating the index of history segment %s to %d events", segment_path, count)
+            os.truncate(index_path, count * INDEX_ENTRY.size)
+
+        if os.path.getsize(segment_path) != segment_end:
+            logger.warning("Truncating unindexed events of history segment %s", segment_path)
+            os.truncate(segment_path, segment_end)
+
+        return count
+
+    def _append(self, history_dir: str, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Append events to the log, opening each segment once per batch.
+        Must be called with the contract history locked.
+        """
+        first_seq, _ = self._get_last_segment(history_dir)
+        count = self._repair_segment(history_dir, first_seq)
+        segment_path = self._get_segment_path(history_dir, first_seq, SEGMENT_EXTENSION)
+        segment_size = os.path.getsize(segment_path) if os.path.exists(segment_path) else 0
+
+        # Lines and offsets to write, per segment
+        writes: Dict[int, Tuple[List[bytes], List[bytes]]] = {}
+        recorded = []
+
+        for event in events:
+            event = {"seq": first_seq + count, **event}
+            line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+
+            # Rotate to a new segment once the current one is full
+            if count and segment_size + len(line) > self.segment_max_bytes:
+                first_seq += count
+                count = 0
+                segment_size = 0
+
+            lines, offsets = writes.setdefault(first_seq, ([], []))
+            lines.append(line)
+            offsets.append(INDEX_ENTRY.pack(segment_size))
+
+            segment_size += len(line)
+            count += 1
+            recorded.append(event)
+
+        for segment_seq, (lines, offsets) in writes.items():
+            with open(self._get_segment_path(history_dir, segment_seq, SEGMENT_EXTENSION), "ab") as f:
+                f.write(b"".join(lines))
+
+            with open(self._get_segment_path(history_dir, segment_seq, INDEX_EXTENSION), "ab") as f:
+                f.write(b"".join(offsets))
+
+        _last_segments[history_dir] = first_seq
+        return recorded
+
+    def _import_legacy_history(self, contract_id: str, history_dir: str) -> None:
+        """
+        Move the events of a legacy `{contract_id}_history.json` file into the log.
+        Must be called with the contract history locked.
+        """
+        legacy_path = self._get_contract_history_path(contract_id)
+        if not os.path.exists(legacy_path):
+            return
+
+        try:
+            with open(legacy_path, 'r') as f:
+                events = json.load(f).get("events", [])
+        except Exception:
+            events = []
+
+        for event in events:
+            event.pop("seq", None)
+        self._append(history_dir, events)
+
+        os.replace(legacy_path, f"{legacy_path}.migrated")
+
+    @staticmethod
+    def create_event(
+            contract_id: str,
+            event_type: str,
+            user_id: Optional[str] = None,
+            details: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Create the entry of an event, without its sequence number."""
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "contract_id": contract_id,
+            "event_type": event_type,
+            "user_id": user_id,
+            "details": details or {}
+        }
+
     def record_event(
             self,
             contract_id: str,
@@ -28,6 +254,9 @@ class HistoryTracker:
         """
         Record an event in the contract's history.
 
+        When the background history writer is running, the event is queued and
+        written later, so it has no sequence number yet.
+
         Args:
             contract_id: Unique identifier of the contract
             event_type: Type of event (e.g., create, update, deploy)
@@ -37,55 +266,269 @@ class HistoryTracker:
         Returns:
             Dict[str, Any]: The newly recorded event
         """
-        # Create the event entry
-        event = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "contract_id": contract_id,
-            "event_type": event_type,
-            "user_id": user_id,
-            "details": details or {}
-        }
+        event = self.create_event(contract_id, event_type, user_id, details)
 
-        # Determine file path
-        history_path = self._get_contract_history_path(contract_id)
+        writer = _history_writer
+        if writer is not None and writer.enqueue(event):
+            return event
 
-        # Load existing history, or initialize new one
-        if os.path.exists(history_path):
-            try:
-                with open(history_path, 'r') as f:
-                    history = json.load(f)
-            except:
-                history = {"events": []}
-        else:
-            history = {"events": []}
+        return self.record_events(contract_id, [event])[0]
+
+    def record_events(self, contract_id: str, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Append already created events to the contract's history in one write.
+
+        Args:
+            contract_id: Unique identifier of the contract
+            events: Events created with `create_event`
+
+        Returns:
+            List[Dict[str, Any]]: The recorded events, with their sequence numbers
+        """
+        with self._lock(contract_id) as history_dir:
+            self._import_legacy_history(contract_id, history_dir)
+            return self._append(history_dir, events)
+
+    def _read_range(self, history_dir: str, start: int, end: int) -> List[Dict[str, Any]]:
+        """Read the events with a sequence number in [start, end)."""
+        events = []
+
+        for first_seq in self._list_segments(history_dir):
+            count = self._count_events(history_dir, first_seq)
+            if first_seq + count <= start or first_seq >= end:
+                continue
+
+            lo = max(start, first_seq) - first_seq
+            hi = min(end, first_seq + count) - first_seq
 
-        # Append the new event
-        history["events"].append(event)
+            with open(self._get_segment_path(history_dir, first_seq, INDEX_EXTENSION), "rb") as f:
+                f.seek(lo * INDEX_ENTRY.size)
+                offsets = [o for (o,) in INDEX_ENTRY.iter_unpack(f.read((hi - lo) * INDEX_ENTRY.size))]
+                # Offset of the event following the range, if any
+                following = f.read(INDEX_ENTRY.size)
 
-        # Save the updated history to file
-        with open(history_path, 'w') as f:
-            json.dump(history, f, indent=2)
+            with open(self._get_segment_path(history_dir, first_seq, SEGMENT_EXTENSION), "rb") as f:
+                f.seek(offsets[0])
+                if following:
+                    data = f.read(INDEX_ENTRY.unpack(following)[0] - offsets[0])
+                else:
+                    data = f.read()
 
-        return event
+            # Each event is read at its own offset, so that lines no index entry
+            # points to, left by a crash, are skipped
+            for offset in offsets:
+                start_index = offset - offsets[0]
+                end_index = data.find(b"\n", start_index)
+                events.append(json.loads(data[start_index:end_index if end_index != -1 else len(data)]))
 
-    def get_contract_history(self, contract_id: str) -> List[Dict[str, Any]]:
+        return events
+
+    def _prepare_read(self, contract_id: str) -> str:
+        """Import the legacy history of a contract if any and return its history directory."""
+        if os.path.exists(self._get_contract_history_path(contract_id)):
+            with self._lock(contract_id) as history_dir:
+                self._import_legacy_history(contract_id, history_dir)
+
+        return self._get_contract_history_dir(contract_id)
+
+    def _get_event_count(self, history_dir: str) -> int:
+        segments = self._list_segments(history_dir)
+        if not segments:
+            return 0
+        return segments[-1] + self._count_events(history_dir, segments[-1])
+
+    def get_contract_history(
+            self,
+            contract_id: str,
+            cursor: int = 0,
+            limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Retrieve the event history of a specific contract.
 
         Args:
             contract_id: Unique identifier of the contract
+            cursor: Sequence number of the first event to return
+            limit: Maximum number of events to return, all of them if None
 
         Returns:
-            List[Dict[str, Any]]: List of recorded events
+            List[Dict[str, Any]]: List of recorded events, oldest first. The next page
+            starts at the `seq` of the last event plus one.
         """
-        history_path = self._get_contract_history_path(contract_id)
+        history_dir = self._prepare_read(contract_id)
+        total = self._get_event_count(history_dir)
+        end = total if limit is None else min(total, cursor + limit)
 
-        if not os.path.exists(history_path):
+        if cursor >= end:
             return []
 
-        try:
-            with open(history_path, 'r') as f:
-                history = json.load(f)
-            return history.get("events", [])
-        except:
-            return []
+        return self._read_range(history_dir, cursor, end)
+
+    def get_contract_history_tail(self, contract_id: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Retrieve the most recent events of a specific contract.
+
+        Args:
+            contract_id: Unique identifier of the contract
+            count: Number of events to return
+
+        Returns:
+            List[Dict[str, Any]]: The last `count` events, oldest first
+        """
+        history_dir = self._prepare_read(contract_id)
+        total = self._get_event_count(history_dir)
+
+        return self._read_range(history_dir, max(0, total - count), total)
+
+
+class HistoryWriter:
+    """
+    Background writer batching history events off the request path.
+
+    Events are queued in memory and a daemon thread writes them, grouped by
+    contract, every `batch_size` events or every `flush_interval_ms` milliseconds,
+    whichever comes first.
+    """
+
+    def __init__(self, batch_size: int, flush_interval_ms: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.tracker = HistoryTracker()
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+        # Held to check `running` and queue an event, so that no event is queued
+        # after `stop` has flipped the flag and is about to drain the queue
+        self.running_lock = threading.Lock()
+
+        # Metrics
+        self.metrics_lock = threading.Lock()
+        self.flushed_events = 0
+        self.flushes = 0
+        self.failed_events = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    def start(self) -> None:
+        """Start the background thread."""
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop accepting events, write every queued event and stop the thread."""
+        with self.running_lock:
+            self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        # Events queued while the thread was exiting
+        remaining = []
+        while not self.queue.empty():
+            remaining.append(self.queue.get_nowait())
+        if remaining:
+            self._flush(remaining)
+
+    def enqueue(self, event: Dict[str, Any]) -> bool:
+        """
+        Queue an event to be written.
+
+        Returns:
+            bool: False if the writer is stopped and the event must be written directly
+        """
+        with self.running_lock:
+            if not self.running:
+                return False
+            self.queue.put(event)
+        return True
+
+    def _run(self) -> None:
+        while self.running or not self.queue.empty():
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            # Drain without waiting once stopped
+            if not self.running:
+                while len(batch) < self.batch_size and not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        started = time.perf_counter()
+
+        by_contract: Dict[str, List[Dict[str, Any]]] = {}
+        for event in batch:
+            by_contract.setdefault(event["contract_id"], []).append(event)
+
+        failed = 0
+        for contract_id, events in by_contract.items():
+            try:
+                self.tracker.record_events(contract_id, events)
+            except Exception:
+                logger.exception("Failed to write %d history events of %s", len(events), contract_id)
+                failed += len(events)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        with self.metrics_lock:
+            self.flushes += 1
+            self.flushed_events += len(batch) - failed
+            self.failed_events += failed
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self.total_flush_ms += elapsed_ms
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return the queue depth and flush statistics of the writer."""
+        with self.metrics_lock:
+            return {
+                "running": self.running,
+                "queue_depth": self.queue.qsize(),
+                "flushed_events": self.flushed_events,
+                "failed_events": self.failed_events,
+                "flushes": self.flushes,
+                "last_flush_ms": round(self.last_flush_ms, 3),
+                "max_flush_ms": round(self.max_flush_ms, 3),
+                "avg_flush_ms": round(self.total_flush_ms / self.flushes, 3) if self.flushes else 0.0,
+            }
+
+
+def start_history_writer() -> HistoryWriter:
+    """Start the background history writer used by every HistoryTracker."""
+    global _history_writer
+
+    if _history_writer is None:
+        _history_writer = HistoryWriter(
+            batch_size=settings.HISTORY_BATCH_SIZE,
+            flush_interval_ms=settings.HISTORY_FLUSH_INTERVAL_MS
+        )
+        _history_writer.start()
+    return _history_writer
+
+
+def stop_history_writer() -> None:
+    """Write the queued events and stop the background history writer."""
+    global _history_writer
+
+    writer = _history_writer
+    if writer is not None:
+        writer.stop()
+        _history_writer = None
+
+
+def get_history_writer() -> Optional[HistoryWriter]:
+    """Return the background history writer if it is running."""
+    return _history_writer
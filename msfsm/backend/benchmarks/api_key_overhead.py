@@ -0,0 +1,95 @@
+"""
+Benchmark of the per-request overhead of API key verification.
+
+Compares the previous implementation, which read the keys file and rewrote it
+to increment the usage count on every request, with the in-memory key index.
+
+Run from the backend directory:
+    python -m benchmarks.api_key_overhead --keys 50 --requests 5000
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi import HTTPException
+
+from app.api_keys.core.config import api_key_settings
+from app.api_keys.dependencies.api_key_checker import verify_api_key
+from app.api_keys.enums.error_codes import ApiKeyErrorCode
+from app.api_keys.repositories import api_key_repository as repo
+from app.api_keys.repositories.api_key_store import api_key_store
+
+
+class FakeRequest:
+    def __init__(self, key: str):
+        self.headers = {api_key_settings.API_KEY_HEADER_NAME: key}
+
+
+def legacy_verify_api_key(request: FakeRequest, path: Path):
+    """Verification as done before the in-memory index: one read and one write per request."""
+    client_key = request.headers.get(api_key_settings.API_KEY_HEADER_NAME)
+
+    with open(path, 'r') as f:
+        keys = json.load(f)
+
+    for key in keys:
+        if key["key"] == client_key:
+            if not key.get("active", True):
+                raise HTTPException(status_code=403, detail=ApiKeyErrorCode.DISABLED)
+            key["usage_count"] = key.get("usage_count", 0) + 1
+            with open(path, 'w') as f:
+                json.dump(keys, f, indent=4)
+            return key
+
+    raise HTTPException(status_code=403, detail=ApiKeyErrorCode.INVALID)
+
+
+def measure(label: str, verify, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        verify()
+    elapsed = time.perf_counter() - start
+    per_request_us = elapsed / requests * 1e6
+    print(f"{label:<12} {requests} requests in {elapsed:.3f}s -> {per_request_us:.1f} us/request")
+    return per_request_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=50, help="Number of API keys in the file")
+    parser.add_argument("--requests", type=int, default=5000, help="Number of verified requests")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "api_keys.json"
+        keys = [
+            {
+                "key": f"sk_{i:032x}",
+                "app_name": f"app {i}",
+                "active": True,
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "usage_count": 0,
+                "usage_limit": None,
+            }
+            for i in range(args.keys)
+        ]
+        path.write_text(json.dumps(keys, indent=4), encoding="utf-8")
+
+        # Look up the last key, the worst case of the previous linear scan
+        request = FakeRequest(keys[-1]["key"])
+
+        before = measure("file", lambda: legacy_verify_api_key(request, path), args.requests)
+
+        repo.DATA_FILE = path
+        api_key_store.invalidate()
+        after = measure("in-memory", lambda: verify_api_key(request), args.requests)
+        api_key_store.flush()
+
+        usage = json.loads(path.read_text(encoding="utf-8"))[-1]["usage_count"]
+        print(f"speedup      x{before / after:.1f} (usage count written: {usage})")
+
+
+if __name__ == "__main__":
+    main()
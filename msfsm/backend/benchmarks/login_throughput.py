@@ -0,0 +1,118 @@
+"""
+Throughput benchmark of the login endpoint.
+
+Compares bcrypt run inline in the request, as before, with bcrypt run in the
+password process pool. A burst of logins is sent while another client calls a
+cheap endpoint, to show how much the logins slow down the rest of the API.
+
+Run from the backend directory:
+    python -m benchmarks.login_throughput --logins 200 --concurrency 20 --rounds 12
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, HTTPException, Response
+
+from app.auth.core import security
+from app.auth.core.config import auth_settings
+from app.auth.api.routes.authentication import router as auth_router
+from app.auth.repositories.user_repository import add_user, get_user_by_email
+from app.auth.schemas.user import User, UserLogin
+
+EMAIL = "bench@localhost.com"
+PASSWORD = "benchmark-password"
+
+
+def create_app(inline: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"status": "ok"}
+
+    if inline:
+        # Login as done before the process pool: bcrypt in the request thread
+        @app.post("/auth/login")
+        def login(credentials: UserLogin, response: Response):
+            user = get_user_by_email(credentials.email)
+            if not user or not security.verify_password(credentials.password, user.hashedPassword):
+                raise HTTPException(status_code=401)
+            return {"email": user.email}
+    else:
+        app.include_router(auth_router)
+
+    return app
+
+
+async def run(app: FastAPI, logins: int, concurrency: int):
+    """Send the logins and, meanwhile, ping requests one after the other."""
+    transport = httpx.ASGITransport(app=app)
+    remaining = iter(range(logins))
+    ping_latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        async def login_worker():
+            for _ in remaining:
+                response = await client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+                if response.status_code != 200:
+                    raise RuntimeError(f"Unexpected status {response.status_code}: {response.text}")
+
+        async def ping_worker(done: asyncio.Event):
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/ping")
+                ping_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        done = asyncio.Event()
+        pinger = asyncio.create_task(ping_worker(done))
+        start = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await pinger
+
+    return logins / elapsed, statistics.median(ping_latencies) * 1000, max(ping_latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200, help="Number of logins per run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Number of concurrent clients")
+    parser.add_argument("--rounds", type=int, default=auth_settings.BCRYPT_ROUNDS, help="bcrypt cost factor")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        auth_settings.USERS_FILE = Path(tmp) / "users.json"
+        security.pwd_context.update(bcrypt__rounds=args.rounds)
+        # Read by the pool processes when they import the auth settings
+        os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+        add_user(User(
+            firstName="Bench",
+            lastName="Mark",
+            email=EMAIL,
+            hashedPassword=security.hash_password(PASSWORD),
+            createdAt="2025-01-01T00:00:00+00:00"
+        ))
+
+        # Start the pool outside of the measure
+        security.get_password_pool().submit(int).result()
+
+        for name, inline in (("inline", True), ("process-pool", False)):
+            throughput, ping_median, ping_max = asyncio.run(run(create_app(inline), args.logins, args.concurrency))
+            print(
+                f"{name:<13} {throughput:>7.1f} logins/s   "
+                f"/ping during the burst: median {ping_median:.1f} ms, max {ping_max:.1f} ms"
+            )
+
+        security.shutdown_password_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Throughput benchmark of the API key middleware.
+
+Compares the previous middleware, built on Starlette's BaseHTTPMiddleware, with
+the pure ASGI implementation. Both wrap the same minimal application and serve
+concurrent requests carrying a valid API key, plus requests to an excluded path.
+
+Run from the backend directory:
+    python -m benchmarks.middleware_throughput --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.exceptions import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api_keys.core.config import api_key_settings
+from app.api_keys.dependencies.api_key_checker import verify_api_key
+from app.api_keys.enums.error_codes import ApiKeyErrorCode
+from app.api_keys.repositories import api_key_repository as repo
+from app.api_keys.repositories.api_key_store import api_key_store
+from app.middleware.api_key import EXCLUDED_PATHS, APIKeyMiddleware
+
+
+class LegacyAPIKeyMiddleware(BaseHTTPMiddleware):
+    """The middleware as written before the pure ASGI implementation."""
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+
+        if any(path.startswith(p) for p in EXCLUDED_PATHS):
+            return await call_next(request)
+
+        try:
+            verify_api_key(request)
+        except HTTPException as e:
+            if isinstance(e.detail, str):
+                code = ApiKeyErrorCode.INVALID
+                if e.status_code == 401:
+                    code = ApiKeyErrorCode.MISSING_HEADER
+                elif e.status_code == 403 and e.detail == ApiKeyErrorCode.DISABLED:
+                    code = ApiKeyErrorCode.DISABLED
+                return JSONResponse(status_code=e.status_code, content={"code": code, "message": str(e.detail)})
+            return JSONResponse(status_code=e.status_code, content=e.detail)
+        except Exception as e:
+            return JSONResponse(status_code=403, content={"code": ApiKeyErrorCode.INVALID, "message": str(e)})
+
+        return await call_next(request)
+
+
+def create_app(middleware_class) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    @app.get("/docs-ping")
+    async def docs_ping():
+        return {"status": "ok"}
+
+    app.add_middleware(middleware_class)
+    return app
+
+
+async def run(app: FastAPI, path: str, headers: dict, requests: int, concurrency: int) -> float:
+    """Send `requests` requests with `concurrency` clients and return the throughput."""
+    transport = httpx.ASGITransport(app=app)
+    remaining = iter(range(requests))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        async def worker():
+            for _ in remaining:
+                response = await client.get(path, headers=headers)
+                if response.status_code != 200:
+                    raise RuntimeError(f"Unexpected status {response.status_code}: {response.text}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return requests / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="Number of requests per run")
+    parser.add_argument("--concurrency", type=int, default=50, help="Number of concurrent clients")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "api_keys.json"
+        key = "sk_" + "0" * 32
+        path.write_text(json.dumps([{
+            "key": key,
+            "app_name": "benchmark",
+            "active": True,
+            "created_at": "2025-01-01T00:00:00+00:00",
+            "usage_count": 0,
+            "usage_limit": None,
+        }]), encoding="utf-8")
+        repo.DATA_FILE = path
+        api_key_store.invalidate()
+
+        headers = {api_key_settings.API_KEY_HEADER_NAME: key}
+        scenarios = [("verified", "/ping", headers), ("excluded", "/docs-ping", {})]
+
+        for label, request_path, request_headers in scenarios:
+            results = {}
+            for name, middleware_class in (("base-http", LegacyAPIKeyMiddleware), ("asgi", APIKeyMiddleware)):
+                app = create_app(middleware_class)
+                results[name] = asyncio.run(run(app, request_path, request_headers, args.requests, args.concurrency))
+                print(f"{label:<9} {name:<10} {results[name]:>8.0f} requests/s")
+            print(f"{label:<9} speedup    x{results['asgi'] / results['base-http']:.2f}")
+
+        api_key_store.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Cold-start benchmark of the API and the CLI.
+
+Measures, in fresh processes, the time until `uvicorn app.main:app` answers
+HTTP requests and the time taken by `python -m app.cli.main --help`, and
+compares the median of each with its budget. The processes run in a temporary
+working directory so that the bootstrap does not write to the local data files.
+
+Run from the backend directory:
+    python -m benchmarks.startup_time --runs 5
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+# Target budgets in seconds
+API_READY_BUDGET = 2.0
+CLI_HELP_BUDGET = 0.75
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_api_ready(cwd: str, env: dict, timeout: float = 30.0) -> float:
+    """Start uvicorn and return the seconds until the OpenAPI document is served."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/openapi.json"
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=cwd,
+        env=env
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError(f"API not ready after {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def measure_cli_help(cwd: str, env: dict) -> float:
+    """Return the seconds taken by `python -m app.cli.main --help`."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "app.cli.main", "--help"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=cwd,
+        env=env,
+        check=True
+    )
+    return time.perf_counter() - start
+
+
+def report(label: str, samples: list, budget: float) -> bool:
+    median = statistics.median(samples)
+    within = median <= budget
+    print(
+        f"{label:<10} median {median:.2f}s  min {min(samples):.2f}s  max {max(samples):.2f}s  "
+        f"budget {budget:.2f}s  {'OK' if within else 'OVER BUDGET'}"
+    )
+    return within
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts measured for each target")
+    args = parser.parse_args()
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [backend_dir, os.environ.get("PYTHONPATH")]))}
+
+    with tempfile.TemporaryDirectory() as cwd:
+        # Mounted as static files when the app is imported
+        os.makedirs(os.path.join(cwd, "data", "users", "profile"))
+
+        api = [measure_api_ready(cwd, env) for _ in range(args.runs)]
+        cli = [measure_cli_help(cwd, env) for _ in range(args.runs)]
+
+    within = report("api ready", api, API_READY_BUDGET)
+    within = report("cli help", cli, CLI_HELP_BUDGET) and within
+
+    sys.exit(0 if within else 1)
+
+
+if __name__ == "__main__":
+    main()
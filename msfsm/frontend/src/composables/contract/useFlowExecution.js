@@ -33,11 +33,16 @@ export function useFlowExecution(contractId) {
     
     const updatedStates = [];
     
+    // Statut de tous les automates en un seul appel
+    const status = await smartContractStore.fetchContractStatus(contractName);
+    
     for (const state of flowData.states) {
       const { automateId, automataKey } = state;
       
       // Vérifier si terminé
-      const isCompleted = await checkAutomateCompletion(contractName, automataKey);
+      const isCompleted = status.success
+        ? status.data[automataKey]?.is_completed === true
+        : await checkAutomateCompletion(contractName, automataKey);
       
       let executionStatus = 'pending';
       
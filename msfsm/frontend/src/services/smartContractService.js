@@ -7,19 +7,57 @@ import apiClient from './api.config';
 const smartContractService = {
   /**
    * Déploie un contrat sur la blockchain.
+   * Le déploiement s'exécute en arrière-plan : le job est interrogé jusqu'à sa fin.
    * @param {Object} specificationModel - Spécification du contrat au format API
+   * @param {Function} onProgress - Appelée avec le job à chaque interrogation (optionnel)
    * @returns {Promise<Object>} Résultat du déploiement
    * @throws {Error} Erreur en cas d'échec
    */
-  async deployContract(specificationModel) {
+  async deployContract(specificationModel, onProgress = null) {
     try {
       const response = await apiClient.post('/smart-contracts/deploy', specificationModel);
+      return await this.waitForDeployJob(response.data.id, onProgress);
+    } catch (error) {
+      throw error;
+    }
+  },
+
+  /**
+   * Récupère l'état d'un job de déploiement.
+   * @param {string} jobId - Identifiant du job
+   * @returns {Promise<Object>} Job de déploiement (statut et étape de chaque automate)
+   * @throws {Error} Erreur en cas d'échec
+   */
+  async getDeployJob(jobId) {
+    try {
+      const response = await apiClient.get(`/smart-contracts/jobs/${jobId}`);
       return response.data;
     } catch (error) {
       throw error;
     }
   },
 
+  /**
+   * Attend la fin d'un job de déploiement en l'interrogeant régulièrement.
+   * @param {string} jobId - Identifiant du job
+   * @param {Function} onProgress - Appelée avec le job à chaque interrogation (optionnel)
+   * @param {number} interval - Délai entre deux interrogations en millisecondes
+   * @returns {Promise<Object>} Contrat déployé
+   * @throws {Error} Erreur si le déploiement échoue
+   */
+  async waitForDeployJob(jobId, onProgress = null, interval = 1000) {
+    for (;;) {
+      const job = await this.getDeployJob(jobId);
+
+      if (onProgress) onProgress(job);
+
+      if (job.status === 'completed') return job.result;
+      if (job.status === 'failed') throw new Error(job.error || 'Échec du déploiement');
+
+      await new Promise(resolve => setTimeout(resolve, interval));
+    }
+  },
+
   /**
    * Exécute une fonction sur un contrat déployé.
    * @param {string} contractName - Nom du contrat
@@ -58,6 +96,22 @@ const smartContractService = {
     }
   },
 
+  /**
+   * Récupère l'état courant et la complétion de tous les automates d'un contrat déployé
+   * en un seul appel agrégé à la blockchain.
+   * @param {string} contractName - Nom du contrat
+   * @returns {Promise<Object>} Statut de chaque automate ({ get_current_state, is_completed })
+   * @throws {Error} Erreur en cas d'échec
+   */
+  async getContractStatus(contractName) {
+    try {
+      const response = await apiClient.get(`/smart-contracts/${contractName}/status`);
+      return response.data;
+    } catch (error) {
+      throw error;
+    }
+  },
+
   /**
    * Récupère tous les contrats déployés.
    * @returns {Promise<Array>} Liste des contrats déployés
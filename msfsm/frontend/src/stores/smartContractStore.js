@@ -200,6 +200,30 @@ async deployContract(specificationModel) {
       },
       
 
+    /**
+     * Récupère le statut de tous les automates d'un contrat déployé.
+     * @param {string} contractName - Nom du contrat
+     * @returns {Promise<Object>} Statut de chaque automate
+     */
+    async fetchContractStatus(contractName) {
+        try {
+          const result = await smartContractService.getContractStatus(contractName);
+      
+          return {
+            success: true,
+            data: result
+          };
+        } catch (error) {
+          const errorMessage =
+            error.response?.data?.message || error.message || 'Erreur réseau lors de la récupération du statut.';
+      
+          return {
+            success: false,
+            error: errorMessage
+          };
+        }
+      },
+
     /**
      * Récupère tous les contrats déployés.
      * @returns {Promise<Object>} Liste des contrats déployés
@@ -0,0 +1,134 @@
+"""
+Benchmark of the Solidity code generation of large automata.
+
+Compares the previous string concatenation, where every fragment was appended to
+the code of the automaton with `+=`, with the buffer-based emitter that joins the
+fragments once and records their origin.
+
+Run from the library directory:
+    python -m benchmarks.generator_emitter --transitions 1000 2000 5000 10000
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from msfsm.solidity import generator
+from msfsm.solidity.config import ConfigEthereum, EthereumPlatform
+from msfsm.solidity.generation_cache import GenerationCache
+
+PACKAGES_PATH = ["./tests/data/p1.json", "./tests/data/p2.json"]
+
+
+class ConcatEmitter:
+    """Emitter appending every fragment to a single string, as done before the emitter."""
+
+    def __init__(self):
+        self.code = ""
+
+    def emit(self, code, origin=None):
+        self.code += code
+
+    @contextmanager
+    def origin(self, origin):
+        yield
+
+    def getvalue(self):
+        return self.code
+
+    @property
+    def source_map(self):
+        return []
+
+
+def make_specification(path: Path, transitions: int) -> None:
+    """Write a specification with one automaton of `transitions` transitions."""
+    random.seed(transitions)
+    states = [f"q{i}" for i in range(max(transitions // 10, 2))] + ["completed"]
+    conditions = ["package__p1__c1", "package__p1__c2", "package__p2__c1", ""]
+
+    path.write_text(json.dumps({
+        "name": "Benchmark",
+        "required_packages": ["p1", "p2"],
+        "automatons": {
+            "Automata0": {
+                "states": states,
+                "transitions": [
+                    {
+                        "source": random.choice(states),
+                        "destination": random.choice(states),
+                        "trigger": f"t{i // 2}",
+                        "conditions": random.sample(conditions, 2),
+                    }
+                    for i in range(transitions)
+                ],
+            }
+        },
+    }))
+
+
+def measure(specification_path: Path, concat: bool, runs: int) -> tuple[float, str]:
+    config = ConfigEthereum(
+        target="ethereum",
+        platform=EthereumPlatform(
+            sol_version="0.8.0",
+            provider_url="http://localhost:8545",
+            chain_id=31337,
+            pub_key="0x0",
+            priv_key="0x0",
+        ),
+    )
+    best = float("inf")
+    emitter_class = generator.CodeEmitter
+
+    for _ in range(runs):
+        # The generation cache is disabled so that every run generates the code
+        solidity_generator = generator.GeneratorSolidity(
+            specification_path=str(specification_path),
+            packages_path=PACKAGES_PATH,
+            config=config,
+            generation_cache=GenerationCache(max_entries=0),
+        )
+
+        generator.CodeEmitter = ConcatEmitter if concat else emitter_class
+        try:
+            start = time.perf_counter()
+            solidity_generator.generate("Automata0")
+            best = min(best, time.perf_counter() - start)
+        finally:
+            generator.CodeEmitter = emitter_class
+
+    return best, solidity_generator.result["Automata0"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--transitions", type=int, nargs="+", default=[1000, 2000, 5000, 10000],
+                        help="Numbers of transitions of the generated automaton")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per measurement, the best one is kept")
+    args = parser.parse_args()
+
+    # The compiler is not used by the generation
+    generator.install_solc = lambda version: None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for transitions in args.transitions:
+            path = Path(tmp) / f"spec_{transitions}.json"
+            make_specification(path, transitions)
+
+            concat_time, concat_code = measure(path, concat=True, runs=args.runs)
+            emitter_time, emitter_code = measure(path, concat=False, runs=args.runs)
+            assert concat_code == emitter_code, "The emitter changed the generated code"
+
+            print(
+                f"{transitions:>6} transitions ({len(emitter_code) / 1e6:.1f} MB): "
+                f"concatenation {concat_time * 1e3:8.1f} ms, emitter {emitter_time * 1e3:8.1f} ms "
+                f"({concat_time / emitter_time:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
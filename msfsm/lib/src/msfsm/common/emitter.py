@@ -0,0 +1,166 @@
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+# Kinds of specification or package elements generated code comes from
+ORIGIN_AUTOMATON = "automaton"
+ORIGIN_TRIGGER = "trigger"
+ORIGIN_TRANSITION = "transition"
+ORIGIN_CONDITION = "condition"
+ORIGIN_PACKAGE_FUNCTION = "package_function"
+ORIGIN_PACKAGE_STRUCT = "package_struct"
+ORIGIN_PACKAGE_VARIABLE = "package_variable"
+
+
+class SourceOrigin(NamedTuple):
+    """
+    Element of the specification or of a package a fragment of generated code comes from.
+    Args:
+        kind (str): Kind of the element (automaton, trigger, transition, condition,
+            package_function, package_struct or package_variable).
+        name (str): Name of the automaton, trigger, condition or package.
+        detail (Union[str, int, None]): Index of the transition in the automaton, or name
+            of the function, struct or variable in the package.
+    """
+
+    kind: str
+    name: str
+    detail: Union[str, int, None] = None
+
+    def describe(self) -> str:
+        """
+        Returns a readable description of the origin.
+        Returns:
+            str: The description, e.g. "transition a #2" or "package_function p1.c1".
+        """
+        if self.detail is None:
+            return f"{self.kind} {self.name}"
+        if isinstance(self.detail, int):
+            return f"{self.kind} {self.name} #{self.detail}"
+        return f"{self.kind} {self.name}.{self.detail}"
+
+
+class CodeEmitter:
+    """
+    Buffer of generated code fragments, joined once, with the origin of every fragment.
+    The source map is a list of (start, end, origin) spans over the character offsets of
+    the joined code, consecutive fragments of the same origin being merged in one span.
+    The generated code is a single line, so errors are mapped from offsets rather than
+    from line and column numbers.
+    """
+
+    def __init__(self):
+        self.fragments: List[str] = []
+        self.length: int = 0
+        self.current_origin: Optional[SourceOrigin] = None
+        self._starts: List[int] = []
+        self._origins: List[Optional[SourceOrigin]] = []
+        self._code: Optional[str] = None
+
+    @classmethod
+    def from_source_map(
+        cls, code: str, source_map: List[Tuple[int, int, Optional[SourceOrigin]]]
+    ) -> "CodeEmitter":
+        """
+        Creates an emitter holding already generated code and its source map.
+        Args:
+            code (str): The generated code.
+            source_map (List[Tuple[int, int, Optional[SourceOrigin]]]): Spans returned by `source_map`.
+        Returns:
+            CodeEmitter: The emitter, on which more code can be emitted.
+        """
+        emitter = cls()
+        emitter.fragments = [code] if code else []
+        emitter.length = len(code)
+        emitter._starts = [start for start, _, _ in source_map]
+        emitter._origins = [origin for _, _, origin in source_map]
+        emitter._code = code
+        return emitter
+
+    def __len__(self) -> int:
+        return self.length
+
+    def emit(self, code: str, origin: Optional[SourceOrigin] = None) -> None:
+        """
+        Appends a fragment of code.
+        Args:
+            code (str): The fragment to append.
+            origin (SourceOrigin): Origin of the fragment, defaults to the origin of the
+                enclosing `origin` block.
+        """
+        if not code:
+            return
+
+        if origin is None:
+            origin = self.current_origin
+        if not self._origins or self._origins[-1] != origin:
+            self._starts.append(self.length)
+            self._origins.append(origin)
+
+        self.fragments.append(code)
+        self.length += len(code)
+        self._code = None
+
+    @contextmanager
+    def origin(self, origin: SourceOrigin) -> Iterator[None]:
+        """
+        Context manager giving an origin to the fragments emitted without one inside it.
+        Args:
+            origin (SourceOrigin): Origin of the fragments.
+        """
+        previous = self.current_origin
+        self.current_origin = origin
+        try:
+            yield
+        finally:
+            self.current_origin = previous
+
+    def getvalue(self) -> str:
+        """
+        Returns the generated code, joining the fragments on the first call.
+        Returns:
+            str: The generated code.
+        """
+        if self._code is None:
+            self._code = "".join(self.fragments)
+            self.fragments = [self._code]
+        return self._code
+
+    @property
+    def source_map(self) -> List[Tuple[int, int, Optional[SourceOrigin]]]:
+        """
+        Returns the spans of the generated code and their origin.
+        Returns:
+            List[Tuple[int, int, Optional[SourceOrigin]]]: Start offset, end offset and origin of each span.
+        """
+        ends = self._starts[1:] + [self.length]
+        return list(zip(self._starts, ends, self._origins))
+
+    def origin_at(self, offset: int) -> Optional[SourceOrigin]:
+        """
+        Returns the origin of the character at the given offset of the generated code.
+        Args:
+            offset (int): Character offset in the generated code.
+        Returns:
+            Optional[SourceOrigin]: The origin, or None if the offset is out of the code or has no origin.
+        """
+        if offset < 0 or offset >= self.length:
+            return None
+        return self._origins[bisect_right(self._starts, offset) - 1]
+
+    def origin_at_byte(self, offset: int) -> Optional[SourceOrigin]:
+        """
+        Returns the origin of the character at the given byte offset of the UTF-8 encoded
+        generated code, as reported by solc in source locations.
+        Args:
+            offset (int): Byte offset in the UTF-8 encoded generated code.
+        Returns:
+            Optional[SourceOrigin]: The origin, or None if the offset is out of the code or has no origin.
+        """
+        if offset < 0:
+            return None
+        # A partial character is dropped, so an offset inside a character maps to it
+        encoded = self.getvalue().encode("utf-8")[:offset]
+        if len(encoded) < offset:
+            return None
+        return self.origin_at(len(encoded.decode("utf-8", errors="ignore")))
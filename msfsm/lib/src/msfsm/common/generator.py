@@ -1,5 +1,5 @@
 from msfsm.common.config import Config
-from msfsm.common.package import Package
+from msfsm.common.package import PackageIndex, get_default_package_index
 from msfsm.common.specification import Specification
 from typing import List
 
@@ -12,6 +12,7 @@ class Generator:
         specification_path (str): Path to the MSFSM specification file
         packages_path (List[str]): List of paths to the package files
         config (ConfigGenerator): Configuration object for the generator
+        package_index (PackageIndex): Index of the package files, defaults to the process-wide index
     """
 
     def __init__(
@@ -19,8 +20,10 @@ class Generator:
         specification_path: str = None,
         specification_obj: dict = None,
         packages_path: List[str] = [],
-        config: Config = None
+        config: Config = None,
+        package_index: PackageIndex = None,
     ):
+        self.package_index = package_index if package_index is not None else get_default_package_index()
         self.specification = self.load_specification(specification_path=specification_path, specification_obj=specification_obj)
         self.packages = self.load_packages(packages_path)
 
@@ -40,18 +43,21 @@ class Generator:
         else:
             raise ValueError("Either specification_path or specification_obj must be provided.")
 
-    def load_packages(self, packages_path: List[str]) -> None:
+    def load_packages(self, packages_path: List[str]) -> dict:
         """
-        Load packages from the given paths.
+        Load the packages referenced by the conditions of the specification, and the
+        packages with default functions, from the given paths.
+        The other package files are indexed but not parsed, and loaded packages are
+        reused from the package index until their file changes.
         Args:
             packages_path (List[str]): List of paths to the package files
         Returns:
             packages (dict): Dictionary of loaded packages
         """
-        packages = {}
+        used_packages = [
+            package_name
+            for package_names in self.specification.used_packages.values()
+            for package_name in package_names
+        ]
 
-        for path in packages_path:
-            package = Package().load(path)
-            packages[package.data.name] = package
-
-        return packages
\ No newline at end of file
+        return self.package_index.load(packages_path, used_packages)
\ No newline at end of file
@@ -1,4 +1,21 @@
-from collections import defaultdict, deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Node states of the depth-first traversal
+_UNVISITED = 0
+_ON_PATH = 1
+_DONE = 2
+
+
+class CyclicGraphError(ValueError):
+    """
+    Error raised when a graph expected to be acyclic contains a cycle.
+    Args:
+        cycle (Sequence): Nodes of the cycle, the first node being repeated at the end.
+    """
+
+    def __init__(self, cycle: Sequence):
+        self.cycle = list(cycle)
+        super().__init__("The graph is cyclic: " + " -> ".join(str(node) for node in self.cycle))
 
 
 class Graph:
@@ -11,78 +28,85 @@ class Graph:
     def __init__(self, graph):
         self.graph = graph
 
-    def is_cyclic(self) -> bool:
+    def _compute_depths(self) -> Tuple[Optional[List[int]], Optional[List[int]]]:
         """
-        Check if the graph contains a cycle using Kahn's algorithm.
+        Compute the depth of every node and detect cycles in one iterative depth-first traversal.
+        The depth of a node without successors is 1, the depth of any other node is one more
+        than the largest depth of its successors.
         Returns:
-            bool: True if the graph is cyclic, False otherwise.
+            Tuple[Optional[List[int]], Optional[List[int]]]: The depth of each node and None,
+            or None and the nodes of a cycle if the graph is cyclic.
         """
-        V = len(self.graph)
-
-        in_degree = [0] * V
-
-        q = deque()
-        visited = 0
-
-        for u in range(V):
-            for v in self.graph[u]:
-                in_degree[v] += 1
-
-        for u in range(V):
-            if in_degree[u] == 0:
-                q.append(u)
-
-        while q:
-            u = q.popleft()
-            visited += 1
-
-            for v in self.graph[u]:
-                in_degree[v] -= 1
-
-                if in_degree[v] == 0:
-                    q.append(v)
-
-        return visited != V
-
-    def _group_keys_by_value(self, input_dict: dict) -> dict:
+        graph = self.graph
+        V = len(graph)
+
+        depth = [0] * V
+        state = bytearray(V)
+
+        for root in range(V):
+            if state[root] != _UNVISITED:
+                continue
+
+            # Current path of the traversal, and the index of the next successor to visit
+            path = [root]
+            next_index = [0]
+            state[root] = _ON_PATH
+
+            while path:
+                node = path[-1]
+                successors = graph[node]
+                i = next_index[-1]
+
+                if i < len(successors):
+                    next_index[-1] = i + 1
+                    successor = successors[i]
+
+                    if state[successor] == _UNVISITED:
+                        state[successor] = _ON_PATH
+                        path.append(successor)
+                        next_index.append(0)
+                    elif state[successor] == _ON_PATH:
+                        return None, path[path.index(successor):] + [successor]
+                else:
+                    depth[node] = max((depth[s] for s in successors), default=0) + 1
+                    state[node] = _DONE
+                    path.pop()
+                    next_index.pop()
+
+        return depth, None
+
+    def find_cycle(self) -> Optional[List[int]]:
         """
-        Group dictionary keys by their values.
-        Args:
-            input_dict (dict): Dictionary to group.
+        Find a cycle in the graph.
         Returns:
-            dict: Dictionary with values as keys and lists of keys as values.
+            Optional[List[int]]: Nodes of a cycle, the first node being repeated at the end,
+            or None if the graph is acyclic.
         """
-        grouped = defaultdict(list)
+        return self._compute_depths()[1]
 
-        for key, value in input_dict.items():
-            grouped[value].append(key)
-
-        return dict(grouped)
-
-    def get_depths(self) -> dict:
+    def is_cyclic(self) -> bool:
         """
-        Get the depth of each node in the graph.
+        Check if the graph contains a cycle.
         Returns:
-            dict: Dictionary with node indices as keys and their depths as values.
+            bool: True if the graph is cyclic, False otherwise.
         """
-        if self.is_cyclic():
-            raise ValueError("The graph is cyclic")
-
-        depth = defaultdict(lambda: -1)
-
-        def dfs(node):
-            if depth[node] != -1:
-                return depth[node]
-
-            max_depth = 0
-            for neighbor in self.graph[node]:
-                max_depth = max(max_depth, dfs(neighbor))
+        return self.find_cycle() is not None
 
-            depth[node] = max_depth + 1
-            return depth[node]
+    def get_depths(self) -> Dict[int, List[int]]:
+        """
+        Get the nodes of the graph grouped by depth.
+        Returns:
+            Dict[int, List[int]]: Dictionary with depths as keys, in increasing order, and the
+            indices of the nodes at that depth, in increasing order, as values.
+        Raises:
+            CyclicGraphError: If the graph is cyclic, with the nodes of a cycle.
+        """
+        depth, cycle = self._compute_depths()
+        if cycle is not None:
+            raise CyclicGraphError(cycle)
 
-        for node in range(len(self.graph)):
-            if depth[node] == -1:
-                dfs(node)
+        grouped: Dict[int, List[int]] = {d: [] for d in sorted(set(depth))}
+        for node, d in enumerate(depth):
+            grouped[d].append(node)
 
-        return self._group_keys_by_value(depth)
+        return grouped
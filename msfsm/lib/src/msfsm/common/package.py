@@ -1,6 +1,8 @@
 import json
 import logging
-from typing import Dict, List, Optional
+import os
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 from pydantic import BaseModel, ValidationError
 
 logging.basicConfig(level=logging.INFO)
@@ -57,4 +59,134 @@ class Package:
             raise ve
         except Exception as e:
             logger.error("Failed to load package: %s", e)
-            raise e
\ No newline at end of file
+            raise e
+
+
+class PackageIndexEntry(NamedTuple):
+    path: str
+    mtime_ns: int
+    size: int
+    has_default_functions: bool
+
+
+class PackageIndex:
+    """
+    Index of package files by package name.
+    Indexing a file only reads its name and whether it has default functions; the file is
+    indexed again when its modification time or size changes. Packages are parsed and
+    validated when first loaded, and kept until their file changes.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, Tuple[Optional[str], PackageIndexEntry]] = {}
+        self.packages: Dict[str, Tuple[PackageIndexEntry, Package]] = {}
+        self._lock = threading.Lock()
+
+    def _index_file(self, path: str) -> Optional[Tuple[Optional[str], PackageIndexEntry]]:
+        """
+        Index a package file if it changed since it was last indexed. Must hold the lock.
+        Returns:
+            tuple: Name of the package and its index entry, or None if the file cannot be read.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            logger.warning("Package file %s not indexed: %s", path, e)
+            self.entries.pop(path, None)
+            return None
+
+        indexed = self.entries.get(path)
+        if indexed is not None and (indexed[1].mtime_ns, indexed[1].size) == (stat.st_mtime_ns, stat.st_size):
+            return indexed
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            has_default_functions = any(
+                f.get("default") for f in data.get("functions", {}).values()
+            )
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Package file %s not indexed: %s", path, e)
+            self.entries.pop(path, None)
+            return None
+
+        indexed = (
+            data.get("name"),
+            PackageIndexEntry(path, stat.st_mtime_ns, stat.st_size, has_default_functions),
+        )
+        self.entries[path] = indexed
+        return indexed
+
+    def refresh(self, paths: List[str]) -> Dict[Optional[str], PackageIndexEntry]:
+        """
+        Index the given package files again if they changed.
+        Args:
+            paths (List[str]): Paths to the package files.
+        Returns:
+            dict: Index entry of each package, by package name, in the order of the paths.
+            When several files have the same package name, the last one is used.
+        """
+        index = {}
+
+        with self._lock:
+            for path in paths:
+                indexed = self._index_file(path)
+                if indexed is not None:
+                    index[indexed[0]] = indexed[1]
+
+        return index
+
+    def get_package(self, entry: PackageIndexEntry) -> Package:
+        """
+        Get the package of an index entry, loading it if it was not loaded since its file changed.
+        Args:
+            entry (PackageIndexEntry): Index entry returned by `refresh`.
+        Returns:
+            Package: The loaded package.
+        """
+        with self._lock:
+            cached = self.packages.get(entry.path)
+            if cached is not None and cached[0] == entry:
+                return cached[1]
+
+        package = Package().load(entry.path)
+
+        with self._lock:
+            self.packages[entry.path] = (entry, package)
+
+        return package
+
+    def load(self, paths: List[str], package_names: Iterable[str]) -> Dict[str, Package]:
+        """
+        Load the given packages and the packages with default functions from the given files.
+        Args:
+            paths (List[str]): Paths to the package files.
+            package_names (Iterable[str]): Names of the packages to load.
+        Returns:
+            dict: Loaded packages, by package name, in the order of the paths.
+        """
+        package_names = set(package_names)
+
+        return {
+            name: self.get_package(entry)
+            for name, entry in self.refresh(paths).items()
+            if name in package_names or entry.has_default_functions
+        }
+
+
+_default_index: Optional[PackageIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_package_index() -> PackageIndex:
+    """
+    Get the process-wide package index used when no index is given to the generator.
+    Returns:
+        PackageIndex: The default package index
+    """
+    global _default_index
+
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = PackageIndex()
+        return _default_index
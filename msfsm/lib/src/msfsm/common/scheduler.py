@@ -0,0 +1,77 @@
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List
+
+
+class DagScheduler:
+    """
+    Class to run a task for every node of a dependency graph.
+    Each node starts as soon as all the nodes it depends on are finished, so
+    independent branches of the graph run at the same time.
+    Args:
+        graph (List[List[int]]): Adjacency list, graph[u] lists the nodes u depends on.
+        max_workers (int): Maximum number of tasks running at the same time.
+    """
+
+    def __init__(self, graph: List[List[int]], max_workers: int = 8):
+        self.graph = graph
+        self.max_workers = max_workers
+        self.timings: Dict[int, Dict[str, float]] = {}
+
+    def run(self, task: Callable[[int], Any]) -> Dict[int, Any]:
+        """
+        Run the task for every node of the graph, respecting the dependencies.
+        The start and finish times of each node are recorded in `timings`.
+        Args:
+            task (Callable[[int], Any]): Function called with the index of the node.
+        Returns:
+            Dict[int, Any]: Return value of the task for each node.
+        """
+        V = len(self.graph)
+
+        dependencies = [set(self.graph[u]) for u in range(V)]
+        dependents = [[] for _ in range(V)]
+        remaining = [len(dependencies[u]) for u in range(V)]
+
+        for u in range(V):
+            for v in dependencies[u]:
+                dependents[v].append(u)
+
+        results = {}
+        self.timings = {}
+
+        def _run_node(node: int) -> Any:
+            self.timings[node] = {"started_at": time.time()}
+            try:
+                return task(node)
+            finally:
+                self.timings[node]["finished_at"] = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {
+                executor.submit(_run_node, u): u for u in range(V) if remaining[u] == 0
+            }
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    node = running.pop(future)
+
+                    try:
+                        results[node] = future.result()
+                    except Exception:
+                        for pending in running:
+                            pending.cancel()
+                        raise
+
+                    for dependent in dependents[node]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            running[executor.submit(_run_node, dependent)] = dependent
+
+        if len(results) != V:
+            raise ValueError("The graph is cyclic")
+
+        return results
@@ -1,7 +1,7 @@
 import json
 
-from typing import List, Dict, Tuple
-from msfsm.common.graph import Graph
+from typing import List, Dict, NamedTuple, Tuple
+from msfsm.common.graph import CyclicGraphError, Graph
 from pydantic import BaseModel
 
 from msfsm.common.package import Package
@@ -28,6 +28,97 @@ class SpecificationModel(BaseModel):
     required_packages: List[str]
 
 
+class ParsedCondition(NamedTuple):
+    type: str
+    package: str
+    function: str
+
+
+def parse_condition(condition: str) -> ParsedCondition:
+    """
+    Split a condition such as `package__p1__c1` into its type, package (or automaton) and function.
+    Args:
+        condition (str): The condition string.
+    Returns:
+        ParsedCondition: The type, package and function of the condition.
+    """
+    parts = condition.split(CONDITION_SEPARATOR)
+    if len(parts) < 3:
+        raise ValueError(f"Invalid condition: {condition}")
+    return ParsedCondition(parts[0], parts[1], parts[2])
+
+
+class CompiledAutomaton:
+    """
+    Index of an automaton built in a single pass over its transitions.
+    Args:
+        automaton (AutomatonModel): The automaton to index.
+    Attributes:
+        transitions_by_trigger (Dict[str, List[TransitionModel]]): Transitions of each trigger,
+            triggers in order of first appearance.
+        transition_indexes_by_trigger (Dict[str, List[int]]): Indexes in the automaton of the
+            transitions of each trigger.
+        conditions_by_trigger (Dict[str, List[str]]): Unique non-empty conditions of each trigger,
+            in order of first appearance.
+        conditions (Dict[str, ParsedCondition]): Every condition of the automaton, parsed.
+        used_packages (List[str]): Unique packages used in the conditions, in order of first appearance.
+        dependencies (List[str]): Sorted names of the automata used in the conditions.
+    """
+
+    def __init__(self, automaton: AutomatonModel):
+        self.transitions_by_trigger: Dict[str, List[TransitionModel]] = {}
+        self.transition_indexes_by_trigger: Dict[str, List[int]] = {}
+        self.conditions_by_trigger: Dict[str, List[str]] = {}
+        self.conditions: Dict[str, ParsedCondition] = {}
+
+        used_packages = {}
+        dependencies = set()
+        trigger_conditions: Dict[str, Dict[str, None]] = {}
+
+        for index, transition in enumerate(automaton.transitions):
+            self.transitions_by_trigger.setdefault(transition.trigger, []).append(transition)
+            self.transition_indexes_by_trigger.setdefault(transition.trigger, []).append(index)
+            unique_conditions = trigger_conditions.setdefault(transition.trigger, {})
+
+            for condition in transition.conditions:
+                if not condition:
+                    continue
+                unique_conditions[condition] = None
+
+                if condition in self.conditions:
+                    continue
+                parsed = parse_condition(condition)
+                self.conditions[condition] = parsed
+
+                if parsed.type == "package":
+                    used_packages[parsed.package] = None
+                elif parsed.type == "automata":
+                    dependencies.add(parsed.package)
+
+        self.conditions_by_trigger = {
+            trigger: list(conditions) for trigger, conditions in trigger_conditions.items()
+        }
+        self.used_packages: List[str] = list(used_packages)
+        self.dependencies: List[str] = sorted(dependencies)
+
+
+class CompiledSpecification:
+    """
+    Index of a specification used by the code generators, built once so that generating
+    an automaton takes time linear in the size of its transitions.
+    Args:
+        specification (Specification): The loaded specification.
+    Attributes:
+        automatons (Dict[str, CompiledAutomaton]): Index of each automaton, by name.
+    """
+
+    def __init__(self, specification: "Specification"):
+        self.automatons: Dict[str, CompiledAutomaton] = {
+            name: CompiledAutomaton(automaton)
+            for name, automaton in specification.data.automatons.items()
+        }
+
+
 class Specification:
     """
     Specification class for loading and managing MSFSM specifications.
@@ -120,7 +211,13 @@ class Specification:
         Returns:
             Tuple[Dict[str, int], Dict[int, List[int]]]: A tuple containing a dictionary of automaton names to indices
             and a list of lists representing the graph.
+        Raises:
+            CyclicGraphError: If the automatons depend on each other in a cycle, with the automaton names of the cycle.
         """
         graph = self.get_dependency_graph()
 
-        return Graph(graph).get_depths()
+        try:
+            return Graph(graph).get_depths()
+        except CyclicGraphError as e:
+            names = list(self.data.automatons.keys())
+            raise CyclicGraphError([names[node] for node in e.cycle]) from None
@@ -0,0 +1,249 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from typing import Optional, Tuple
+
+
+logging.basicConfig(
+    level=logging.INFO,
+)
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "msfsm", "solc")
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # 64 MiB
+CACHE_ENTRY_EXTENSION = ".json"
+
+
+def get_cache_size(path: str, extension: str = CACHE_ENTRY_EXTENSION) -> int:
+    """
+    Get the total size of the entries of a cache directory.
+    Args:
+        path (str): Directory where the cache entries are stored
+        extension (str): Extension of the cache entry files
+    Returns:
+        int: Total size of the cache entries in bytes
+    """
+    total_size = 0
+
+    for filename in os.listdir(path):
+        if not filename.endswith(extension):
+            continue
+        try:
+            total_size += os.stat(os.path.join(path, filename)).st_size
+        except OSError:
+            continue
+
+    return total_size
+
+
+def evict_lru_entries(path: str, max_size: int, extension: str = CACHE_ENTRY_EXTENSION) -> int:
+    """
+    Remove the least recently used entries of a cache directory until it fits in its size cap.
+    The modification time of an entry is its last access time.
+    Args:
+        path (str): Directory where the cache entries are stored
+        max_size (int): Maximum total size of the cache entries in bytes
+        extension (str): Extension of the cache entry files
+    Returns:
+        int: Total size of the remaining cache entries in bytes
+    """
+    entries = []
+    total_size = 0
+
+    for filename in os.listdir(path):
+        if not filename.endswith(extension):
+            continue
+        try:
+            stat = os.stat(os.path.join(path, filename))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, filename))
+        total_size += stat.st_size
+
+    if total_size <= max_size:
+        return total_size
+
+    for _, size, filename in sorted(entries):
+        try:
+            os.remove(os.path.join(path, filename))
+        except OSError:
+            continue
+        total_size -= size
+        if total_size <= max_size:
+            break
+
+    return total_size
+
+
+class CompilationCache:
+    """
+    Content-addressed on-disk cache for compilation outputs.
+    Entries are keyed by a hash of the contract name, the source code, the solc version
+    and the compiler settings, and hold the ABI and bytecode of the contract.
+    The least recently used entries are evicted once the cache exceeds its size cap. The
+    total size is scanned once when the cache is created and then kept up to date by the
+    writes, so the directory is only scanned again when the cap is exceeded.
+    Args:
+        path (str): Directory where the cache entries are stored
+        max_size (int): Maximum total size of the cache entries in bytes
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.path, exist_ok=True)
+        self._size = get_cache_size(self.path)
+
+    @staticmethod
+    def make_key(
+        contract_name: str, contract_code: str, sol_version: str, settings: dict
+    ) -> str:
+        """
+        Compute the cache key of a compilation.
+        Args:
+            contract_name (str): Name of the contract
+            contract_code (str): Solidity code of the contract
+            sol_version (str): Version of solc used for the compilation
+            settings (dict): Compiler settings of the standard JSON input
+        Returns:
+            str: Hexadecimal SHA-256 digest identifying the compilation
+        """
+        payload = json.dumps(
+            {
+                "contract_name": contract_name,
+                "contract_code": contract_code,
+                "sol_version": sol_version,
+                "settings": settings,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}{CACHE_ENTRY_EXTENSION}")
+
+    def get(self, key: str) -> Optional[Tuple[list, str]]:
+        """
+        Get the compilation output stored under the given key.
+        Args:
+            key (str): Cache key returned by `make_key`
+        Returns:
+            tuple: ABI and bytecode of the contract, or None on a cache miss
+        """
+        entry_path = self._get_entry_path(key)
+
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+            # The modification time records the last access for LRU eviction
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+
+        return entry["abi"], entry["bytecode"]
+
+    def set(self, key: str, abi: list, bytecode: str) -> None:
+        """
+        Store a compilation output and evict old entries if the size cap is exceeded.
+        Args:
+            key (str): Cache key returned by `make_key`
+            abi (list): ABI of the contract
+            bytecode (str): Bytecode of the contract
+        """
+        entry_path = self._get_entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"abi": abi, "bytecode": bytecode}, f)
+            size = os.stat(tmp_path).st_size
+            try:
+                replaced_size = os.stat(entry_path).st_size
+            except FileNotFoundError:
+                replaced_size = 0
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Unable to write compilation cache entry {key}: {e}")
+            return
+
+        with self._lock:
+            self._size += size - replaced_size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in its size cap. Must hold the lock.
+        The scan also accounts for the entries written by other processes.
+        """
+        self._size = evict_lru_entries(self.path, self.max_size)
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache and reset the counters.
+        """
+        with self._lock:
+            for filename in os.listdir(self.path):
+                if filename.endswith(CACHE_ENTRY_EXTENSION):
+                    os.remove(os.path.join(self.path, filename))
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Get the hit and miss counters of the cache.
+        Returns:
+            dict: Counters and size information of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "path": self.path,
+                "size": self._size,
+                "max_size": self.max_size,
+            }
+
+
+_default_cache: Optional[CompilationCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> CompilationCache:
+    """
+    Get the process-wide compilation cache used when no cache is given to the compiler.
+    Returns:
+        CompilationCache: The default compilation cache
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = CompilationCache()
+        return _default_cache
+
+
+def set_default_cache(cache: Optional[CompilationCache]) -> None:
+    """
+    Replace the process-wide compilation cache.
+    Args:
+        cache (CompilationCache): The cache to use by default, or None to reset it
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        _default_cache = cache
@@ -1,4 +1,6 @@
 import logging
+from typing import Dict
+from msfsm.solidity.cache import CompilationCache, get_default_cache
 from msfsm.solidity.config import ConfigEthereum
 from solcx import compile_standard
 
@@ -9,6 +11,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+COMPILER_SETTINGS = {
+    "outputSelection": {
+        "*": {
+            "*": [
+                "abi",
+                "metadata",
+                "evm.bytecode",
+                "evm.bytecode.sourceMap",
+            ]  # output needed to interact with and deploy contract
+        }
+    }
+}
+
+
 class CompilerSolidity:
     """
     Compiler for Solidity code.
@@ -16,39 +32,49 @@ class CompilerSolidity:
         contract_name (str): Name of the contract
         contract_code (str): Solidity code of the contract
         config (ConfigEthereum): Configuration object for the compiler
+        cache (CompilationCache): Cache of compilation outputs, defaults to the process-wide cache
     """
 
     def __init__(
-        self, contract_name: str, contract_code: str, config: ConfigEthereum
+        self,
+        contract_name: str,
+        contract_code: str,
+        config: ConfigEthereum,
+        cache: CompilationCache = None,
     ):
         self.contract_name = contract_name
         self.contract_code = contract_code
         self.config = config
+        self.cache = cache if cache is not None else get_default_cache()
         self.abi = None
         self.bytecode = None
 
     def compile(self) -> tuple[str, str]:
         """
         Compile the Solidity code and extract ABI and bytecode.
+        The output is read from the compilation cache when the same code was
+        already compiled with the same solc version and settings.
         Returns:
             tuple: ABI and bytecode of the contract
         """
+        cache_key = CompilationCache.make_key(
+            self.contract_name,
+            self.contract_code,
+            self.config.platform.sol_version,
+            COMPILER_SETTINGS,
+        )
+        cached = self.cache.get(cache_key)
+
+        if cached is not None:
+            self.abi, self.bytecode = cached
+            logger.info(f"Contract {self.contract_name} loaded from compilation cache")
+            return self.abi, self.bytecode
+
         compiled_sol = compile_standard(
             {
                 "language": "Solidity",
                 "sources": {self.contract_name: {"content": self.contract_code}},
-                "settings": {
-                    "outputSelection": {
-                        "*": {
-                            "*": [
-                                "abi",
-                                "metadata",
-                                "evm.bytecode",
-                                "evm.bytecode.sourceMap",
-                            ]  # output needed to interact with and deploy contract
-                        }
-                    }
-                },
+                "settings": COMPILER_SETTINGS,
             },
             solc_version=self.config.platform.sol_version,
         )
@@ -60,6 +86,71 @@ class CompilerSolidity:
             self.contract_name
         ]["evm"]["bytecode"]["object"]
 
+        self.cache.set(cache_key, self.abi, self.bytecode)
+
         logger.info(f"Contract {self.contract_name} compiled")
 
         return self.abi, self.bytecode
+
+    @staticmethod
+    def compile_batch(
+        contracts: Dict[str, str],
+        config: ConfigEthereum,
+        cache: CompilationCache = None,
+    ) -> Dict[str, tuple[str, str]]:
+        """
+        Compile several contracts with a single solc invocation.
+        Every contract missing from the compilation cache is put in the same
+        standard JSON input, and the output is split per contract afterwards.
+        Args:
+            contracts (Dict[str, str]): Solidity code of each contract, by contract name
+            config (ConfigEthereum): Configuration object for the compiler
+            cache (CompilationCache): Cache of compilation outputs, defaults to the process-wide cache
+        Returns:
+            Dict[str, tuple]: ABI and bytecode of each contract, by contract name
+        """
+        cache = cache if cache is not None else get_default_cache()
+        sol_version = config.platform.sol_version
+
+        result = {}
+        cache_keys = {}
+
+        for contract_name, contract_code in contracts.items():
+            cache_keys[contract_name] = CompilationCache.make_key(
+                contract_name, contract_code, sol_version, COMPILER_SETTINGS
+            )
+            cached = cache.get(cache_keys[contract_name])
+
+            if cached is not None:
+                result[contract_name] = cached
+                logger.info(f"Contract {contract_name} loaded from compilation cache")
+
+        sources = {
+            contract_name: {"content": contract_code}
+            for contract_name, contract_code in contracts.items()
+            if contract_name not in result
+        }
+
+        if not sources:
+            return result
+
+        compiled_sol = compile_standard(
+            {
+                "language": "Solidity",
+                "sources": sources,
+                "settings": COMPILER_SETTINGS,
+            },
+            solc_version=sol_version,
+        )
+
+        for contract_name in sources:
+            output = compiled_sol["contracts"][contract_name][contract_name]
+            abi = output["abi"]
+            bytecode = output["evm"]["bytecode"]["object"]
+
+            cache.set(cache_keys[contract_name], abi, bytecode)
+            result[contract_name] = (abi, bytecode)
+
+        logger.info(f"Contracts {', '.join(sources)} compiled")
+
+        return result
@@ -1,5 +1,6 @@
 from msfsm.common.config import Config
 from pydantic import BaseModel
+from typing import Optional
 
 
 class EthereumPlatform(BaseModel):
@@ -8,6 +9,9 @@ class EthereumPlatform(BaseModel):
     chain_id: int
     pub_key: str
     priv_key: str
+    multicall_address: Optional[str] = None
+    pool_size: Optional[int] = None
+    metadata_ttl: Optional[float] = None
 
 
 class ConfigEthereum(Config):
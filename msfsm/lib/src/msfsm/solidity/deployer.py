@@ -1,7 +1,10 @@
 import logging
 
+from typing import List
+from eth_utils import keccak, to_canonical_address, to_checksum_address
 from msfsm.solidity.config import ConfigEthereum
-from web3 import Web3
+from msfsm.solidity.nonce import get_nonce_manager
+from msfsm.solidity.provider import get_provider
 
 
 logging.basicConfig(
@@ -10,6 +13,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def get_contract_address(sender: str, nonce: int) -> str:
+    """
+    Compute the address of a contract created by a transaction.
+    Args:
+        sender (str): Address of the account sending the creation transaction
+        nonce (int): Nonce of the creation transaction
+    Returns:
+        str: Checksummed address of the created contract
+    """
+    # RLP encoding of the list [sender, nonce], the nonce being a big-endian integer
+    # without leading zeros, so both items and the list are shorter than 56 bytes
+    sender_item = bytes([0x80 + 20]) + to_canonical_address(sender)
+    if nonce == 0:
+        nonce_item = bytes([0x80])
+    elif nonce < 0x80:
+        nonce_item = bytes([nonce])
+    else:
+        nonce_bytes = nonce.to_bytes((nonce.bit_length() + 7) // 8, "big")
+        nonce_item = bytes([0x80 + len(nonce_bytes)]) + nonce_bytes
+    payload = sender_item + nonce_item
+
+    return to_checksum_address(keccak(bytes([0xC0 + len(payload)]) + payload)[12:])
+
+
 class DeployerSolidity:
     """
     Deployer for Solidity contracts.
@@ -17,45 +44,92 @@ class DeployerSolidity:
         abi (str): ABI of the contract
         bytecode (str): Bytecode of the contract
         config (ConfigEthereum): Configuration object for the deployer
+        constructor_args (List[str]): Arguments of the contract constructor, such as
+            the addresses of the contracts it depends on
     """
 
     def __init__(
-        self, contract_name: str, abi: str, bytecode: str, config: ConfigEthereum
+        self,
+        contract_name: str,
+        abi: str,
+        bytecode: str,
+        config: ConfigEthereum,
+        constructor_args: List[str] = None,
     ):
         self.config = config
         self.contract_name = contract_name
         self.abi = abi
         self.bytecode = bytecode
+        self.constructor_args = constructor_args or []
         self.address = None
+        self.transaction_hash = None
 
-    def deploy(self):
+    def send(self) -> str:
         """
-        Deploy the contract to the Ethereum network.
+        Sign and submit the deployment transaction without waiting for it to be mined.
+        The nonce comes from the nonce manager shared by every sender of the account,
+        so several deployments can be submitted back to back. The address of the
+        contract is known as soon as the transaction is submitted.
         Returns:
-            str: Address of the deployed contract
+            str: Address the contract will be deployed at
         """
-        w3 = Web3(Web3.HTTPProvider(self.config.platform.provider_url))
+        provider = get_provider(self.config.platform)
+        w3 = provider.w3
+        nonce_manager = get_nonce_manager(self.config.platform)
 
         Contract = w3.eth.contract(abi=self.abi, bytecode=self.bytecode)
-        nonce = w3.eth.get_transaction_count(self.config.platform.pub_key)
-
-        transaction = Contract.constructor().build_transaction(
-            {
-                "chainId": self.config.platform.chain_id,
-                "gasPrice": w3.eth.gas_price,
-                "from": self.config.platform.pub_key,
-                "nonce": nonce,
-            }
-        )
-
-        sign_transaction = w3.eth.account.sign_transaction(
-            transaction, private_key=self.config.platform.priv_key
-        )
-        transaction_hash = w3.eth.send_raw_transaction(sign_transaction.raw_transaction)
-        transaction_receipt = w3.eth.wait_for_transaction_receipt(transaction_hash)
+        nonce = nonce_manager.next_nonce(w3)
+
+        try:
+            transaction = Contract.constructor(*self.constructor_args).build_transaction(
+                {
+                    "chainId": self.config.platform.chain_id,
+                    "gasPrice": provider.gas_price,
+                    "from": self.config.platform.pub_key,
+                    "nonce": nonce,
+                }
+            )
+
+            sign_transaction = w3.eth.account.sign_transaction(
+                transaction, private_key=self.config.platform.priv_key
+            )
+            self.transaction_hash = w3.eth.send_raw_transaction(
+                sign_transaction.raw_transaction
+            )
+            nonce_manager.confirm(nonce)
+        except Exception:
+            nonce_manager.release(nonce)
+            raise
+
+        self.address = get_contract_address(self.config.platform.pub_key, nonce)
+
+        logger.info(f"Contract {self.contract_name} deployment sent for {self.address}")
+
+        return self.address
+
+    def wait(self) -> str:
+        """
+        Wait for the deployment transaction submitted by `send` to be mined.
+        Returns:
+            str: Address of the deployed contract
+        """
+        w3 = get_provider(self.config.platform).w3
+        transaction_receipt = w3.eth.wait_for_transaction_receipt(self.transaction_hash)
+
+        if transaction_receipt["status"] != 1:
+            raise ValueError(f"Deployment of contract {self.contract_name} failed")
 
         self.address = transaction_receipt["contractAddress"]
 
         logger.info(f"Contract {self.contract_name} deployed at {self.address}")
 
         return self.address
+
+    def deploy(self):
+        """
+        Deploy the contract to the Ethereum network.
+        Returns:
+            str: Address of the deployed contract
+        """
+        self.send()
+        return self.wait()
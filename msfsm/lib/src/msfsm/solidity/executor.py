@@ -1,8 +1,19 @@
+import hashlib
+import json
 import logging
+import threading
 
-from typing import List
-from web3 import Web3
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+from eth_utils import (
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+)
+from web3.exceptions import Web3TypeError
 from msfsm.solidity.config import ConfigEthereum
+from msfsm.solidity.nonce import get_nonce_manager
+from msfsm.solidity.provider import Web3Provider, get_provider
 
 
 logging.basicConfig(
@@ -10,6 +21,117 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DEFAULT_CONTRACT_CACHE_SIZE = 256
+
+# Function state mutabilities that can be executed with a call instead of a transaction
+READ_ONLY_STATE_MUTABILITIES = ("view", "pure")
+
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+        "stateMutability": "payable",
+    }
+]
+
+
+class ContractEntry:
+    """
+    Contract object of a deployed contract with its precomputed function table.
+    Args:
+        contract (Contract): Web3 contract object bound to the address and ABI
+        functions (Dict[str, Dict[str, Any]]): Function name to selector, input types,
+            output arity and state mutability
+    """
+
+    def __init__(self, contract, functions: Dict[str, Dict[str, Any]]):
+        self.contract = contract
+        self.functions = functions
+
+
+_contract_cache: "OrderedDict[Tuple[str, str], ContractEntry]" = OrderedDict()
+_contract_cache_lock = threading.Lock()
+
+
+def _get_abi_hash(contract_abi) -> str:
+    if not isinstance(contract_abi, str):
+        contract_abi = json.dumps(contract_abi, sort_keys=True)
+    return hashlib.sha256(contract_abi.encode()).hexdigest()
+
+
+def _build_function_table(contract_abi) -> Dict[str, Dict[str, Any]]:
+    if isinstance(contract_abi, str):
+        contract_abi = json.loads(contract_abi)
+
+    functions = {}
+    for item in contract_abi:
+        if item.get("type") != "function" or item["name"] in functions:
+            continue
+
+        functions[item["name"]] = {
+            "selector": "0x" + function_abi_to_4byte_selector(item).hex(),
+            "input_types": get_abi_input_types(item),
+            "output_types": get_abi_output_types(item),
+            "output_arity": len(item.get("outputs", [])),
+            "state_mutability": item.get("stateMutability", "nonpayable"),
+        }
+
+    return functions
+
+
+def get_contract_entry(w3, contract_address: str, contract_abi) -> ContractEntry:
+    """
+    Get the cached contract object and function table of a deployed contract.
+    Entries are keyed by address and ABI hash, the least recently used ones are evicted
+    past DEFAULT_CONTRACT_CACHE_SIZE entries.
+    Args:
+        w3 (Web3): Web3 instance connected to the network
+        contract_address (str): Address of the contract
+        contract_abi (str): ABI of the contract
+    Returns:
+        ContractEntry: The contract object and its function table
+    """
+    key = (contract_address, _get_abi_hash(contract_abi))
+
+    with _contract_cache_lock:
+        entry = _contract_cache.get(key)
+        if entry is not None and entry.contract.w3 is w3:
+            _contract_cache.move_to_end(key)
+            return entry
+
+    entry = ContractEntry(
+        w3.eth.contract(address=contract_address, abi=contract_abi),
+        _build_function_table(contract_abi),
+    )
+
+    with _contract_cache_lock:
+        _contract_cache[key] = entry
+        while len(_contract_cache) > DEFAULT_CONTRACT_CACHE_SIZE:
+            _contract_cache.popitem(last=False)
+
+    return entry
+
 
 class ExecutorSolidity:
     def __init__(
@@ -19,6 +141,39 @@ class ExecutorSolidity:
         self.contract_abi = contract_abi
         self.config = config
 
+    def _send_transaction(self, provider: Web3Provider, contract_function):
+        """
+        Sign and submit a transaction calling a contract function.
+        The nonce comes from the nonce manager shared with the deployments of the account.
+        Args:
+            provider (Web3Provider): Shared provider connected to the network
+            contract_function (ContractFunction): Bound contract function to call
+        Returns:
+            HexBytes: Hash of the submitted transaction
+        """
+        w3 = provider.w3
+        nonce_manager = get_nonce_manager(self.config.platform)
+        nonce = nonce_manager.next_nonce(w3)
+
+        try:
+            transaction = contract_function.build_transaction(
+                {
+                    "chainId": self.config.platform.chain_id,
+                    "gasPrice": provider.gas_price,
+                    "from": self.config.platform.pub_key,
+                    "nonce": nonce,
+                }
+            )
+            sign_transaction = w3.eth.account.sign_transaction(
+                transaction, private_key=self.config.platform.priv_key
+            )
+            transaction_hash = w3.eth.send_raw_transaction(sign_transaction.raw_transaction)
+            nonce_manager.confirm(nonce)
+            return transaction_hash
+        except Exception:
+            nonce_manager.release(nonce)
+            raise
+
     def execute(self, function_name: str, function_args: List[str]):
         """
         Execute a function of the smart contract.
@@ -27,26 +182,116 @@ class ExecutorSolidity:
             function_args (List[str]): Arguments for the function
         """
         function_return = None
-        w3 = Web3(Web3.HTTPProvider(self.config.platform.provider_url))
-        contract = w3.eth.contract(address=self.contract_address, abi=self.contract_abi)
+        provider = get_provider(self.config.platform)
+        w3 = provider.w3
+        entry = get_contract_entry(w3, self.contract_address, self.contract_abi)
 
-        function_abi_outputs = contract.get_function_by_name(function_name).abi[
-            "outputs"
-        ]
+        if function_name not in entry.functions:
+            raise ValueError(f"Function {function_name} not found in contract ABI")
+
+        contract_function = entry.contract.functions[function_name](*function_args)
 
         logger.info(
             f"Executing function {function_name} with arguments {function_args}"
         )
 
-        if len(function_abi_outputs) < 1:  # for functions that don't return anything
-            tx_hash = contract.functions[function_name](*function_args).transact()
+        if (
+            entry.functions[function_name]["state_mutability"]
+            in READ_ONLY_STATE_MUTABILITIES
+        ):
+            function_return = contract_function.call()
+        else:
+            tx_hash = self._send_transaction(provider, contract_function)
             tx_receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
             function_return = True
-        else:
-            function_return = contract.functions[function_name](*function_args).call()
 
         logger.info(
             f"Function {function_name} executed with return value {function_return}"
         )
 
         return function_return
+
+    @staticmethod
+    def read_batch(
+        contracts: Dict[str, Tuple[str, str]],
+        function_names: List[str],
+        config: ConfigEthereum,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Call view functions without arguments on several contracts at once.
+        The calls are aggregated into a single eth_call through the Multicall3 contract
+        configured in `config.platform.multicall_address`. Without a multicall contract,
+        they are sent as one JSON-RPC batch request instead.
+        Args:
+            contracts (Dict[str, Tuple[str, str]]): Contract name to (address, ABI)
+            function_names (List[str]): Functions to call on every contract
+            config (ConfigEthereum): Configuration of the platform
+        Returns:
+            Dict[str, Dict[str, Any]]: Contract name to function name to return value,
+                None when the function is missing or its call failed
+        """
+        w3 = get_provider(config.platform).w3
+        results = {name: {f: None for f in function_names} for name in contracts}
+        calls = []
+
+        for name, (address, abi) in contracts.items():
+            entry = get_contract_entry(w3, address, abi)
+            for function_name in function_names:
+                if function_name in entry.functions:
+                    calls.append((name, function_name, entry))
+
+        if not calls:
+            return results
+
+        if config.platform.multicall_address:
+            multicall = w3.eth.contract(
+                address=config.platform.multicall_address, abi=MULTICALL3_ABI
+            )
+            aggregated = multicall.functions.aggregate3(
+                [
+                    (entry.contract.address, True, entry.contract.encode_abi(f, []))
+                    for _, f, entry in calls
+                ]
+            ).call()
+
+            for (name, function_name, entry), (success, data) in zip(calls, aggregated):
+                if not success:
+                    logger.warning(f"Call of {function_name} on {name} failed")
+                    continue
+                try:
+                    values = w3.codec.decode(
+                        entry.functions[function_name]["output_types"], data
+                    )
+                except Exception as e:
+                    logger.warning(f"Call of {function_name} on {name} failed: {e}")
+                    continue
+                results[name][function_name] = (
+                    values[0] if len(values) == 1 else list(values)
+                )
+        else:
+            try:
+                with w3.batch_requests() as batch:
+                    for _, function_name, entry in calls:
+                        batch.add(entry.contract.functions[function_name]())
+                    responses = batch.execute()
+            except Exception as e:
+                # The provider does not support batch requests, or a failing call
+                # failed the whole batch: each call is sent on its own instead
+                if not isinstance(e, Web3TypeError):
+                    logger.warning(f"Batch request failed, calling functions one by one: {e}")
+                responses = []
+                for _, function_name, entry in calls:
+                    try:
+                        responses.append(entry.contract.functions[function_name]().call())
+                    except Exception as e:
+                        responses.append(e)
+
+            for (name, function_name, _), value in zip(calls, responses):
+                if isinstance(value, Exception):
+                    logger.warning(f"Call of {function_name} on {name} failed: {value}")
+                else:
+                    results[name][function_name] = value
+
+        logger.info(f"Read {len(calls)} values from {len(contracts)} contracts")
+
+        return results
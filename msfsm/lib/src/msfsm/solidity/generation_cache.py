@@ -0,0 +1,230 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from msfsm.common.emitter import SourceOrigin
+from msfsm.solidity.cache import CACHE_ENTRY_EXTENSION, evict_lru_entries, get_cache_size
+
+
+logging.basicConfig(
+    level=logging.INFO,
+)
+logger = logging.getLogger(__name__)
+
+
+# Changed when the generator emits different code for the same inputs, so that
+# entries written by a previous version are not reused
+GENERATION_CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_SIZE = 64 * 1024 * 1024  # 64 MiB
+
+SourceMap = List[Tuple[int, int, Optional[SourceOrigin]]]
+
+
+class GenerationCache:
+    """
+    Cache of the Solidity code generated for an automaton, keyed by its fingerprint.
+    Entries hold the generated code and its source map. They are kept in an in-memory
+    LRU cache and, when a path is given, in an on-disk tier that survives restarts.
+    Args:
+        max_entries (int): Maximum number of entries kept in memory
+        path (str): Directory of the on-disk tier, None to keep entries in memory only
+        max_disk_size (int): Maximum total size of the on-disk entries in bytes
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: Optional[str] = None,
+        max_disk_size: int = DEFAULT_MAX_DISK_SIZE,
+    ):
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_size = max_disk_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[str, SourceMap]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Total size of the on-disk entries, only scanned again when the cap is exceeded
+        self._disk_size = 0
+
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+            self._disk_size = get_cache_size(self.path)
+
+    @staticmethod
+    def make_key(fingerprint: dict) -> str:
+        """
+        Compute the cache key of an automaton from its structural fingerprint.
+        Args:
+            fingerprint (dict): Every input the generated code of the automaton depends on
+        Returns:
+            str: Hexadecimal SHA-256 digest identifying the generated code
+        """
+        payload = json.dumps(
+            {"version": GENERATION_CACHE_VERSION, "fingerprint": fingerprint},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}{CACHE_ENTRY_EXTENSION}")
+
+    def _read_entry(self, key: str) -> Optional[Tuple[str, SourceMap]]:
+        """
+        Read an entry of the on-disk tier.
+        """
+        entry_path = self._get_entry_path(key)
+
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+            # The modification time records the last access for LRU eviction
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+
+        source_map = [
+            (start, end, SourceOrigin(*origin) if origin is not None else None)
+            for start, end, origin in entry["source_map"]
+        ]
+        return entry["code"], source_map
+
+    def _write_entry(self, key: str, code: str, source_map: SourceMap) -> None:
+        """
+        Write an entry of the on-disk tier and evict old entries if the size cap is exceeded.
+        """
+        entry_path = self._get_entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"code": code, "source_map": source_map}, f)
+            size = os.stat(tmp_path).st_size
+            try:
+                replaced_size = os.stat(entry_path).st_size
+            except FileNotFoundError:
+                replaced_size = 0
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Unable to write generation cache entry {key}: {e}")
+            return
+
+        with self._lock:
+            self._disk_size += size - replaced_size
+            if self._disk_size > self.max_disk_size:
+                self._disk_size = evict_lru_entries(self.path, self.max_disk_size)
+
+    def _remember(self, key: str, code: str, source_map: SourceMap) -> None:
+        """
+        Store an entry in memory, evicting the least recently used entries. Must hold the lock.
+        """
+        self._entries[key] = (code, source_map)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Tuple[str, SourceMap]]:
+        """
+        Get the generated code stored under the given key.
+        Args:
+            key (str): Cache key returned by `make_key`
+        Returns:
+            tuple: Generated code and its source map, or None on a cache miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read_entry(key) if self.path is not None else None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, *entry)
+
+        return entry
+
+    def set(self, key: str, code: str, source_map: SourceMap) -> None:
+        """
+        Store the generated code of an automaton.
+        Args:
+            key (str): Cache key returned by `make_key`
+            code (str): Generated code
+            source_map (SourceMap): Source map of the generated code
+        """
+        with self._lock:
+            self._remember(key, code, source_map)
+
+        if self.path is not None:
+            self._write_entry(key, code, source_map)
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                for filename in os.listdir(self.path):
+                    if filename.endswith(CACHE_ENTRY_EXTENSION):
+                        os.remove(os.path.join(self.path, filename))
+            self._disk_size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Get the hit and miss counters of the cache.
+        Returns:
+            dict: Counters and size information of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "path": self.path,
+                "disk_size": self._disk_size,
+            }
+
+
+_default_cache: Optional[GenerationCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_generation_cache() -> GenerationCache:
+    """
+    Get the process-wide generation cache used when no cache is given to the generator.
+    It keeps entries in memory only.
+    Returns:
+        GenerationCache: The default generation cache
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = GenerationCache()
+        return _default_cache
+
+
+def set_default_generation_cache(cache: Optional[GenerationCache]) -> None:
+    """
+    Replace the process-wide generation cache.
+    Args:
+        cache (GenerationCache): The cache to use by default, or None to reset it
+    """
+    global _default_cache
+
+    with _default_cache_lock:
+        _default_cache = cache
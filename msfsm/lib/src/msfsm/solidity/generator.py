@@ -1,13 +1,49 @@
+import logging
 import os
-
-from typing import List
+import time
+
+from typing import Callable, List, Optional, Tuple
+from msfsm.common.emitter import (
+    ORIGIN_AUTOMATON,
+    ORIGIN_CONDITION,
+    ORIGIN_PACKAGE_FUNCTION,
+    ORIGIN_PACKAGE_STRUCT,
+    ORIGIN_PACKAGE_VARIABLE,
+    ORIGIN_TRANSITION,
+    ORIGIN_TRIGGER,
+    CodeEmitter,
+    SourceOrigin,
+)
 from msfsm.common.generator import Generator
-from msfsm.common.package import Package
-from msfsm.common.specification import Specification, TransitionModel
+from msfsm.common.package import PackageIndex
+from msfsm.common.scheduler import DagScheduler
+from msfsm.common.specification import (
+    CONDITION_SEPARATOR,
+    CompiledSpecification,
+    Specification,
+    TransitionModel,
+)
 from msfsm.solidity.compiler import CompilerSolidity
 from msfsm.solidity.config import ConfigEthereum
 from msfsm.solidity.deployer import DeployerSolidity
+from msfsm.solidity.generation_cache import GenerationCache, get_default_generation_cache
 from solcx import install_solc
+from solcx.exceptions import SolcError
+
+
+logging.basicConfig(
+    level=logging.INFO,
+)
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DEPLOY_WORKERS = 8
+
+# Stages reported to the progress callback of `GeneratorSolidity.deploy`
+DEPLOY_STAGE_GENERATED = "generated"
+DEPLOY_STAGE_COMPILED = "compiled"
+DEPLOY_STAGE_SENT = "sent"
+DEPLOY_STAGE_MINED = "mined"
 
 
 class GeneratorSolidity(Generator):
@@ -17,6 +53,8 @@ class GeneratorSolidity(Generator):
         specification (Specification): Specification object
         packages (List[Package]): List of Package objects
         config (ConfigEthereum): Configuration object for the generator
+        generation_cache (GenerationCache): Cache of generated code, defaults to the process-wide cache
+        package_index (PackageIndex): Index of the package files, defaults to the process-wide index
     """
 
     def __init__(
@@ -24,12 +62,21 @@ class GeneratorSolidity(Generator):
         specification_path: str = None,
         specification_obj: dict = None,
         packages_path: List[str] = [],
-        config: ConfigEthereum = None
+        config: ConfigEthereum = None,
+        generation_cache: GenerationCache = None,
+        package_index: PackageIndex = None,
     ):
-        super().__init__(specification_path, specification_obj, packages_path, config)
+        super().__init__(specification_path, specification_obj, packages_path, config, package_index)
 
         install_solc(self.config.platform.sol_version)
 
+        self.generation_cache = (
+            generation_cache if generation_cache is not None else get_default_generation_cache()
+        )
+
+        # Trigger, condition and package indexes, built once for every automaton
+        self.compiled = CompiledSpecification(self.specification)
+
         self.result: List[str] = {
             key: "" for key, _ in self.specification.data.automatons.items()
         }
@@ -40,9 +87,46 @@ class GeneratorSolidity(Generator):
         self.deployed_smart_contract_info: dict = {
             key: {} for key, _ in self.specification.data.automatons.items()
         }
-        self.conditional_functions_altready_used: list = {
-            key: [] for key, _ in self.specification.data.automatons.items()
+        self.conditional_functions_altready_used: dict[str, set] = {
+            key: set() for key, _ in self.specification.data.automatons.items()
+        }
+        self.deployment_timings: dict = {}
+        self.dependencies: dict[str, List[str]] = {
+            key: self._get_dependencies(key)
+            for key, _ in self.specification.data.automatons.items()
         }
+        self.emitters: dict[str, CodeEmitter] = {
+            key: CodeEmitter() for key, _ in self.specification.data.automatons.items()
+        }
+        # Default functions are added to every automaton
+        self.default_functions: List[Tuple[SourceOrigin, str]] = [
+            (SourceOrigin(ORIGIN_PACKAGE_FUNCTION, package_name, function_name), f.code)
+            for package_name, p in self.packages.items()
+            for function_name, f in p.data.functions.items()
+            if f.default
+        ]
+
+    def _get_dependencies(self, automaton_name: str) -> List[str]:
+        """
+        Returns the automata the given automaton depends on through its conditions.
+        The order of the list is the order of the constructor parameters of the contract.
+        Args:
+            automaton_name (str): Name of the automaton to get dependencies for.
+        Returns:
+            list: Sorted names of the automata the automaton depends on.
+        """
+        return self.compiled.automatons[automaton_name].dependencies
+
+    @staticmethod
+    def _get_address_variable_name(dependency_name: str) -> str:
+        """
+        Returns the name of the immutable variable holding the address of a dependency.
+        Args:
+            dependency_name (str): Name of the automaton the contract depends on.
+        Returns:
+            str: Name of the Solidity variable.
+        """
+        return f"automata{CONDITION_SEPARATOR}{dependency_name}{CONDITION_SEPARATOR}address"
 
     def _set_pragma(self, automaton_name: str) -> None:
         """
@@ -50,9 +134,10 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set pragma for.
         """
-        self.result[
-            automaton_name
-        ] += f"pragma solidity ^{self.config.platform.sol_version};"
+        self.emitters[automaton_name].emit(
+            f"pragma solidity ^{self.config.platform.sol_version};",
+            SourceOrigin(ORIGIN_AUTOMATON, automaton_name),
+        )
 
     def _set_header(self, automaton_name: str) -> None:
         """
@@ -60,7 +145,9 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set header for.
         """
-        self.result[automaton_name] += f"contract {automaton_name} {{"
+        self.emitters[automaton_name].emit(
+            f"contract {automaton_name} {{", SourceOrigin(ORIGIN_AUTOMATON, automaton_name)
+        )
 
     def _set_footer(self, automaton_name: str) -> None:
         """
@@ -68,7 +155,7 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set footer for.
         """
-        self.result[automaton_name] += "}"
+        self.emitters[automaton_name].emit("}", SourceOrigin(ORIGIN_AUTOMATON, automaton_name))
 
     def _set_states(self, automaton_name: str) -> None:
         """
@@ -76,19 +163,14 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set states for.
         """
-        self.result[automaton_name] += f"enum State {{"
+        emitter = self.emitters[automaton_name]
         states = self.specification.data.automatons[automaton_name].states
 
-        for idx, s in enumerate(states):
-            self.result[automaton_name] += f"{s.upper()}"
-
-            if idx < len(states) - 1:
-                self.result[automaton_name] += ","
-
-        self.result[automaton_name] += "}"
-        self.result[
-            automaton_name
-        ] += f"State currentState = State.{states[0].upper()};"
+        with emitter.origin(SourceOrigin(ORIGIN_AUTOMATON, automaton_name)):
+            emitter.emit(f"enum State {{")
+            emitter.emit(",".join(s.upper() for s in states))
+            emitter.emit("}")
+            emitter.emit(f"State currentState = State.{states[0].upper()};")
 
     def _set_structs(self, automaton_name: str) -> None:
         """
@@ -96,13 +178,13 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set structs for.
         """
-        used_packages = set(self.specification.used_packages.get(automaton_name, []))
+        emitter = self.emitters[automaton_name]
 
-        for package_name in used_packages:
+        for package_name in self.compiled.automatons[automaton_name].used_packages:
             structs = self.packages[package_name].data.structs
 
             for s in structs:
-                self.result[automaton_name] += f"{s.code}"
+                emitter.emit(s.code, SourceOrigin(ORIGIN_PACKAGE_STRUCT, package_name, s.name))
 
     def _set_variables(self, automaton_name: str) -> None:
         """
@@ -110,13 +192,43 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set variables for.
         """
-        used_packages = set(self.specification.used_packages.get(automaton_name, []))
+        emitter = self.emitters[automaton_name]
 
-        for package_name in used_packages:
+        for package_name in self.compiled.automatons[automaton_name].used_packages:
             variables = self.packages[package_name].data.variables
 
             for v in variables:
-                self.result[automaton_name] += f"{v.code}"
+                emitter.emit(v.code, SourceOrigin(ORIGIN_PACKAGE_VARIABLE, package_name, v.name))
+
+    def _set_constructor(self, automaton_name: str) -> None:
+        """
+        Sets the address placeholders and the constructor for the given automaton name.
+        The addresses of the automata it depends on are constructor parameters, so the
+        contract can be generated and compiled before its dependencies are deployed.
+        Args:
+            automaton_name (str): Name of the automaton to set constructor for.
+        """
+        dependencies = self.dependencies[automaton_name]
+
+        if not dependencies:
+            return
+
+        emitter = self.emitters[automaton_name]
+
+        with emitter.origin(SourceOrigin(ORIGIN_AUTOMATON, automaton_name)):
+            for d in dependencies:
+                emitter.emit(f"address private immutable {self._get_address_variable_name(d)};")
+
+            parameters = ",".join(
+                [f"address _{self._get_address_variable_name(d)}" for d in dependencies]
+            )
+            emitter.emit(f"constructor({parameters}) {{")
+
+            for d in dependencies:
+                variable_name = self._get_address_variable_name(d)
+                emitter.emit(f"{variable_name} = _{variable_name};")
+
+            emitter.emit("}")
 
     def _get_transitions_by_trigger_name(
         self, automaton_name: str, trigger_name: str
@@ -129,8 +241,7 @@ class GeneratorSolidity(Generator):
         Returns:
             list: A list of transitions.
         """
-        transitions = self.specification.data.automatons[automaton_name].transitions
-        return [t for t in transitions if t.trigger == trigger_name]
+        return self.compiled.automatons[automaton_name].transitions_by_trigger.get(trigger_name, [])
 
     def _get_conditions_by_trigger_name(
         self, automaton_name: str, trigger_name: str
@@ -143,71 +254,70 @@ class GeneratorSolidity(Generator):
         Returns:
             list: A list of conditions.
         """
-        transitions = self.specification.data.automatons[automaton_name].transitions
-        return [t.conditions for t in transitions if t.trigger == trigger_name]
+        return [
+            t.conditions
+            for t in self._get_transitions_by_trigger_name(automaton_name, trigger_name)
+        ]
 
-    def _get_unique_conditions(self, automaton_name: str, trigger_name: str) -> set:
+    def _get_unique_conditions(self, automaton_name: str, trigger_name: str) -> list:
         """
-        Returns a set of unique conditions for the given automaton name and trigger.
+        Returns the unique non-empty conditions for the given automaton name and trigger,
+        in order of first appearance so that the generated code is deterministic.
         Args:
             automaton_name (str): Name of the automaton to get conditions for.
             trigger_name (str): Trigger name for the conditions.
         Returns:
-            set: A set of unique conditions.
+            list: A list of unique conditions.
         """
-        return set(
-            [
-                x
-                for xs in self._get_conditions_by_trigger_name(
-                    automaton_name, trigger_name
-                )
-                for x in xs
-            ]
-        )
+        return self.compiled.automatons[automaton_name].conditions_by_trigger.get(trigger_name, [])
 
     def _set_conditions_by_trigger_name(
         self, transitions, automaton_name: str, trigger_name: str
     ):
         """
         Sets the conditions for the given automaton name and trigger.
+        Only the conditions and states of the first transition of the trigger are used.
         Args:
             transitions (list): List of transitions for the automaton.
             automaton_name (str): Name of the automaton to set functions for.
             trigger_name (str): Trigger name for the conditions.
         """
-        def _get_conditions_automata(t):
-            return [
-                c for c in t[0].conditions if c.startswith("automata__")
-            ]
-        
-        def _get_conditions_package(t):
-            return [
-                c for c in t[0].conditions if c.startswith("package__")
-            ]
+        compiled_automaton = self.compiled.automatons[automaton_name]
+        parsed_conditions = compiled_automaton.conditions
+        conditions_package = [
+            c for c in transitions[0].conditions
+            if c and parsed_conditions[c].type == "package"
+        ]
+        conditions_automata = [
+            c for c in transitions[0].conditions
+            if c and parsed_conditions[c].type == "automata"
+        ]
 
         conditions = ""
-        if _get_conditions_package(transitions):
+        if conditions_package:
             conditions = (
-                " && ".join([c + "()" for c in _get_conditions_package(transitions)])
+                " && ".join([c + "()" for c in conditions_package])
                 + " && "
                 + f"currentState == State.{transitions[0].source.upper()}"
             )
         else:
             conditions = f"currentState == State.{transitions[0].source.upper()}"
 
-        self.result[automaton_name] += f"if ({conditions}) {{"
-        self.result[
-            automaton_name
-        ] += f"currentState = State.{transitions[0].destination.upper()};"
+        emitter = self.emitters[automaton_name]
+        transition_index = compiled_automaton.transition_indexes_by_trigger[trigger_name][0]
 
-        # To avoid reetrancy bug, set currentState before external call
-        conditions_automata = " && ".join(["!" + c + "()" for c in _get_conditions_automata(transitions)])
-        if conditions_automata:
-            self.result[automaton_name] += f"if ({conditions_automata}) {{"
-            self.result[automaton_name] += f"revert('External call failed');"
-            self.result[automaton_name] += "}"
+        with emitter.origin(SourceOrigin(ORIGIN_TRANSITION, trigger_name, transition_index)):
+            emitter.emit(f"if ({conditions}) {{")
+            emitter.emit(f"currentState = State.{transitions[0].destination.upper()};")
 
-        self.result[automaton_name] += "}"
+            # To avoid reetrancy bug, set currentState before external call
+            conditions_automata = " && ".join(["!" + c + "()" for c in conditions_automata])
+            if conditions_automata:
+                emitter.emit(f"if ({conditions_automata}) {{")
+                emitter.emit(f"revert('External call failed');")
+                emitter.emit("}")
+
+            emitter.emit("}")
 
     def _set_requires_by_trigger_name(
         self, transitions, automaton_name: str, trigger_name: str
@@ -219,15 +329,21 @@ class GeneratorSolidity(Generator):
             automaton_name (str): Name of the automaton to set functions for.
             trigger_name (str): Trigger name for the require statements.
         """
-        self.result[automaton_name] += f"require("
+        emitter = self.emitters[automaton_name]
+        transition_indexes = self.compiled.automatons[automaton_name].transition_indexes_by_trigger[trigger_name]
+
+        emitter.emit(f"require(")
 
         for idx, t in enumerate(transitions):
-            self.result[automaton_name] += f"currentState == State.{t.source.upper()}"
+            emitter.emit(
+                f"currentState == State.{t.source.upper()}",
+                SourceOrigin(ORIGIN_TRANSITION, trigger_name, transition_indexes[idx]),
+            )
 
             if idx != len(transitions) - 1:
-                self.result[automaton_name] += "||"
+                emitter.emit("||")
 
-        self.result[automaton_name] += ");"
+        emitter.emit(");")
 
     def _set_default_functions(
         self, automaton_name
@@ -237,10 +353,10 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set functions for.
         """
-        for pacakge_name, p in self.packages.items():
-            for function_name, f in p.data.functions.items():
-                if f.default:
-                    self.result[automaton_name] += f.code
+        emitter = self.emitters[automaton_name]
+
+        for origin, code in self.default_functions:
+            emitter.emit(code, origin)
 
     def _set_transitional_functions_by_trigger_name(
         self, automaton_name: str, trigger_name: str
@@ -254,11 +370,13 @@ class GeneratorSolidity(Generator):
         transitions = self._get_transitions_by_trigger_name(
             automaton_name, trigger_name
         )
+        emitter = self.emitters[automaton_name]
 
-        self.result[automaton_name] += f"function {trigger_name}() public {{"
-        self._set_requires_by_trigger_name(transitions, automaton_name, trigger_name)
-        self._set_conditions_by_trigger_name(transitions, automaton_name, trigger_name)
-        self.result[automaton_name] += "}"
+        with emitter.origin(SourceOrigin(ORIGIN_TRIGGER, trigger_name)):
+            emitter.emit(f"function {trigger_name}() public {{")
+            self._set_requires_by_trigger_name(transitions, automaton_name, trigger_name)
+            self._set_conditions_by_trigger_name(transitions, automaton_name, trigger_name)
+            emitter.emit("}")
 
     def _set_conditional_functions_by_trigger_name(
         self, automaton_name: str, trigger: str
@@ -268,40 +386,31 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set functions for.
             trigger (str): Trigger name for the conditional functions.
-            functions_already_used (dict): Dictionary to keep track of functions already used.
         """
         conditions = self._get_unique_conditions(automaton_name, trigger)
+        parsed_conditions = self.compiled.automatons[automaton_name].conditions
+        already_used = self.conditional_functions_altready_used[automaton_name]
+        emitter = self.emitters[automaton_name]
 
         for c in conditions:
-            if not c:
-                continue
-            condition_type = c.split("__")[0]
-            package_name = c.split("__")[1]
-            function_name = c.split("__")[2]
-            is_already_used = True
+            condition_type, package_name, function_name = parsed_conditions[c]
 
             # check if function already written
-            if c not in self.conditional_functions_altready_used[automaton_name]:
-                self.conditional_functions_altready_used[automaton_name].append(
-                    c
-                )
-                is_already_used = False
+            if c not in already_used:
+                already_used.add(c)
 
-            if not is_already_used:
                 if condition_type == "package":  # package function
-                    self.result[automaton_name] += (
-                        self.packages[package_name].data.functions[function_name].code
+                    emitter.emit(
+                        self.packages[package_name].data.functions[function_name].code,
+                        SourceOrigin(ORIGIN_PACKAGE_FUNCTION, package_name, function_name),
                     )
                 elif condition_type == "automata":  # delegate call function
-                    self.result[
-                        automaton_name
-                    ] += f"function {c}() public returns (bool) {{"
-                    self.result[
-                        automaton_name
-                    ] += f'(bool success, bytes memory data) = address({self.deployed_smart_contract_info[package_name]["address"]}).delegatecall(abi.encodeWithSignature("is_completed()"));'
-                    self.result[automaton_name] += "require(success, 'Call failed');"
-                    self.result[automaton_name] += "return abi.decode(data, (bool));"
-                    self.result[automaton_name] += "}"
+                    with emitter.origin(SourceOrigin(ORIGIN_CONDITION, c)):
+                        emitter.emit(f"function {c}() public returns (bool) {{")
+                        emitter.emit(f'(bool success, bytes memory data) = {self._get_address_variable_name(package_name)}.delegatecall(abi.encodeWithSignature("is_completed()"));')
+                        emitter.emit("require(success, 'Call failed');")
+                        emitter.emit("return abi.decode(data, (bool));")
+                        emitter.emit("}")
                 else:
                     raise ValueError(f"Unknown condition type: {condition_type}")
 
@@ -311,12 +420,7 @@ class GeneratorSolidity(Generator):
         Args:
             automaton_name (str): Name of the automaton to set functions for.
         """
-        triggers = set(
-            [
-                t.trigger
-                for t in self.specification.data.automatons[automaton_name].transitions
-            ]
-        )
+        triggers = self.compiled.automatons[automaton_name].transitions_by_trigger
 
         for t in triggers:
             self._set_conditional_functions_by_trigger_name(automaton_name, t)
@@ -326,42 +430,189 @@ class GeneratorSolidity(Generator):
 
         self._set_default_functions(automaton_name)
 
+    def get_fingerprint(self, automaton_name: str) -> dict:
+        """
+        Returns every input the generated code of the given automaton depends on: its
+        states and transitions, the code of the package functions, structs and variables
+        it uses, the default functions, the solc version and its dependencies.
+        The addresses of the dependencies are not part of it since they are constructor
+        arguments of the contract, not part of its code.
+        Args:
+            automaton_name (str): Name of the automaton to get the fingerprint of.
+        Returns:
+            dict: The fingerprint, to be hashed by `GenerationCache.make_key`.
+        """
+        automaton = self.specification.data.automatons[automaton_name]
+        compiled_automaton = self.compiled.automatons[automaton_name]
+
+        packages = {}
+        for package_name in compiled_automaton.used_packages:
+            package = self.packages[package_name].data
+            packages[package_name] = {
+                "functions": {},
+                "structs": [s.code for s in package.structs],
+                "variables": [v.code for v in package.variables],
+            }
+        for condition_type, package_name, function_name in compiled_automaton.conditions.values():
+            if condition_type == "package":
+                function = self.packages[package_name].data.functions.get(function_name)
+                packages[package_name]["functions"][function_name] = (
+                    function.code if function is not None else None
+                )
+
+        return {
+            "automaton_name": automaton_name,
+            "states": automaton.states,
+            "transitions": [
+                [t.source, t.destination, t.trigger, t.conditions] for t in automaton.transitions
+            ],
+            "packages": packages,
+            "default_functions": [
+                [origin.name, origin.detail, code] for origin, code in self.default_functions
+            ],
+            "sol_version": self.config.platform.sol_version,
+            "dependencies": self.dependencies[automaton_name],
+        }
+
     def generate(self, automaton_name: str):
         """
         Generates the Solidity code for the given automaton name.
+        The fragments are collected by the emitter of the automaton and joined once in
+        `result`, and `emitters[automaton_name].source_map` maps them back to their origin.
+        The code is read from the generation cache when an automaton with the same
+        fingerprint was already generated.
         Args:
             automaton_name (str): Name of the automaton to generate code for.
         """
+        cache_key = GenerationCache.make_key(self.get_fingerprint(automaton_name))
+        cached = self.generation_cache.get(cache_key)
+
+        if cached is not None:
+            code, source_map = cached
+            self.emitters[automaton_name] = CodeEmitter.from_source_map(code, source_map)
+            self.result[automaton_name] = code
+            logger.info(f"Contract {automaton_name} loaded from generation cache")
+            return
+
+        self.emitters[automaton_name] = CodeEmitter()
+        self.conditional_functions_altready_used[automaton_name] = set()
+
         self._set_pragma(automaton_name)
         self._set_header(automaton_name)
         self._set_states(automaton_name)
         self._set_variables(automaton_name)
         self._set_structs(automaton_name)
+        self._set_constructor(automaton_name)
         self._set_functions(automaton_name)
         self._set_footer(automaton_name)
 
-    def deploy(self):
+        emitter = self.emitters[automaton_name]
+        self.result[automaton_name] = emitter.getvalue()
+        self.generation_cache.set(cache_key, self.result[automaton_name], emitter.source_map)
+
+    def get_compile_error_origins(
+        self, error: SolcError
+    ) -> List[Tuple[str, Optional[SourceOrigin]]]:
         """
-        Deploys the generated Solidity code to the blockchain.
+        Maps the errors reported by solc back to the specification and package elements
+        the failing code was generated from.
+        Args:
+            error (SolcError): Error raised by the compilation of the generated code.
+        Returns:
+            list: The message of each error and the origin of its source location, if known.
         """
-        automaton_order = self.specification.get_automatons_order()
+        origins = []
 
-        for depth in range(1, len(automaton_order) + 1):
-            for automaton_index in automaton_order[depth]:
-                automaton_name = self.keys[automaton_index]
+        for e in error.error_dict or []:
+            if e.get("severity") != "error":
+                continue
 
-                self.generate(self.keys[automaton_index])
+            location = e.get("sourceLocation") or {}
+            emitter = self.emitters.get(location.get("file"))
+            # solc reports byte offsets of the UTF-8 encoded source
+            origin = emitter.origin_at_byte(location.get("start", -1)) if emitter else None
+            origins.append((e.get("message", e.get("formattedMessage", "")), origin))
 
-                abi, bytecode = CompilerSolidity(
-                    self.keys[automaton_index], self.result[automaton_name], self.config
-                ).compile()
+        return origins
 
-                self.deployed_smart_contract_info[automaton_name]["address"] = (
-                    DeployerSolidity(
-                        automaton_name, abi, bytecode, self.config
-                    ).deploy()
-                )
-                self.deployed_smart_contract_info[automaton_name]["abi"] = abi
+    def deploy(
+        self,
+        max_workers: int = DEFAULT_DEPLOY_WORKERS,
+        progress_callback: Callable[[str, str], None] = None,
+    ):
+        """
+        Deploys the generated Solidity code to the blockchain.
+        Every automaton is generated against address placeholders and all of them are
+        compiled up front with a single solc invocation. The deployment transactions are
+        then submitted back to back: the address of a contract is known as soon as its
+        transaction is sent, so each automaton is submitted as soon as the automata it
+        depends on are submitted. The receipts are awaited once everything is sent.
+        The submission and mining times of each deployment are recorded in
+        `deployment_timings`.
+        Args:
+            max_workers (int): Maximum number of deployments submitted at the same time.
+            progress_callback (Callable[[str, str], None]): Called with the automaton name
+                and the stage reached (generated, compiled, sent, mined). It may be called
+                from several threads.
+        """
+        def _report(automaton_name: str, stage: str):
+            if progress_callback is not None:
+                progress_callback(automaton_name, stage)
+
+        # Fail on cyclic specifications before anything is deployed
+        self.specification.get_automatons_order()
+
+        for automaton_name in self.keys.values():
+            self.generate(automaton_name)
+            _report(automaton_name, DEPLOY_STAGE_GENERATED)
+
+        try:
+            compiled = CompilerSolidity.compile_batch(dict(self.result), self.config)
+        except SolcError as e:
+            for message, origin in self.get_compile_error_origins(e):
+                if origin is not None:
+                    logger.error(f"{message} (generated from {origin.describe()})")
+            raise
+        for automaton_name in self.keys.values():
+            _report(automaton_name, DEPLOY_STAGE_COMPILED)
+        deployers: dict[str, DeployerSolidity] = {}
+
+        def _send_automaton(automaton_index: int) -> str:
+            automaton_name = self.keys[automaton_index]
+            abi, bytecode = compiled[automaton_name]
+
+            constructor_args = [
+                deployers[d].address for d in self.dependencies[automaton_name]
+            ]
+
+            deployer = DeployerSolidity(
+                automaton_name, abi, bytecode, self.config, constructor_args
+            )
+            deployers[automaton_name] = deployer
+
+            address = deployer.send()
+            _report(automaton_name, DEPLOY_STAGE_SENT)
+
+            return address
+
+        scheduler = DagScheduler(
+            self.specification.get_dependency_graph(), max_workers=max_workers
+        )
+        scheduler.run(_send_automaton)
+
+        self.deployment_timings = {
+            self.keys[automaton_index]: {
+                "started_at": timing["started_at"],
+                "sent_at": timing["finished_at"],
+            }
+            for automaton_index, timing in scheduler.timings.items()
+        }
+
+        for automaton_name, deployer in deployers.items():
+            self.deployed_smart_contract_info[automaton_name]["address"] = deployer.wait()
+            self.deployed_smart_contract_info[automaton_name]["abi"] = deployer.abi
+            self.deployment_timings[automaton_name]["mined_at"] = time.time()
+            _report(automaton_name, DEPLOY_STAGE_MINED)
 
     def save_to_file(self, path: str = None):
         """
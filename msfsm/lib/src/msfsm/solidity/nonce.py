@@ -0,0 +1,108 @@
+import heapq
+import threading
+
+from typing import Dict, Tuple
+from msfsm.solidity.config import EthereumPlatform
+
+
+class NonceManager:
+    """
+    Hands out consecutive transaction nonces for an account without querying the node
+    for every transaction, so several transactions can be submitted back to back.
+    The manager is thread-safe and is shared by every deployment and execution
+    sending transactions from the same account.
+    Args:
+        address (str): Address of the account sending the transactions
+    """
+
+    def __init__(self, address: str):
+        self.address = address
+        self._next_nonce = None
+        # Nonces handed out and not yet sent, and nonces released to be handed out again
+        self._reserved = set()
+        self._released = []
+        self._lock = threading.Lock()
+
+    def next_nonce(self, w3) -> int:
+        """
+        Reserve the next nonce of the account.
+        Released nonces are handed out again first, lowest first, so that no gap is left.
+        The first call synchronizes the local counter with the pending transaction count.
+        The reservation must end with `confirm` once the transaction is sent, or with
+        `release` if it could not be sent.
+        Args:
+            w3 (Web3): Web3 instance connected to the network
+        Returns:
+            int: The reserved nonce
+        """
+        with self._lock:
+            if self._released:
+                nonce = heapq.heappop(self._released)
+            else:
+                if self._next_nonce is None:
+                    self._next_nonce = w3.eth.get_transaction_count(self.address, "pending")
+
+                nonce = self._next_nonce
+                self._next_nonce += 1
+
+            self._reserved.add(nonce)
+
+            return nonce
+
+    def confirm(self, nonce: int) -> None:
+        """
+        End the reservation of a nonce used by a transaction that was sent.
+        Args:
+            nonce (int): Nonce returned by `next_nonce`
+        """
+        with self._lock:
+            self._reserved.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """
+        End the reservation of a nonce used by a transaction that could not be sent.
+        While other nonces are reserved, the nonce is handed out again by `next_nonce`,
+        since the node does not know about the reserved ones yet. Once no nonce is
+        reserved, the local counter is dropped and read again from the node.
+        Args:
+            nonce (int): Nonce returned by `next_nonce`
+        """
+        with self._lock:
+            self._reserved.discard(nonce)
+
+            if self._reserved:
+                heapq.heappush(self._released, nonce)
+            else:
+                self._next_nonce = None
+                self._released = []
+
+    def reset(self) -> None:
+        """
+        Drop the local counter so that the next nonce is read again from the node.
+        Nonces still reserved are not tracked anymore, so it must only be called when no
+        transaction is being sent.
+        """
+        with self._lock:
+            self._next_nonce = None
+            self._reserved.clear()
+            self._released = []
+
+
+_nonce_managers: Dict[Tuple[str, str], NonceManager] = {}
+_nonce_managers_lock = threading.Lock()
+
+
+def get_nonce_manager(platform: EthereumPlatform) -> NonceManager:
+    """
+    Get the process-wide nonce manager of the account configured for a platform.
+    Args:
+        platform (EthereumPlatform): Platform configuration holding the provider and the account
+    Returns:
+        NonceManager: The nonce manager shared by every sender of this account
+    """
+    key = (platform.provider_url, platform.pub_key.lower())
+
+    with _nonce_managers_lock:
+        if key not in _nonce_managers:
+            _nonce_managers[key] = NonceManager(platform.pub_key)
+        return _nonce_managers[key]
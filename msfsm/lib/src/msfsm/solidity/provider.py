@@ -0,0 +1,124 @@
+import threading
+import time
+
+import requests
+
+from typing import Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from msfsm.solidity.config import EthereumPlatform
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_METADATA_TTL = 15.0
+
+
+class Web3Provider:
+    """
+    Web3 connection to an Ethereum node shared by every deployer and executor of a platform.
+    Requests go through a single keep-alive HTTP session with a bounded connection pool,
+    and chain metadata that rarely changes is cached for a short time.
+    Args:
+        platform (EthereumPlatform): Platform configuration holding the provider URL
+        pool_size (int): Maximum number of connections kept open to the node
+        metadata_ttl (float): Number of seconds chain metadata stays cached
+    """
+
+    def __init__(
+        self,
+        platform: EthereumPlatform,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        metadata_ttl: float = DEFAULT_METADATA_TTL,
+    ):
+        self.platform = platform
+        self.pool_size = pool_size
+        self.metadata_ttl = metadata_ttl
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.w3 = Web3(Web3.HTTPProvider(platform.provider_url, session=self.session))
+
+        self._metadata: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def _get_metadata(self, name: str, fetch) -> int:
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._metadata.get(name)
+            if cached is not None and now - cached[0] < self.metadata_ttl:
+                return cached[1]
+
+        value = fetch()
+
+        with self._lock:
+            self._metadata[name] = (now, value)
+
+        return value
+
+    @property
+    def chain_id(self) -> int:
+        """
+        Chain id reported by the node, cached for `metadata_ttl` seconds.
+        """
+        return self._get_metadata("chain_id", lambda: self.w3.eth.chain_id)
+
+    @property
+    def gas_price(self) -> int:
+        """
+        Gas price reported by the node, cached for `metadata_ttl` seconds.
+        """
+        return self._get_metadata("gas_price", lambda: self.w3.eth.gas_price)
+
+    def close(self) -> None:
+        """
+        Close the connections kept open to the node.
+        """
+        self.session.close()
+
+
+_providers: Dict[Tuple[str, int, int, float], Web3Provider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_provider(
+    platform: EthereumPlatform,
+    pool_size: Optional[int] = None,
+    metadata_ttl: Optional[float] = None,
+) -> Web3Provider:
+    """
+    Get the process-wide provider of a platform, creating it on first use.
+    The pool size and metadata TTL default to the ones of the platform configuration,
+    so that every deployer and executor of the platform shares the configured provider.
+    Providers are shared by the callers using the same pool size and metadata TTL.
+    Args:
+        platform (EthereumPlatform): Platform configuration holding the provider URL
+        pool_size (int): Maximum number of connections kept open to the node
+        metadata_ttl (float): Number of seconds chain metadata stays cached
+    Returns:
+        Web3Provider: The provider shared by every user of this platform
+    """
+    if pool_size is None:
+        pool_size = platform.pool_size or DEFAULT_POOL_SIZE
+    if metadata_ttl is None:
+        metadata_ttl = platform.metadata_ttl if platform.metadata_ttl is not None else DEFAULT_METADATA_TTL
+
+    key = (platform.provider_url, platform.chain_id, pool_size, metadata_ttl)
+
+    with _providers_lock:
+        if key not in _providers:
+            _providers[key] = Web3Provider(platform, pool_size, metadata_ttl)
+        return _providers[key]
+
+
+def close_providers() -> None:
+    """
+    Close and forget every provider of the registry.
+    """
+    with _providers_lock:
+        for provider in _providers.values():
+            provider.close()
+        _providers.clear()
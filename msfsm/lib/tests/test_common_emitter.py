@@ -0,0 +1,51 @@
+from msfsm.common.emitter import CodeEmitter, SourceOrigin
+
+
+def test_emit_joins_fragments():
+    emitter = CodeEmitter()
+    emitter.emit("contract A {")
+    emitter.emit("")
+    emitter.emit("}")
+
+    assert emitter.getvalue() == "contract A {}"
+    assert len(emitter) == len("contract A {}")
+
+
+def test_source_map_merges_fragments_of_same_origin():
+    header = SourceOrigin("automaton", "A")
+    function = SourceOrigin("package_function", "p1", "c1")
+
+    emitter = CodeEmitter()
+    with emitter.origin(header):
+        emitter.emit("abc")
+        emitter.emit("de")
+        emitter.emit("f", function)
+    emitter.emit("g")
+
+    assert emitter.source_map == [(0, 5, header), (5, 6, function), (6, 7, None)]
+    assert emitter.origin_at(4) == header
+    assert emitter.origin_at(5) == function
+    assert emitter.origin_at(7) is None
+
+
+def test_describe():
+    assert SourceOrigin("transition", "b", 1).describe() == "transition b #1"
+    assert SourceOrigin("automaton", "A").describe() == "automaton A"
+    assert SourceOrigin("package_function", "p1", "c1").describe() == "package_function p1.c1"
+
+
+def test_origin_at_byte():
+    comment = SourceOrigin("package_function", "p1", "c1")
+    function = SourceOrigin("package_function", "p1", "c2")
+
+    emitter = CodeEmitter()
+    emitter.emit("// état é\n", comment)
+    emitter.emit("function c2() {}", function)
+
+    start = emitter.getvalue().encode("utf-8").index(b"function")
+    assert start != emitter.getvalue().index("function")
+    assert emitter.origin_at_byte(start) == function
+    assert emitter.origin_at_byte(start - 1) == comment
+    # Offset inside the two bytes of "é"
+    assert emitter.origin_at_byte(4) == comment
+    assert emitter.origin_at_byte(len(emitter.getvalue().encode("utf-8"))) is None
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from msfsm.common.graph import CyclicGraphError, Graph
+
+
+def test_get_depths_groups_nodes_by_depth():
+    # 0 depends on 1 and 2, 1 depends on 2, 3 is isolated
+    graph = Graph([[1, 2], [2], [], []])
+
+    assert graph.get_depths() == {1: [2, 3], 2: [1], 3: [0]}
+    assert not graph.is_cyclic()
+
+
+def test_get_depths_reports_the_cycle():
+    graph = Graph([[1], [2], [3], [1]])
+
+    with pytest.raises(CyclicGraphError) as e:
+        graph.get_depths()
+
+    assert e.value.cycle == [1, 2, 3, 1]
+    assert str(e.value) == "The graph is cyclic: 1 -> 2 -> 3 -> 1"
+    assert graph.is_cyclic()
+
+
+def test_self_loop_is_a_cycle():
+    assert Graph([[], [1]]).find_cycle() == [1, 1]
+
+
+def test_long_chain_does_not_hit_the_recursion_limit():
+    n = 100_000
+    graph = Graph([[i + 1] for i in range(n - 1)] + [[]])
+
+    start = time.perf_counter()
+    depths = graph.get_depths()
+    elapsed = time.perf_counter() - start
+
+    assert len(depths) == n
+    assert depths[n] == [0]
+    # Loose bound, the traversal takes well under a second on a developer machine
+    assert elapsed < 5.0
+
+
+def test_long_cycle_is_reported_in_full():
+    n = 100_000
+    # 0 -> 1 -> ... -> n - 1 -> 1
+    graph = Graph([[i + 1] for i in range(n - 1)] + [[1]])
+
+    with pytest.raises(CyclicGraphError) as e:
+        graph.get_depths()
+
+    assert e.value.cycle == list(range(1, n)) + [1]
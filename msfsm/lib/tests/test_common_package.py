@@ -0,0 +1,49 @@
+import json
+import os
+
+from msfsm.common.package import PackageIndex
+
+
+def write_package(path, name, default=False, code="return true;"):
+    path.write_text(json.dumps({
+        "id": name,
+        "name": name,
+        "functions": {"c1": {"code": code, "default": default}},
+    }))
+    return str(path)
+
+
+def test_load_only_used_and_default_packages(tmp_path):
+    used = write_package(tmp_path / "used.json", "used")
+    unused = write_package(tmp_path / "unused.json", "unused")
+    defaults = write_package(tmp_path / "defaults.json", "defaults", default=True)
+
+    index = PackageIndex()
+    packages = index.load([used, unused, defaults], ["used"])
+
+    assert list(packages) == ["used", "defaults"]
+    assert set(index.packages) == {used, defaults}
+
+
+def test_unused_invalid_package_is_not_validated(tmp_path):
+    used = write_package(tmp_path / "used.json", "used")
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text(json.dumps({"name": "invalid", "functions": {}}))
+
+    assert list(PackageIndex().load([used, str(invalid)], ["used"])) == ["used"]
+
+
+def test_packages_are_reloaded_when_their_file_changes(tmp_path):
+    path = write_package(tmp_path / "p.json", "p")
+    index = PackageIndex()
+
+    package = index.load([path], ["p"])["p"]
+    assert index.load([path], ["p"])["p"] is package
+
+    write_package(tmp_path / "p.json", "p", code="return false;")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = index.load([path], ["p"])["p"]
+    assert reloaded is not package
+    assert reloaded.data.functions["c1"].code == "return false;"
@@ -0,0 +1,43 @@
+import threading
+import time
+
+import pytest
+
+from msfsm.common.scheduler import DagScheduler
+
+
+def test_run_respects_dependencies():
+    # 1 and 2 depend on 0, 3 depends on 1 and 2
+    graph = [[], [0], [0], [1, 2]]
+    finished = []
+    lock = threading.Lock()
+
+    def task(node):
+        with lock:
+            assert all(d in finished for d in graph[node])
+        time.sleep(0.01)
+        with lock:
+            finished.append(node)
+        return node * 10
+
+    scheduler = DagScheduler(graph)
+
+    assert scheduler.run(task) == {0: 0, 1: 10, 2: 20, 3: 30}
+    assert finished[0] == 0 and finished[-1] == 3
+    assert set(scheduler.timings) == {0, 1, 2, 3}
+
+
+def test_independent_branches_do_not_wait_for_each_other():
+    # 2 only depends on 0, it must not wait for the slow node 1
+    graph = [[], [], [0]]
+    durations = {0: 0.01, 1: 0.3, 2: 0.01}
+
+    scheduler = DagScheduler(graph)
+    scheduler.run(lambda node: time.sleep(durations[node]))
+
+    assert scheduler.timings[2]["finished_at"] < scheduler.timings[1]["finished_at"]
+
+
+def test_run_fails_on_cyclic_graph():
+    with pytest.raises(ValueError):
+        DagScheduler([[1], [0]]).run(lambda node: node)
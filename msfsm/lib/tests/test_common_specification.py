@@ -1,22 +1,41 @@
-from msfsm.common.specification import Specification
+import pytest
+
+from msfsm.common.graph import CyclicGraphError
+from msfsm.common.specification import CompiledSpecification, Specification, parse_condition
 
 def test_load():
     spec = Specification()
-    spec.load("./tests/data/dag.json")
+    spec.load_from_file("./tests/data/dag.json")
     assert spec.data.name == "Test"
     assert len(spec.data.automatons) == 5
     assert len(spec.data.required_packages) == 2
 
 def test_get_automaton_order_if_not_dag():
     spec = Specification()
-    spec.load("./tests/data/not-dag.json")
-    try:
+    spec.load_from_file("./tests/data/not-dag.json")
+    with pytest.raises(CyclicGraphError) as e:
         spec.get_automatons_order()
-    except ValueError as e:
-        assert str(e) == "The graph is cyclic"
+    assert str(e.value).startswith("The graph is cyclic")
+    # The cycle is reported with automaton names
+    assert e.value.cycle[0] == e.value.cycle[-1]
+    assert set(e.value.cycle) <= set(spec.data.automatons)
 
 def test_get_automatons_order_if_dag():
     spec = Specification()
-    spec.load("./tests/data/dag.json")
+    spec.load_from_file("./tests/data/dag.json")
     assert spec.get_automatons_order() == {1: [0], 2: [2], 4: [1, 4], 3: [3]}
 
+def test_compiled_specification():
+    spec = Specification()
+    spec.load_from_file("./tests/data/dag.json")
+    compiled = CompiledSpecification(spec)
+    automaton = compiled.automatons["Automata1"]
+    assert list(automaton.transitions_by_trigger) == ["a", "b", "d", "e", "c"]
+    assert automaton.conditions_by_trigger["d"] == ["package__p1__c1", "package__p1__c2"]
+    assert automaton.conditions["package__p1__c2"] == ("package", "p1", "c2")
+    assert automaton.used_packages == ["p1"]
+    assert automaton.dependencies == ["Automata0", "Automata2", "Automata3"]
+
+def test_parse_invalid_condition():
+    with pytest.raises(ValueError):
+        parse_condition("package__p1")
@@ -0,0 +1,122 @@
+import os
+import time
+
+from msfsm.solidity import cache as cache_module
+from msfsm.solidity import compiler
+from msfsm.solidity.cache import CompilationCache
+from msfsm.solidity.compiler import CompilerSolidity
+from msfsm.solidity.config import ConfigEthereum, EthereumPlatform
+
+
+def get_config(sol_version="0.8.0"):
+    return ConfigEthereum(
+        target="ethereum",
+        platform=EthereumPlatform(
+            sol_version=sol_version,
+            provider_url="http://localhost:8545",
+            chain_id=31337,
+            pub_key="0x0",
+            priv_key="0x0",
+        ),
+    )
+
+
+def test_make_key_depends_on_inputs():
+    key = CompilationCache.make_key("A", "code", "0.8.0", {})
+    assert key == CompilationCache.make_key("A", "code", "0.8.0", {})
+    assert key != CompilationCache.make_key("A", "other code", "0.8.0", {})
+    assert key != CompilationCache.make_key("A", "code", "0.8.1", {})
+    assert key != CompilationCache.make_key("A", "code", "0.8.0", {"optimizer": {}})
+
+
+def test_get_and_set(tmp_path):
+    cache = CompilationCache(path=str(tmp_path))
+    assert cache.get("k") is None
+
+    cache.set("k", [{"name": "a"}], "6080")
+    assert cache.get("k") == ([{"name": "a"}], "6080")
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction(tmp_path):
+    cache = CompilationCache(path=str(tmp_path), max_size=200)
+    cache.set("old", [], "00" * 40)
+    os.utime(tmp_path / "old.json", (time.time() - 10, time.time() - 10))
+    cache.set("new", [], "00" * 40)
+    cache.set("newer", [], "00" * 40)
+
+    assert cache.get("old") is None
+    assert cache.get("newer") is not None
+
+
+def test_size_is_tracked_without_scanning(tmp_path, monkeypatch):
+    CompilationCache(path=str(tmp_path)).set("existing", [], "00" * 40)
+    existing_size = os.path.getsize(tmp_path / "existing.json")
+
+    cache = CompilationCache(path=str(tmp_path), max_size=10 * existing_size)
+    assert cache.stats()["size"] == existing_size
+
+    scans = []
+    evict_lru_entries = cache_module.evict_lru_entries
+    monkeypatch.setattr(
+        cache_module, "evict_lru_entries", lambda *args: scans.append(args) or evict_lru_entries(*args)
+    )
+
+    for i in range(5):
+        cache.set(f"k{i}", [], "00" * 40)
+    # Replacing an entry does not count it twice
+    cache.set("k0", [], "00" * 40)
+    assert scans == []
+    assert cache.stats()["size"] == 6 * existing_size
+
+    for i in range(5, 10):
+        cache.set(f"k{i}", [], "00" * 40)
+    assert len(scans) == 1
+    assert cache.stats()["size"] <= cache.max_size
+
+
+def test_compiler_uses_cache(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_compile_standard(input_json, solc_version):
+        calls.append(solc_version)
+        return {
+            "contracts": {
+                "A": {"A": {"abi": [], "evm": {"bytecode": {"object": "6080"}}}}
+            }
+        }
+
+    monkeypatch.setattr(compiler, "compile_standard", fake_compile_standard)
+    cache = CompilationCache(path=str(tmp_path))
+
+    assert CompilerSolidity("A", "code", get_config(), cache).compile() == ([], "6080")
+    assert CompilerSolidity("A", "code", get_config(), cache).compile() == ([], "6080")
+    assert len(calls) == 1
+
+    CompilerSolidity("A", "code", get_config("0.8.1"), cache).compile()
+    assert len(calls) == 2
+
+
+def test_compile_batch_only_compiles_missing_contracts(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_compile_standard(input_json, solc_version):
+        calls.append(sorted(input_json["sources"]))
+        return {
+            "contracts": {
+                name: {name: {"abi": [name], "evm": {"bytecode": {"object": name}}}}
+                for name in input_json["sources"]
+            }
+        }
+
+    monkeypatch.setattr(compiler, "compile_standard", fake_compile_standard)
+    cache = CompilationCache(path=str(tmp_path))
+
+    CompilerSolidity("A", "code A", get_config(), cache).compile()
+    result = CompilerSolidity.compile_batch(
+        {"A": "code A", "B": "code B", "C": "code C"}, get_config(), cache
+    )
+
+    assert calls == [["A"], ["B", "C"]]
+    assert result == {"A": (["A"], "A"), "B": (["B"], "B"), "C": (["C"], "C")}
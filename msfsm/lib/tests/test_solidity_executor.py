@@ -0,0 +1,183 @@
+import pytest
+
+from eth_abi import encode
+from web3 import EthereumTesterProvider, Web3
+from web3.exceptions import ContractLogicError
+
+from msfsm.solidity import executor
+from msfsm.solidity.config import ConfigEthereum, EthereumPlatform
+
+ABI = [
+    {
+        "type": "function",
+        "name": "is_completed",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "transfer",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+    },
+    {"type": "event", "name": "Transfer", "inputs": [], "anonymous": False},
+]
+
+ADDRESS = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+
+
+def test_build_function_table():
+    functions = executor._build_function_table(ABI)
+
+    assert set(functions) == {"is_completed", "transfer"}
+    assert functions["transfer"] == {
+        "selector": "0xa9059cbb",
+        "input_types": ["address", "uint256"],
+        "output_types": ["bool"],
+        "output_arity": 1,
+        "state_mutability": "nonpayable",
+    }
+    assert functions["is_completed"]["state_mutability"] == "view"
+
+
+def test_get_contract_entry_is_cached():
+    w3 = Web3()
+
+    entry = executor.get_contract_entry(w3, ADDRESS, ABI)
+
+    assert executor.get_contract_entry(w3, ADDRESS, list(ABI)) is entry
+    assert executor.get_contract_entry(w3, ADDRESS, ABI[:1]) is not entry
+    assert executor.get_contract_entry(Web3(), ADDRESS, ABI) is not entry
+
+
+STATUS_ABI = [
+    {
+        "type": "function",
+        "name": name,
+        "inputs": [],
+        "outputs": [{"name": "", "type": output_type}],
+        "stateMutability": "view",
+    }
+    for name, output_type in (("get_current_state", "uint256"), ("is_completed", "bool"))
+]
+
+
+def _code_returning(data: bytes) -> bytes:
+    # CODECOPY the bytes following this 14 bytes prefix to memory and RETURN them
+    size = bytes.fromhex("61") + len(data).to_bytes(2, "big")
+    return size + bytes.fromhex("600e600039") + size + bytes.fromhex("6000f3") + data
+
+
+def _deploy_constant(w3, data: bytes) -> str:
+    # Contract whose code returns `data` for any call
+    init = _code_returning(_code_returning(data))
+    tx_hash = w3.eth.send_transaction({"from": w3.eth.accounts[0], "data": init})
+    return w3.eth.wait_for_transaction_receipt(tx_hash)["contractAddress"]
+
+
+@pytest.fixture
+def w3(monkeypatch):
+    w3 = Web3(EthereumTesterProvider())
+    provider = type("Provider", (), {"w3": w3})()
+    monkeypatch.setattr(executor, "get_provider", lambda platform: provider)
+    return w3
+
+
+def _config(multicall_address=None):
+    return ConfigEthereum(
+        target="ethereum",
+        platform=EthereumPlatform(
+            sol_version="0.8.0",
+            provider_url="http://localhost:8545",
+            chain_id=31337,
+            pub_key="0x0",
+            priv_key="0x0",
+            multicall_address=multicall_address,
+        ),
+    )
+
+
+def test_read_batch_without_multicall(w3):
+    address = _deploy_constant(w3, encode(["uint256"], [1]))
+
+    result = executor.ExecutorSolidity.read_batch(
+        {"Automata0": (address, STATUS_ABI)},
+        ["get_current_state", "is_completed", "missing"],
+        _config(),
+    )
+
+    assert result == {
+        "Automata0": {"get_current_state": 1, "is_completed": True, "missing": None}
+    }
+
+
+def test_read_batch_with_multicall(w3):
+    address = _deploy_constant(w3, b"")
+    multicall_address = _deploy_constant(
+        w3,
+        encode(
+            ["(bool,bytes)[]"],
+            [[(True, encode(["uint256"], [2])), (False, b"")]],
+        ),
+    )
+
+    result = executor.ExecutorSolidity.read_batch(
+        {"Automata0": (address, STATUS_ABI)},
+        ["get_current_state", "is_completed"],
+        _config(multicall_address),
+    )
+
+    assert result == {"Automata0": {"get_current_state": 2, "is_completed": None}}
+
+
+def test_read_batch_without_multicall_keeps_other_results_when_a_call_fails(w3):
+    address = _deploy_constant(w3, encode(["uint256"], [1]))
+    # Contract whose code reverts on any call
+    tx_hash = w3.eth.send_transaction(
+        {"from": w3.eth.accounts[0], "data": _code_returning(bytes.fromhex("60006000fd"))}
+    )
+    reverting_address = w3.eth.wait_for_transaction_receipt(tx_hash)["contractAddress"]
+
+    result = executor.ExecutorSolidity.read_batch(
+        {"Automata0": (address, STATUS_ABI), "Automata1": (reverting_address, STATUS_ABI)},
+        ["get_current_state", "is_completed"],
+        _config(),
+    )
+
+    assert result == {
+        "Automata0": {"get_current_state": 1, "is_completed": True},
+        "Automata1": {"get_current_state": None, "is_completed": None},
+    }
+
+
+def test_read_batch_falls_back_to_single_calls_when_the_batch_fails(w3, monkeypatch):
+    address = _deploy_constant(w3, encode(["uint256"], [1]))
+
+    class FailingBatch:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def add(self, request):
+            pass
+
+        def execute(self):
+            # A reverting call in the batch fails the whole batch
+            raise ContractLogicError("execution reverted")
+
+    monkeypatch.setattr(w3, "batch_requests", lambda: FailingBatch())
+
+    result = executor.ExecutorSolidity.read_batch(
+        {"Automata0": (address, STATUS_ABI)},
+        ["get_current_state", "is_completed"],
+        _config(),
+    )
+
+    assert result == {"Automata0": {"get_current_state": 1, "is_completed": True}}
@@ -0,0 +1,93 @@
+from msfsm.common.emitter import SourceOrigin
+from msfsm.solidity import generator
+from msfsm.solidity.config import ConfigEthereum, EthereumPlatform
+from msfsm.solidity.generation_cache import GenerationCache
+
+
+def get_generator(cache, sol_version="0.8.0", packages_path=None):
+    config = ConfigEthereum(
+        target="ethereum",
+        platform=EthereumPlatform(
+            sol_version=sol_version,
+            provider_url="http://localhost:8545",
+            chain_id=31337,
+            pub_key="0x0",
+            priv_key="0x0",
+        ),
+    )
+
+    return generator.GeneratorSolidity(
+        specification_path="./tests/data/dag.json",
+        packages_path=packages_path or ["./tests/data/p1.json", "./tests/data/p2.json"],
+        config=config,
+        generation_cache=cache,
+    )
+
+
+def test_memory_lru_eviction():
+    cache = GenerationCache(max_entries=2)
+    cache.set("a", "code a", [])
+    cache.set("b", "code b", [])
+    assert cache.get("a") == ("code a", [])
+    cache.set("c", "code c", [])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["entries"] == 2
+
+
+def test_disk_tier(tmp_path):
+    origin = SourceOrigin("transition", "a", 0)
+    GenerationCache(path=str(tmp_path)).set("k", "code", [(0, 4, origin)])
+
+    # A new cache, e.g. after a restart, reads the entry from disk
+    cache = GenerationCache(path=str(tmp_path))
+    assert cache.get("k") == ("code", [(0, 4, origin)])
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["disk_size"] == (tmp_path / "k.json").stat().st_size
+
+
+def test_disk_tier_eviction(tmp_path):
+    cache = GenerationCache(max_entries=0, path=str(tmp_path), max_disk_size=1)
+    cache.set("a", "code a", [])
+    cache.set("b", "code b", [])
+
+    assert cache.get("a") is None
+    assert cache.stats()["disk_size"] == 0
+
+
+def test_generate_reuses_cached_code(monkeypatch):
+    monkeypatch.setattr(generator, "install_solc", lambda version: None)
+    cache = GenerationCache()
+
+    first = get_generator(cache)
+    first.generate("Automata1")
+
+    second = get_generator(cache)
+    monkeypatch.setattr(second, "_set_functions", lambda name: None)
+    second.generate("Automata1")
+
+    assert second.result["Automata1"] == first.result["Automata1"]
+    assert second.emitters["Automata1"].source_map == first.emitters["Automata1"].source_map
+    assert cache.stats()["hits"] == 1
+
+
+def test_fingerprint_depends_on_inputs(monkeypatch, tmp_path):
+    monkeypatch.setattr(generator, "install_solc", lambda version: None)
+    cache = GenerationCache()
+
+    def key(solidity_generator, automaton_name="Automata0"):
+        return GenerationCache.make_key(solidity_generator.get_fingerprint(automaton_name))
+
+    reference = get_generator(cache)
+    assert key(reference) == key(get_generator(cache))
+    assert key(reference) != key(reference, "Automata2")
+    assert key(reference) != key(get_generator(cache, sol_version="0.8.1"))
+
+    # Changing the code of a package function used by Automata0
+    package = (tmp_path / "p1.json")
+    package.write_text(
+        open("./tests/data/p1.json").read().replace("return true;", "return false;")
+    )
+    changed = get_generator(cache, packages_path=[str(package), "./tests/data/p2.json"])
+    assert key(reference) != key(changed)
@@ -0,0 +1,222 @@
+import json
+
+import pytest
+import solcx
+
+from msfsm.solidity import generator
+from msfsm.solidity.cache import CompilationCache
+from msfsm.solidity.compiler import CompilerSolidity
+from msfsm.solidity.config import ConfigEthereum, EthereumPlatform
+from msfsm.solidity.generation_cache import GenerationCache
+
+
+@pytest.fixture
+def solidity_generator(monkeypatch):
+    monkeypatch.setattr(generator, "install_solc", lambda version: None)
+
+    config = ConfigEthereum(
+        target="ethereum",
+        platform=EthereumPlatform(
+            sol_version="0.8.0",
+            provider_url="http://localhost:8545",
+            chain_id=31337,
+            pub_key="0x0",
+            priv_key="0x0",
+        ),
+    )
+
+    return generator.GeneratorSolidity(
+        specification_path="./tests/data/dag.json",
+        packages_path=["./tests/data/p1.json", "./tests/data/p2.json"],
+        config=config,
+        generation_cache=GenerationCache(),
+    )
+
+
+def test_dependencies(solidity_generator):
+    assert solidity_generator.dependencies == {
+        "Automata0": [],
+        "Automata1": ["Automata0", "Automata2", "Automata3"],
+        "Automata2": ["Automata0"],
+        "Automata3": ["Automata2"],
+        "Automata4": ["Automata3"],
+    }
+
+
+def test_generate_with_address_placeholders(solidity_generator):
+    solidity_generator.generate("Automata2")
+    code = solidity_generator.result["Automata2"]
+
+    assert "address private immutable automata__Automata0__address;" in code
+    assert "constructor(address _automata__Automata0__address)" in code
+    assert "automata__Automata0__address.delegatecall(" in code
+
+
+def test_generate_without_dependencies(solidity_generator):
+    solidity_generator.generate("Automata0")
+
+    assert "constructor(" not in solidity_generator.result["Automata0"]
+
+
+def test_deploy_reports_progress(solidity_generator, monkeypatch):
+    monkeypatch.setattr(
+        generator.CompilerSolidity,
+        "compile_batch",
+        staticmethod(lambda contracts, config: {n: ([], "00") for n in contracts}),
+    )
+
+    def send(self):
+        self.address = "0x" + str(len(self.constructor_args)).zfill(40)
+        return self.address
+
+    monkeypatch.setattr(generator.DeployerSolidity, "send", send)
+    monkeypatch.setattr(generator.DeployerSolidity, "wait", lambda self: self.address)
+
+    events = []
+    solidity_generator.deploy(progress_callback=lambda n, s: events.append((n, s)))
+
+    for automaton_name in solidity_generator.keys.values():
+        stages = [s for n, s in events if n == automaton_name]
+        assert stages == ["generated", "compiled", "sent", "mined"]
+
+    sent = [n for n, s in events if s == "sent"]
+    assert sent.index("Automata0") < sent.index("Automata2") < sent.index("Automata3")
+    assert solidity_generator.deployed_smart_contract_info["Automata1"]["address"]
+
+
+def test_generate_source_map(solidity_generator):
+    solidity_generator.generate("Automata1")
+    code = solidity_generator.result["Automata1"]
+    emitter = solidity_generator.emitters["Automata1"]
+
+    function = code.index("function package__p1__c2()")
+    assert emitter.origin_at(function) == ("package_function", "p1", "c2")
+
+    # The third transition of Automata1 has the trigger d
+    assert emitter.origin_at(code.index("if (package__p1__c1() && package__p1__c2()")) == ("transition", "d", 2)
+    assert emitter.origin_at(code.index("function d()")) == ("trigger", "d", None)
+    assert emitter.source_map[-1][1] == len(code)
+
+
+def test_compile_error_origins(solidity_generator):
+    solidity_generator.generate("Automata1")
+    code = solidity_generator.result["Automata1"]
+    start = code.index("function package__p1__c1()")
+
+    error = generator.SolcError(
+        "compilation failed",
+        error_dict=[
+            {
+                "severity": "error",
+                "message": "Undeclared identifier.",
+                "sourceLocation": {"file": "Automata1", "start": start, "end": start + 1},
+            },
+            {"severity": "warning", "message": "Unused variable."},
+        ],
+    )
+
+    assert solidity_generator.get_compile_error_origins(error) == [
+        ("Undeclared identifier.", ("package_function", "p1", "c1"))
+    ]
+
+
+def test_compile_error_origins_use_byte_offsets(solidity_generator, tmp_path):
+    with open("./tests/data/p1.json") as f:
+        package = json.load(f)
+    # solc counts the bytes of the UTF-8 encoded source, not its characters
+    package["functions"]["c1"]["code"] += " // " + "é" * 200
+    package_path = tmp_path / "p1.json"
+    package_path.write_text(json.dumps(package))
+
+    solidity_generator = generator.GeneratorSolidity(
+        specification_path="./tests/data/dag.json",
+        packages_path=[str(package_path), "./tests/data/p2.json"],
+        config=solidity_generator.config,
+        generation_cache=GenerationCache(),
+    )
+    solidity_generator.generate("Automata1")
+    code = solidity_generator.result["Automata1"]
+    start = code.encode("utf-8").index(b"function package__p1__c2()")
+
+    error = generator.SolcError(
+        "compilation failed",
+        error_dict=[
+            {
+                "severity": "error",
+                "message": "Undeclared identifier.",
+                "sourceLocation": {"file": "Automata1", "start": start, "end": start + 1},
+            },
+        ],
+    )
+
+    assert solidity_generator.get_compile_error_origins(error) == [
+        ("Undeclared identifier.", ("package_function", "p1", "c2"))
+    ]
+
+
+def get_generator_with_uint_condition(solidity_generator, tmp_path):
+    """Generator whose package condition p1.c1 returns a uint, which does not compile."""
+    with open("./tests/data/p1.json") as f:
+        package = json.load(f)
+    package["functions"]["c1"]["code"] = "function package__p1__c1() public pure returns (uint) { return 1; }"
+    package_path = tmp_path / "p1.json"
+    package_path.write_text(json.dumps(package))
+
+    return generator.GeneratorSolidity(
+        specification_path="./tests/data/dag.json",
+        packages_path=[str(package_path), "./tests/data/p2.json"],
+        config=solidity_generator.config,
+        generation_cache=GenerationCache(),
+    )
+
+
+def test_compile_error_origins_of_a_transition(solidity_generator, tmp_path):
+    solidity_generator = get_generator_with_uint_condition(solidity_generator, tmp_path)
+    solidity_generator.generate("Automata0")
+    code = solidity_generator.result["Automata0"]
+
+    # Error reported by solc 0.8.0 for the condition of the first transition of Automata0.
+    # The generated code is a single line, the column is the byte offset plus one
+    start = code.encode("utf-8").index(b"package__p1__c1() && currentState")
+    end = code.encode("utf-8").index(b") {", start)
+    error = generator.SolcError(
+        "compilation failed",
+        error_dict=[
+            {
+                "component": "general",
+                "errorCode": "2271",
+                "formattedMessage": (
+                    "TypeError: Operator && not compatible with types uint256 and bool.\n"
+                    f" --> Automata0:1:{start + 1}:\n"
+                ),
+                "message": "Operator && not compatible with types uint256 and bool.",
+                "severity": "error",
+                "sourceLocation": {"end": end, "file": "Automata0", "start": start},
+                "type": "TypeError",
+            },
+        ],
+    )
+
+    [(message, origin)] = solidity_generator.get_compile_error_origins(error)
+    assert message == "Operator && not compatible with types uint256 and bool."
+    assert origin == ("transition", "a", 0)
+    assert origin.describe() == "transition a #0"
+
+
+@pytest.mark.skipif(
+    "0.8.0" not in [str(v) for v in solcx.get_installed_solc_versions()],
+    reason="solc 0.8.0 is not installed",
+)
+def test_compile_error_origins_from_solc(solidity_generator, tmp_path):
+    solidity_generator = get_generator_with_uint_condition(solidity_generator, tmp_path)
+    solidity_generator.generate("Automata0")
+
+    with pytest.raises(generator.SolcError) as e:
+        CompilerSolidity.compile_batch(
+            dict(solidity_generator.result),
+            solidity_generator.config,
+            cache=CompilationCache(path=str(tmp_path / "cache")),
+        )
+
+    origins = solidity_generator.get_compile_error_origins(e.value)
+    assert ("transition", "a", 0) in [origin for _, origin in origins]
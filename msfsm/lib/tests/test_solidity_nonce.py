@@ -0,0 +1,93 @@
+import threading
+
+from msfsm.solidity.deployer import get_contract_address
+from msfsm.solidity.nonce import NonceManager
+
+
+class FakeEth:
+    def __init__(self, transaction_count):
+        self.transaction_count = transaction_count
+        self.calls = 0
+
+    def get_transaction_count(self, address, block_identifier):
+        self.calls += 1
+        return self.transaction_count
+
+
+class FakeWeb3:
+    def __init__(self, transaction_count):
+        self.eth = FakeEth(transaction_count)
+
+
+def test_next_nonce_is_consecutive_and_queries_node_once():
+    w3 = FakeWeb3(5)
+    manager = NonceManager("0x0")
+
+    assert [manager.next_nonce(w3) for _ in range(3)] == [5, 6, 7]
+    assert w3.eth.calls == 1
+
+
+def test_next_nonce_is_unique_across_threads():
+    w3 = FakeWeb3(0)
+    manager = NonceManager("0x0")
+    nonces = []
+
+    threads = [
+        threading.Thread(target=lambda: nonces.append(manager.next_nonce(w3)))
+        for _ in range(50)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(nonces) == list(range(50))
+
+
+def test_reset_resynchronizes_with_node():
+    w3 = FakeWeb3(3)
+    manager = NonceManager("0x0")
+    manager.next_nonce(w3)
+
+    manager.reset()
+    w3.eth.transaction_count = 10
+
+    assert manager.next_nonce(w3) == 10
+
+
+def test_release_reuses_nonce_while_others_are_reserved():
+    w3 = FakeWeb3(0)
+    manager = NonceManager("0x0")
+    first, second = manager.next_nonce(w3), manager.next_nonce(w3)
+
+    # The first send fails while the second one is still being sent
+    manager.release(first)
+    w3.eth.transaction_count = 0
+
+    assert manager.next_nonce(w3) == first
+    manager.confirm(second)
+    assert manager.next_nonce(w3) == 2
+    assert w3.eth.calls == 1
+
+
+def test_release_resynchronizes_once_nothing_is_reserved():
+    w3 = FakeWeb3(3)
+    manager = NonceManager("0x0")
+    nonce = manager.next_nonce(w3)
+
+    manager.release(nonce)
+    w3.eth.transaction_count = 7
+
+    assert manager.next_nonce(w3) == 7
+
+
+def test_get_contract_address_with_nonce():
+    address = get_contract_address("0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0", 1)
+
+    assert address.lower() == "0x343c43a37d37dff08ae8c4a11544c718abb4fcf8"
+
+
+def test_get_contract_address():
+    address = get_contract_address("0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0", 0)
+
+    assert address.lower() == "0xcd234a471b72ba2f1ccf0a70fcaba648a5eecd8d"
@@ -0,0 +1,54 @@
+import pytest
+
+from msfsm.solidity import provider as provider_module
+from msfsm.solidity.config import EthereumPlatform
+
+
+@pytest.fixture
+def platform():
+    provider_module.close_providers()
+    yield EthereumPlatform(
+        sol_version="0.8.0",
+        provider_url="http://localhost:8545",
+        chain_id=31337,
+        pub_key="0x0",
+        priv_key="0x0",
+    )
+    provider_module.close_providers()
+
+
+def test_get_provider_is_shared(platform):
+    platform.pool_size = 4
+    provider = provider_module.get_provider(platform)
+
+    assert provider_module.get_provider(platform.model_copy()) is provider
+    assert provider.w3.provider._request_session_manager._explicit_session is provider.session
+    assert provider.session.get_adapter("http://localhost:8545")._pool_maxsize == 4
+
+
+def test_get_provider_uses_requested_pool_size(platform):
+    default_provider = provider_module.get_provider(platform)
+    provider = provider_module.get_provider(platform, pool_size=4)
+
+    assert provider is not default_provider
+    assert provider.session.get_adapter("http://localhost:8545")._pool_maxsize == 4
+
+
+def test_metadata_is_cached_until_ttl(platform, monkeypatch):
+    provider = provider_module.get_provider(platform, metadata_ttl=60)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return 42
+
+    now = [100.0]
+    monkeypatch.setattr(provider_module.time, "monotonic", lambda: now[0])
+
+    assert provider._get_metadata("gas_price", fetch) == 42
+    assert provider._get_metadata("gas_price", fetch) == 42
+    assert len(calls) == 1
+
+    now[0] += 61
+    provider._get_metadata("gas_price", fetch)
+    assert len(calls) == 2